@@ -1,23 +1,38 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, send_file, session, abort, jsonify
+from flask import Flask, render_template, request, redirect, url_for, flash, send_file, session, abort, jsonify, make_response
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 from functools import wraps
 import math
 import logging
 import csv
 import io
 import difflib
+import hashlib
+from collections import defaultdict, Counter, OrderedDict, deque
+from itertools import chain, accumulate, islice
+from bisect import bisect_right
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import multiprocessing
 from io import TextIOWrapper
 from flask_login import UserMixin, LoginManager, login_user, logout_user, current_user, login_required
 from werkzeug.security import check_password_hash, generate_password_hash
 from sqlalchemy import event
+from sqlalchemy.orm import Session as SQLAlchemySession, aliased
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql import func
+from time import perf_counter, sleep
+import numpy as np
+from scipy import sparse
 import json
 import os
 
 
 # Import the Config class from config.py
 from config import Config
+from glicko2 import Glicko2
 
 app = Flask(__name__)
 app.config.from_object(Config)  # Load configurations from Config
@@ -432,6 +447,9 @@ class Wrestler(db.Model):
     season_start_elo = db.Column(db.Float, nullable=False, default=1500)
     rpi = db.Column(db.Float, default=0)
     dominance_score = db.Column(db.Float, nullable=False, default=0.0)
+    glicko_rating = db.Column(db.Float, nullable=False, default=1500)  # Glicko-2 rating
+    glicko_rd = db.Column(db.Float, nullable=False, default=350)  # Glicko-2 rating deviation
+    glicko_vol = db.Column(db.Float, nullable=False, default=0.06)  # Glicko-2 volatility
     season_id = db.Column(db.Integer, db.ForeignKey('season.id'), nullable=False)
     graduating = db.Column(db.Boolean, default=False)  # Field for graduating status
     year_in_school = db.Column(db.String(20), nullable=True, default='Freshman')  # Field for year in school
@@ -453,24 +471,6 @@ class Wrestler(db.Model):
             return (0.5 * self.elo_rating) + (0.5 * self.rpi)
         return None
 
-    def calculate_dominance_score(self):
-        matches = self.matches_as_wrestler1.all() + self.matches_as_wrestler2.all()
-        total_score = 0
-        match_count = len(matches)
-
-        for match in matches:
-            if match.winner_id == self.id:
-                if match.win_type == 'Fall':
-                    total_score += 6
-                elif match.win_type == 'Technical Fall':
-                    total_score += 5
-                elif match.win_type == 'Major Decision':
-                    total_score += 4
-                elif match.win_type == 'Decision':
-                    total_score += 3
-
-        self.dominance_score = round(total_score / match_count, 2) if match_count > 0 else 0
-
     def to_dict(self):
         return {
             'id': self.id,
@@ -487,6 +487,8 @@ class Wrestler(db.Model):
             'tech_falls': self.tech_falls,
             'major_decisions': self.major_decisions,
             'dominance_score': self.dominance_score,
+            'glicko_rating': self.glicko_rating,
+            'glicko_rd': self.glicko_rd,
             'season_id': self.season_id,
             'graduating': self.graduating,  # Include graduating status
             'year_in_school': self.year_in_school  # Include year in school
@@ -525,6 +527,19 @@ class Wrestler(db.Model):
 
 
 
+def match_fingerprint(season_id, wrestler1, wrestler2, date, wrestler1_score, wrestler2_score, winner, win_type):
+    """
+    SHA-1 of a match's natural key: season, the unordered pair of (wrestler, score), the match
+    date, the winner and the win type. Wrestlers are usually IDs; any sortable handle works for
+    comparing rows in memory.
+    """
+    if isinstance(date, datetime):
+        date = date.date()
+    (first, first_score), (second, second_score) = sorted([(wrestler1, wrestler1_score), (wrestler2, wrestler2_score)])
+    key = f"{season_id}|{first}:{first_score}|{second}:{second_score}|{date.isoformat()}|{winner}|{win_type}"
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
 class Match(db.Model):
     __tablename__ = 'match'
 
@@ -565,6 +580,9 @@ class Match(db.Model):
     tiebreaker_1 = db.Column(db.Boolean, default=False)  # Field for Tiebreaker 1 win
     tiebreaker_2 = db.Column(db.Boolean, default=False)  # Field for Tiebreaker 2 win
 
+    # match_fingerprint() of the result, so duplicates are found with one indexed lookup
+    fingerprint = db.Column(db.String(40), unique=True, index=True, nullable=True)
+
     def calculate_win_type(self):
         # Recognize variations of 'Sudden Victory', 'Double Overtime', 'Tiebreaker' etc.
         if self.fall:
@@ -610,6 +628,11 @@ class Match(db.Model):
         self.medical_forfeit = self.win_type == 'Medical Forfeit'
         self.disqualification = self.win_type == 'Disqualification'
 
+    def calculate_fingerprint(self):
+        self.fingerprint = match_fingerprint(self.season_id, self.wrestler1_id, self.wrestler2_id, self.date,
+                                             self.wrestler1_score, self.wrestler2_score, self.winner_id, self.win_type)
+        return self.fingerprint
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -644,6 +667,62 @@ class Match(db.Model):
 @event.listens_for(Match, 'before_insert')
 def before_insert_listener(mapper, connection, target):
     target.calculate_win_type()
+    target.calculate_fingerprint()
+
+
+# Columns that feed a match's fingerprint, directly or through calculate_win_type
+FINGERPRINT_COLUMNS = ['season_id', 'wrestler1_id', 'wrestler2_id', 'date', 'wrestler1_score', 'wrestler2_score',
+                       'winner_id', 'win_type', 'fall', 'technical_fall', 'major_decision', 'decision', 'injury_default',
+                       'sudden_victory', 'double_overtime', 'tiebreaker_1', 'tiebreaker_2', 'medical_forfeit',
+                       'disqualification']
+
+
+@event.listens_for(Match, 'before_update')
+def before_update_listener(mapper, connection, target):
+    state = db.inspect(target)
+    if not any(state.attrs[column].history.has_changes() for column in FINGERPRINT_COLUMNS):
+        return
+    # Legacy rows without scores keep their stored win type
+    if target.wrestler1_score is not None and target.wrestler2_score is not None:
+        target.calculate_win_type()
+    fingerprint = match_fingerprint(target.season_id, target.wrestler1_id, target.wrestler2_id, target.date,
+                                    target.wrestler1_score, target.wrestler2_score, target.winner_id, target.win_type)
+    if fingerprint == target.fingerprint:
+        return
+    # Another match already has this result (e.g. a copy the backfill left NULL): stay NULL like it
+    table = Match.__table__
+    taken = connection.execute(
+        db.select(table.c.id).where(table.c.fingerprint == fingerprint, table.c.id != target.id)
+    ).first()
+    target.fingerprint = None if taken else fingerprint
+
+
+def backfill_match_fingerprints(season_ids):
+    """
+    Sets the fingerprint of matches in `season_ids` stored before the column existed, with one
+    bulk UPDATE. Copies of an already fingerprinted result keep NULL so the unique index holds.
+    """
+    rows = db.session.execute(
+        db.select(Match.id, Match.season_id, Match.wrestler1_id, Match.wrestler2_id, Match.date,
+                  Match.wrestler1_score, Match.wrestler2_score, Match.winner_id, Match.win_type)
+        .where(Match.season_id.in_(season_ids), Match.fingerprint.is_(None))
+        .order_by(Match.id)
+    ).all()
+    if not rows:
+        return 0
+
+    fingerprints = {}
+    for match_id, *natural_key in rows:
+        fingerprints.setdefault(match_fingerprint(*natural_key), match_id)
+    taken = set(db.session.scalars(db.select(Match.fingerprint).where(Match.fingerprint.in_(list(fingerprints)))))
+    updates = [{'id': match_id, 'fingerprint': fingerprint}
+               for fingerprint, match_id in fingerprints.items() if fingerprint not in taken]
+    if updates:
+        db.session.execute(db.update(Match), updates)
+        db.session.commit()
+    if len(updates) < len(rows):
+        logger.info(f"Left {len(rows) - len(updates)} duplicate matches without a fingerprint")
+    return len(updates)
 
 
 class User(UserMixin, db.Model):
@@ -671,6 +750,26 @@ class CSVUploadReport(db.Model):
     detailed_feedback = db.Column(db.JSON, nullable=False)  # Store detailed feedback as JSON
     match_ids = db.Column(db.JSON, nullable=False)  # Store added match IDs as a JSON array for reversion
     is_reverted = db.Column(db.Boolean, nullable=False, default=False)  # Track if the report has been reverted
+    stage_timings = db.Column(db.JSON, nullable=True)  # Seconds spent in each import stage
+    file_hash = db.Column(db.String(64), index=True, nullable=True)  # SHA-256 of the uploaded file, to catch re-uploads
+    streamed = db.Column(db.Boolean, nullable=False, default=False)  # Feedback lives in csv_upload_feedback, not detailed_feedback
+    wrestler_ids = db.Column(db.JSON, nullable=True)  # Wrestlers the upload created, removed on revert if left without matches
+
+    def feedback_messages(self, limit=None):
+        """Returns the report's feedback in row order, at most `limit` messages."""
+        if self.streamed:
+            query = (db.select(CSVUploadFeedback.message)
+                     .where(CSVUploadFeedback.report_id == self.id)
+                     .order_by(CSVUploadFeedback.row_num)
+                     .limit(limit))
+            return db.session.scalars(query).all()
+        feedback = self.detailed_feedback
+        if isinstance(feedback, str):
+            try:
+                feedback = json.loads(feedback)
+            except json.JSONDecodeError:
+                feedback = []
+        return (feedback or [])[:limit]
 
     def to_dict(self):
         # Convert the detailed_feedback and match_ids to appropriate formats if necessary
@@ -686,9 +785,696 @@ class CSVUploadReport(db.Model):
             'row_errors': self.row_errors,
             'detailed_feedback': feedback,
             'match_ids': match_ids,
-            'is_reverted': self.is_reverted
+            'is_reverted': self.is_reverted,
+            'stage_timings': self.stage_timings or {}
         }
 
+class CSVUploadFeedback(db.Model):
+    """One row's outcome from a streamed CSV upload, written as each chunk commits."""
+    __tablename__ = 'csv_upload_feedback'
+
+    id = db.Column(db.Integer, primary_key=True)
+    report_id = db.Column(db.Integer, db.ForeignKey('csv_upload_report.id'), nullable=False, index=True)
+    row_num = db.Column(db.Integer, nullable=False)
+    message = db.Column(db.Text, nullable=False)
+    match_id = db.Column(db.Integer, nullable=True)  # Match added by this row, for reversion
+
+
+class ImportJob(db.Model):
+    """
+    A CSV upload waiting for or being processed by the worker's import pool.
+    Progress columns are updated as the import advances; the uploader polls them.
+    A dry run job writes no matches and keeps its preview on the job instead of a report.
+    """
+    __tablename__ = 'import_job'
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True)
+    filename = db.Column(db.String(255), nullable=False)
+    file_path = db.Column(db.String(500), nullable=False)  # Saved upload, removed once processed
+    status = db.Column(db.String(20), nullable=False, default='queued')  # queued, running, done or failed
+    stage = db.Column(db.String(20), nullable=True)  # Current validate_and_process_csv stage
+    rows_processed = db.Column(db.Integer, nullable=False, default=0)
+    row_errors = db.Column(db.Integer, nullable=False, default=0)
+    message = db.Column(db.Text, nullable=True)  # Outcome shown to the uploader
+    message_category = db.Column(db.String(20), nullable=True)
+    report_id = db.Column(db.Integer, db.ForeignKey('csv_upload_report.id'), nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    heartbeat_at = db.Column(db.DateTime, nullable=True)  # Refreshed by the worker process running the job
+    dry_run = db.Column(db.Boolean, nullable=False, default=False)
+    preview = db.Column(db.Text, nullable=True)  # JSON dry run preview, feedback cut to CSV_FEEDBACK_PREVIEW rows
+
+    def to_dict(self):
+        elapsed = None
+        if self.started_at:
+            elapsed = ((self.finished_at or datetime.utcnow()) - self.started_at).total_seconds()
+        return {
+            'id': self.id,
+            'filename': self.filename,
+            'status': self.status,
+            'stage': self.stage,
+            'rows_processed': self.rows_processed,
+            'row_errors': self.row_errors,
+            'rows_per_second': round(self.rows_processed / elapsed, 1) if elapsed else None,
+            'message': self.message,
+            'message_category': self.message_category,
+            'report_id': self.report_id,
+            'dry_run': self.dry_run,
+            'preview': json.loads(self.preview) if self.preview else None,
+            'created_at': self.created_at.strftime('%Y-%m-%d %H:%M:%S'),
+            'finished_at': self.finished_at.strftime('%Y-%m-%d %H:%M:%S') if self.finished_at else None
+        }
+
+class EloCheckpoint(db.Model):
+    """
+    Elo ratings of every wrestler in a weight class at the end of a match date.
+    Lets an edit on date D replay only the matches on or after D.
+    """
+    __tablename__ = 'elo_checkpoint'
+
+    id = db.Column(db.Integer, primary_key=True)
+    season_id = db.Column(db.Integer, db.ForeignKey('season.id'), nullable=False)
+    weight_class = db.Column(db.Integer, nullable=False)
+    as_of_date = db.Column(db.Date, nullable=False)
+    ratings = db.Column(db.JSON, nullable=False)  # {wrestler_id: elo_rating}
+
+    __table_args__ = (
+        db.UniqueConstraint('season_id', 'weight_class', 'as_of_date', name='uq_elo_checkpoint_date'),
+    )
+
+class RatingHistory(db.Model):
+    """
+    A wrestler's Elo rating right after one of their matches, written by the season replay.
+    Ordered by (match_date, match_id), which is the replay order.
+    """
+    __tablename__ = 'rating_history'
+
+    id = db.Column(db.Integer, primary_key=True)
+    season_id = db.Column(db.Integer, db.ForeignKey('season.id'), nullable=False)
+    weight_class = db.Column(db.Integer, nullable=False)
+    wrestler_id = db.Column(db.Integer, db.ForeignKey('wrestler.id', ondelete='CASCADE'), nullable=False)
+    match_id = db.Column(db.Integer, db.ForeignKey('match.id', ondelete='CASCADE'), nullable=False)
+    match_date = db.Column(db.DateTime, nullable=False)
+    elo_rating = db.Column(db.Float, nullable=False)
+
+    __table_args__ = (
+        db.Index('ix_rating_history_wrestler_date', 'wrestler_id', 'match_date', 'match_id'),
+        db.Index('ix_rating_history_class_date', 'season_id', 'weight_class', 'match_date'),
+        db.Index('ix_rating_history_match', 'match_id'),
+    )
+
+    def to_dict(self):
+        return {
+            'match_id': self.match_id,
+            'date': self.match_date.strftime('%Y-%m-%d'),
+            'elo_rating': self.elo_rating
+        }
+
+class GlickoPeriod(db.Model):
+    """
+    Glicko-2 state of every wrestler in a season at the end of one weekly rating period.
+    Periods are numbered in weeks from Season.start_date.
+    """
+    __tablename__ = 'glicko_period'
+
+    id = db.Column(db.Integer, primary_key=True)
+    season_id = db.Column(db.Integer, db.ForeignKey('season.id'), nullable=False)
+    period_index = db.Column(db.Integer, nullable=False)
+    period_start = db.Column(db.Date, nullable=False)
+    match_count = db.Column(db.Integer, nullable=False, default=0)
+    ratings = db.Column(db.JSON, nullable=False)  # {wrestler_id: [rating, rd, volatility]}
+
+    __table_args__ = (
+        db.UniqueConstraint('season_id', 'period_index', name='uq_glicko_period_index'),
+    )
+
+class WrestlerSeasonStats(db.Model):
+    """
+    Materialized record of one wrestler in one season.
+    Kept current by the Match insert/update/delete listeners below, so read routes
+    never aggregate matches; rebuild_wrestler_season_stats recomputes it from scratch.
+    """
+    __tablename__ = 'wrestler_season_stats'
+
+    id = db.Column(db.Integer, primary_key=True)
+    wrestler_id = db.Column(db.Integer, db.ForeignKey('wrestler.id', ondelete='CASCADE'), nullable=False)
+    season_id = db.Column(db.Integer, db.ForeignKey('season.id'), nullable=False)
+    wins = db.Column(db.Integer, nullable=False, default=0)
+    losses = db.Column(db.Integer, nullable=False, default=0)
+    match_count = db.Column(db.Integer, nullable=False, default=0)
+    falls = db.Column(db.Integer, nullable=False, default=0)
+    tech_falls = db.Column(db.Integer, nullable=False, default=0)
+    major_decisions = db.Column(db.Integer, nullable=False, default=0)
+    decisions = db.Column(db.Integer, nullable=False, default=0)
+    dominance_points = db.Column(db.Integer, nullable=False, default=0)
+    last_match_date = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        db.UniqueConstraint('wrestler_id', 'season_id', name='uq_wrestler_season_stats'),
+        db.Index('ix_wrestler_season_stats_season', 'season_id'),
+    )
+
+    @property
+    def dominance_score(self):
+        if self.match_count < MIN_MATCHES:
+            return 0
+        return round(self.dominance_points / self.match_count, 2)
+
+    def to_dict(self):
+        return {
+            'wrestler_id': self.wrestler_id,
+            'season_id': self.season_id,
+            'wins': self.wins,
+            'losses': self.losses,
+            'match_count': self.match_count,
+            'falls': self.falls,
+            'tech_falls': self.tech_falls,
+            'major_decisions': self.major_decisions,
+            'decisions': self.decisions,
+            'dominance_points': self.dominance_points,
+            'last_match_date': self.last_match_date.strftime('%Y-%m-%d') if self.last_match_date else None
+        }
+
+class WrestlerRank(db.Model):
+    """
+    A wrestler's position within their season and weight class by Elo, RPI, hybrid and
+    dominance. Rewritten by refresh_rank_index whenever those ratings change, so a profile
+    view reads one row instead of sorting the class.
+    """
+    __tablename__ = 'wrestler_rank'
+
+    wrestler_id = db.Column(db.Integer, db.ForeignKey('wrestler.id', ondelete='CASCADE'), primary_key=True)
+    season_id = db.Column(db.Integer, db.ForeignKey('season.id'), nullable=False)
+    weight_class = db.Column(db.Integer, nullable=False)
+    elo_rank = db.Column(db.Integer, nullable=False)
+    rpi_rank = db.Column(db.Integer, nullable=False)
+    hybrid_rank = db.Column(db.Integer, nullable=False)
+    dominance_rank = db.Column(db.Integer, nullable=False)
+
+    __table_args__ = (
+        db.Index('ix_wrestler_rank_season_class', 'season_id', 'weight_class'),
+    )
+
+class DataVersion(db.Model):
+    """
+    Change counter behind the response cache: one row per season ('season:<id>') plus 'all'.
+    Bumped after every commit that changed a season's data.
+    """
+    __tablename__ = 'data_version'
+
+    scope = db.Column(db.String(32), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+# Win types with their own WrestlerSeasonStats column
+STATS_WIN_TYPE_COLUMNS = {
+    'Fall': 'falls',
+    'Technical Fall': 'tech_falls',
+    'Major Decision': 'major_decisions',
+    'Decision': 'decisions',
+}
+
+STATS_COUNTER_COLUMNS = ['wins', 'losses', 'match_count', *STATS_WIN_TYPE_COLUMNS.values(), 'dominance_points']
+
+
+def rebuild_wrestler_season_stats(season_id, wrestler_ids=None, connection=None):
+    """
+    Recomputes WrestlerSeasonStats rows for a season (or only `wrestler_ids`) with one
+    DELETE and one INSERT ... SELECT grouped by wrestler. Used to backfill existing data,
+    after bulk deletes that bypass the ORM events, and by the listeners for missing rows.
+    """
+    table = WrestlerSeasonStats.__table__
+    sides = db.union_all(
+        db.select(Match.wrestler1_id.label('wrestler_id'), Match.winner_id, Match.win_type, Match.date)
+        .where(Match.season_id == season_id),
+        db.select(Match.wrestler2_id.label('wrestler_id'), Match.winner_id, Match.win_type, Match.date)
+        .where(Match.season_id == season_id)
+    ).subquery()
+    won = sides.c.winner_id == sides.c.wrestler_id
+
+    def won_count(condition):
+        return func.sum(db.case((condition, 1), else_=0))
+
+    aggregate = db.select(
+        sides.c.wrestler_id,
+        db.literal(season_id),
+        won_count(won),
+        won_count(~won),
+        func.count(),
+        *(won_count(db.and_(won, sides.c.win_type == win_type)) for win_type in STATS_WIN_TYPE_COLUMNS),
+        func.sum(db.case((won, db.case(DOMINANCE_POINTS, value=sides.c.win_type, else_=0)), else_=0)),
+        func.max(sides.c.date)
+    ).group_by(sides.c.wrestler_id)
+
+    delete = db.delete(table).where(table.c.season_id == season_id)
+    if wrestler_ids is not None:
+        wrestler_ids = list(wrestler_ids)
+        aggregate = aggregate.where(sides.c.wrestler_id.in_(wrestler_ids))
+        delete = delete.where(table.c.wrestler_id.in_(wrestler_ids))
+
+    insert = db.insert(table).from_select(
+        ['wrestler_id', 'season_id', *STATS_COUNTER_COLUMNS, 'last_match_date'], aggregate
+    )
+    if connection is not None:
+        connection.execute(delete)
+        connection.execute(insert)
+        return
+
+    try:
+        db.session.execute(delete)
+        db.session.execute(insert)
+        mark_season_changed(season_id)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error rebuilding wrestler stats for season {season_id}: {str(e)}")
+        raise
+
+
+def _match_stat_deltas(deltas, season_id, wrestler1_id, wrestler2_id, winner_id, win_type, sign):
+    # Accumulates one result's counter deltas into {(season_id, wrestler_id): {column: delta}}
+    for wrestler_id in {wrestler1_id, wrestler2_id}:
+        delta = deltas.setdefault((season_id, wrestler_id), dict.fromkeys(STATS_COUNTER_COLUMNS, 0))
+        delta['match_count'] += sign
+        if wrestler_id == winner_id:
+            delta['wins'] += sign
+            delta['dominance_points'] += sign * DOMINANCE_POINTS.get(win_type, 0)
+            if win_type in STATS_WIN_TYPE_COLUMNS:
+                delta[STATS_WIN_TYPE_COLUMNS[win_type]] += sign
+        else:
+            delta['losses'] += sign
+
+
+def _pending_stat_deltas(target):
+    # Deltas are collected per flush and written once the whole flush has reached the database
+    return db.inspect(target).session.info.setdefault('match_stat_deltas', {})
+
+
+@event.listens_for(Match, 'after_insert')
+def match_stats_after_insert(mapper, connection, target):
+    _match_stat_deltas(_pending_stat_deltas(target), target.season_id, target.wrestler1_id, target.wrestler2_id,
+                       target.winner_id, target.win_type, 1)
+
+
+@event.listens_for(Match, 'after_update')
+def match_stats_after_update(mapper, connection, target):
+    state = db.inspect(target)
+    fields = ['season_id', 'wrestler1_id', 'wrestler2_id', 'winner_id', 'win_type', 'date']
+    if not any(state.attrs[field].history.has_changes() for field in fields):
+        return
+
+    def previous(field):
+        history = state.attrs[field].history
+        return history.deleted[0] if history.deleted else getattr(target, field)
+
+    deltas = _pending_stat_deltas(target)
+    _match_stat_deltas(deltas, previous('season_id'), previous('wrestler1_id'), previous('wrestler2_id'),
+                       previous('winner_id'), previous('win_type'), -1)
+    _match_stat_deltas(deltas, target.season_id, target.wrestler1_id, target.wrestler2_id,
+                       target.winner_id, target.win_type, 1)
+
+
+@event.listens_for(Match, 'after_delete')
+def match_stats_after_delete(mapper, connection, target):
+    _match_stat_deltas(_pending_stat_deltas(target), target.season_id, target.wrestler1_id, target.wrestler2_id,
+                       target.winner_id, target.win_type, -1)
+
+
+@event.listens_for(SQLAlchemySession, 'after_flush')
+def apply_match_stat_deltas(session, flush_context):
+    """
+    Applies the flush's counter deltas as atomic `column = column + delta` UPDATEs and
+    re-reads last_match_date from the wrestler's matches. A wrestler without a stats row
+    yet (first match, or data from before the table existed) is rebuilt from its matches,
+    which already include this flush.
+    """
+    deltas = session.info.pop('match_stat_deltas', None)
+    if not deltas:
+        return
+
+    connection = session.connection()
+    table = WrestlerSeasonStats.__table__
+    for (season_id, wrestler_id), delta in deltas.items():
+        values = {column: table.c[column] + change for column, change in delta.items() if change}
+        values['last_match_date'] = db.select(func.max(Match.date)).where(
+            Match.season_id == season_id,
+            db.or_(Match.wrestler1_id == wrestler_id, Match.wrestler2_id == wrestler_id)
+        ).scalar_subquery()
+
+        result = connection.execute(
+            db.update(table)
+            .where(table.c.season_id == season_id, table.c.wrestler_id == wrestler_id)
+            .values(**values)
+        )
+        if result.rowcount == 0:
+            rebuild_wrestler_season_stats(season_id, [wrestler_id], connection=connection)
+
+
+@event.listens_for(SQLAlchemySession, 'after_rollback')
+def discard_match_stat_deltas(session):
+    session.info.pop('match_stat_deltas', None)
+    session.info.pop('changed_season_ids', None)
+    session.info.pop('seasons_changed', None)
+    session.info.pop('changed_match_season_ids', None)
+    session.info.pop('pending_match_versions', None)
+
+
+def mark_season_changed(season_id):
+    """Records that the current transaction changes a season; its data version is bumped on commit."""
+    db.session.info.setdefault('changed_season_ids', set()).add(int(season_id))
+
+
+def mark_matches_changed(season_id):
+    """Records that the current transaction adds, edits or deletes matches in a season."""
+    mark_season_changed(season_id)
+    db.session.info.setdefault('changed_match_season_ids', set()).add(int(season_id))
+
+
+@event.listens_for(SQLAlchemySession, 'after_flush')
+def collect_changed_seasons(session, flush_context):
+    # ORM writes to matches, wrestlers and seasons mark their season; bulk writers call mark_season_changed
+    changed = session.info.setdefault('changed_season_ids', set())
+    changed_matches = session.info.setdefault('changed_match_season_ids', set())
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, Match):
+            # An edit that moves a match changes its old season too
+            season_ids = {obj.season_id, *db.inspect(obj).attrs.season_id.history.deleted} - {None}
+            changed.update(int(season_id) for season_id in season_ids)
+            changed_matches.update(int(season_id) for season_id in season_ids)
+        elif isinstance(obj, Wrestler) and obj.season_id is not None:
+            changed.add(int(obj.season_id))
+        elif isinstance(obj, Season) and obj.id is not None:
+            changed.add(obj.id)
+            session.info['seasons_changed'] = True
+
+
+def match_version_scope(season_id):
+    return f'matches:{int(season_id)}'
+
+
+@event.listens_for(SQLAlchemySession, 'before_commit')
+def bump_match_versions(session):
+    """
+    Increments the match version of every season whose matches this transaction changed,
+    inside the transaction itself, so a version always names one exact set of matches.
+    Seasons without a version row yet are left alone; get_match_version creates the row.
+    """
+    session.flush()
+    season_ids = session.info.pop('changed_match_season_ids', None)
+    if not season_ids:
+        return
+    table = DataVersion.__table__
+    connection = session.connection()
+    versions = {}
+    for season_id in sorted(season_ids):
+        version = connection.execute(
+            db.update(table)
+            .where(table.c.scope == match_version_scope(season_id))
+            .values(version=table.c.version + 1, updated_at=datetime.utcnow())
+            .returning(table.c.version)
+        ).scalar()
+        if version is not None:
+            versions[season_id] = version
+    session.info['pending_match_versions'] = versions
+
+
+SEASONS_VERSION_SCOPE = 'seasons'
+
+
+@event.listens_for(SQLAlchemySession, 'before_commit')
+def bump_seasons_version(session):
+    """
+    Increments the 'seasons' version inside a transaction that wrote a Season, so every
+    worker's SeasonIntervalIndex sees the change on its next lookup.
+    """
+    session.flush()
+    if not session.info.get('seasons_changed'):
+        return
+    table = DataVersion.__table__
+    connection = session.connection()
+    now = datetime.utcnow()
+    result = connection.execute(
+        db.update(table)
+        .where(table.c.scope == SEASONS_VERSION_SCOPE)
+        .values(version=table.c.version + 1, updated_at=now)
+    )
+    if result.rowcount == 0:
+        connection.execute(db.insert(table).values(scope=SEASONS_VERSION_SCOPE, version=1, updated_at=now))
+
+
+def get_seasons_version():
+    table = DataVersion.__table__
+    query = db.select(table.c.version).where(table.c.scope == SEASONS_VERSION_SCOPE)
+    return db.session.execute(query).scalar() or 0
+
+
+@event.listens_for(SQLAlchemySession, 'after_commit')
+def publish_match_versions(session):
+    # The match versions this session's last commits produced, read by update_rpi_for_results
+    versions = session.info.pop('pending_match_versions', None)
+    if versions:
+        session.info.setdefault('match_versions', {}).update(versions)
+
+
+def get_match_version(season_id):
+    """
+    Returns the committed match version of a season, creating its row at 0 if needed.
+    Every commit that changes the season's matches increments it once.
+    """
+    table = DataVersion.__table__
+    scope = match_version_scope(season_id)
+    query = db.select(table.c.version).where(table.c.scope == scope)
+    version = db.session.execute(query).scalar()
+    if version is not None:
+        return version
+    try:
+        with db.engine.begin() as connection:
+            connection.execute(db.insert(table).values(scope=scope, version=0, updated_at=datetime.utcnow()))
+    except Exception:
+        # Another worker created it first
+        pass
+    return db.session.execute(query).scalar() or 0
+
+
+@event.listens_for(SQLAlchemySession, 'after_commit')
+def bump_changed_seasons(session):
+    season_ids = session.info.pop('changed_season_ids', None)
+    if season_ids:
+        bump_data_version(season_ids)
+    if session.info.pop('seasons_changed', None):
+        season_index.invalidate()
+
+
+def bump_data_version(season_ids):
+    """
+    Increments the data version of the given seasons and of the 'all' scope in its own
+    transaction, so cached pages keyed on the old versions stop matching.
+    """
+    table = DataVersion.__table__
+    scopes = ['all', *(f'season:{season_id}' for season_id in sorted(season_ids))]
+    now = datetime.utcnow()
+    try:
+        with db.engine.begin() as connection:
+            result = connection.execute(
+                db.update(table).where(table.c.scope.in_(scopes)).values(version=table.c.version + 1, updated_at=now)
+            )
+            if result.rowcount < len(scopes):
+                existing = set(connection.execute(db.select(table.c.scope).where(table.c.scope.in_(scopes))).scalars())
+                connection.execute(
+                    db.insert(table),
+                    [{'scope': scope, 'version': 1, 'updated_at': now} for scope in scopes if scope not in existing]
+                )
+    except Exception as e:
+        logger.error(f"Error bumping data version for seasons {sorted(season_ids)}: {str(e)}")
+
+
+def get_data_version(season_id=None):
+    """
+    Returns (version, updated_at) for a season, or for all seasons when `season_id` is None
+    or not a valid ID. Scopes that were never written report (0, None).
+    """
+    try:
+        scope = f'season:{int(season_id)}' if season_id not in (None, '') else 'all'
+    except (TypeError, ValueError):
+        scope = 'all'
+    # A column select always reads the database; the session's identity map may hold an old row
+    table = DataVersion.__table__
+    row = db.session.execute(
+        db.select(table.c.version, table.c.updated_at).where(table.c.scope == scope)
+    ).first()
+    return (row.version, row.updated_at) if row else (0, None)
+
+
+class SeasonIntervals:
+    """
+    Snapshot of every season's date range, sorted by start date, so a match date is mapped to
+    its season with a bisect instead of a query. Holds plain lists and can be pickled.
+    """
+
+    def __init__(self, rows):
+        # rows are (start_date, end_date, season_id) sorted by start date
+        self.rows = rows
+        self.starts = [start_date for start_date, _, _ in rows]
+        # Latest end date among the seasons starting at or before each position
+        self.reach = list(accumulate((end_date for _, end_date, _ in rows), max))
+
+    @classmethod
+    def load(cls):
+        rows = db.session.execute(
+            db.select(Season.start_date, Season.end_date, Season.id).order_by(Season.start_date, Season.id)
+        ).all()
+        return cls([tuple(row) for row in rows])
+
+    def season_for(self, match_date):
+        """Returns the ID of the season covering `match_date` (the latest-starting one if seasons overlap), or None."""
+        if isinstance(match_date, datetime):
+            match_date = match_date.date()
+        position = bisect_right(self.starts, match_date) - 1
+        # Step back past seasons that ended earlier, while an earlier season may still reach the date
+        while position >= 0 and self.reach[position] >= match_date:
+            _, end_date, season_id = self.rows[position]
+            if end_date >= match_date:
+                return season_id
+            position -= 1
+        return None
+
+
+class SeasonIntervalIndex:
+    """
+    The worker's current SeasonIntervals, shared by its threads. Loaded on first use and
+    reloaded when the 'seasons' version in the database moves on, so Season writes made by
+    other workers are seen too; this worker's own writes drop it immediately.
+    """
+
+    def __init__(self):
+        self.intervals = None
+        self.version = None
+        self.lock = threading.Lock()
+
+    def get(self):
+        version = get_seasons_version()
+        with self.lock:
+            if self.intervals is None or self.version != version:
+                # Read before loading: a write in between leaves the older version and reloads next time
+                self.intervals = SeasonIntervals.load()
+                self.version = version
+            return self.intervals
+
+    def invalidate(self):
+        with self.lock:
+            self.intervals = None
+            self.version = None
+
+
+season_index = SeasonIntervalIndex()
+
+
+@event.listens_for(Wrestler, 'before_delete')
+def wrestler_stats_before_delete(mapper, connection, target):
+    for table in (WrestlerSeasonStats.__table__, WrestlerRank.__table__, RatingHistory.__table__):
+        connection.execute(db.delete(table).where(table.c.wrestler_id == target.id))
+
+
+@event.listens_for(Match, 'before_delete')
+def match_history_before_delete(mapper, connection, target):
+    # SQLite doesn't enforce the ondelete cascade, so a deleted match takes its history rows
+    # with it here; bulk deletes (revert_csv_upload, clear_data) remove them themselves
+    table = RatingHistory.__table__
+    connection.execute(db.delete(table).where(table.c.match_id == target.id))
+
+
+def rank_index_query(season_id, weight_class=None):
+    """
+    Window-function select of every wrestler's rank positions, partitioned by weight class.
+    Ties keep ID order; missing ratings sort as 0.
+    """
+    hybrid_score = db.case(
+        (db.and_(Wrestler.elo_rating.isnot(None), Wrestler.rpi.isnot(None)), 0.5 * Wrestler.elo_rating + 0.5 * Wrestler.rpi),
+        else_=0
+    )
+
+    def position(value):
+        return func.row_number().over(
+            partition_by=Wrestler.weight_class,
+            order_by=(func.coalesce(value, 0).desc(), Wrestler.id)
+        )
+
+    query = db.select(
+        Wrestler.id.label('wrestler_id'),
+        Wrestler.season_id,
+        Wrestler.weight_class,
+        position(Wrestler.elo_rating).label('elo_rank'),
+        position(Wrestler.rpi).label('rpi_rank'),
+        position(hybrid_score).label('hybrid_rank'),
+        position(Wrestler.dominance_score).label('dominance_rank')
+    ).where(Wrestler.season_id == season_id)
+    if weight_class is not None:
+        query = query.where(Wrestler.weight_class == weight_class)
+    return query
+
+
+def refresh_rank_index(season_id, weight_classes=None):
+    """
+    Rewrites the WrestlerRank rows of a season (or only the given weight classes) with one
+    DELETE and one INSERT ... SELECT. Runs in the caller's transaction; the caller commits.
+    """
+    db.session.flush()
+    mark_season_changed(season_id)
+    table = WrestlerRank.__table__
+    delete = db.delete(table).where(table.c.season_id == season_id)
+    query = rank_index_query(season_id)
+    if weight_classes is not None:
+        weight_classes = sorted(set(weight_classes))
+        if not weight_classes:
+            return
+        delete = delete.where(table.c.weight_class.in_(weight_classes))
+        # Ranks are partitioned by weight class, so filtering first leaves them unchanged
+        query = query.where(Wrestler.weight_class.in_(weight_classes))
+    db.session.execute(delete)
+    db.session.execute(
+        db.insert(table).from_select(
+            ['wrestler_id', 'season_id', 'weight_class', 'elo_rank', 'rpi_rank', 'hybrid_rank', 'dominance_rank'],
+            query
+        )
+    )
+
+
+def wrestler_weight_classes(wrestler_ids):
+    """
+    Returns {wrestler_id: weight_class} for those of the given wrestlers that still exist;
+    its values are what refresh_rank_index needs.
+    """
+    wrestler_ids = list(wrestler_ids)
+    weight_classes = {}
+    # Batches of 500 stay under the 999 bound parameters older SQLite builds allow
+    for start in range(0, len(wrestler_ids), 500):
+        weight_classes.update(db.session.execute(
+            db.select(Wrestler.id, Wrestler.weight_class).where(Wrestler.id.in_(wrestler_ids[start:start + 500]))
+        ).all())
+    return weight_classes
+
+
+def get_wrestler_ranks(wrestler):
+    """
+    Returns a wrestler's WrestlerRank row. Falls back to a read-only window query over their
+    weight class for data written before the index existed.
+    """
+    ranks = WrestlerRank.query.get(wrestler.id)
+    if ranks is None:
+        ranked = rank_index_query(wrestler.season_id, wrestler.weight_class).subquery()
+        ranks = db.session.execute(db.select(ranked).where(ranked.c.wrestler_id == wrestler.id)).first()
+    return ranks
+
+
+def get_season_stats(season_id, wrestler_ids=None):
+    """Returns {wrestler_id: WrestlerSeasonStats} for a season with one query."""
+    query = WrestlerSeasonStats.query.filter_by(season_id=season_id)
+    if wrestler_ids is not None:
+        query = query.filter(WrestlerSeasonStats.wrestler_id.in_(list(wrestler_ids)))
+    return {stats.wrestler_id: stats for stats in query}
+
 logger = logging.getLogger(__name__)
 
 def expected_score(rating_a, rating_b):
@@ -754,74 +1540,444 @@ def recalculate_elo(wrestler_id, season_id):
 
 
 
-def recalculate_elo_for_season(season_id):
+def load_season_match_arrays(season_id, weight_class=None, since=None):
     """
-    Recalculates Elo ratings for all matches in a season chronologically by match date.
-    Resets all wrestlers' Elo to their season_start_elo at the beginning of recalculation.
+    Loads every match in a season once, in chronological replay order.
+    Optionally limited to one weight class and to matches on or after the `since` date.
+    Returns parallel NumPy arrays: (match_ids, dates, wrestler1_ids, wrestler2_ids, winner_ids).
     """
-    logger.info(f"Starting Elo recalculation for season {season_id}...")
+    query = db.session.query(
+        Match.id, Match.date, Match.wrestler1_id, Match.wrestler2_id, Match.winner_id
+    ).filter(Match.season_id == season_id)
 
-    # Reset all wrestlers' Elo to their season_start_elo or 1500
-    wrestlers = Wrestler.query.filter_by(season_id=season_id).all()
-    for wrestler in wrestlers:
-        wrestler.elo_rating = wrestler.season_start_elo or 1500
-        logger.info(f"Reset {wrestler.name} Elo to {wrestler.elo_rating}")
+    if weight_class is not None:
+        query = query.join(Wrestler, Wrestler.id == Match.wrestler1_id).filter(Wrestler.weight_class == weight_class)
+    if since is not None:
+        query = query.filter(Match.date >= datetime.combine(since, datetime.min.time()))
+
+    rows = query.order_by(Match.date, Match.id).all()
+
+    match_ids = np.array([row[0] for row in rows], dtype=np.int64)
+    dates = np.array([row[1] for row in rows], dtype='datetime64[s]')
+    wrestler1_ids = np.array([row[2] for row in rows], dtype=np.int64)
+    wrestler2_ids = np.array([row[3] for row in rows], dtype=np.int64)
+    winner_ids = np.array([row[4] for row in rows], dtype=np.int64)
+    return match_ids, dates, wrestler1_ids, wrestler2_ids, winner_ids
+
+
+def schedule_elo_rounds(idx1, idx2, n_wrestlers):
+    """
+    Assigns each match to the earliest round after both of its wrestlers' previous matches.
+    No wrestler appears twice in a round, so a round can be applied as one vectorized step
+    and still give the same ratings as replaying the matches one at a time.
+    """
+    last_round = [0] * n_wrestlers
+    rounds = []
+    for a, b in zip(idx1.tolist(), idx2.tolist()):
+        r = max(last_round[a], last_round[b]) + 1
+        last_round[a] = last_round[b] = r
+        rounds.append(r)
+    return np.array(rounds, dtype=np.int64)
+
+
+def replay_elo(ratings, idx1, idx2, actual1, k_factor=32):
+    """
+    Replays matches (already in chronological order) over an integer-indexed rating array.
+    Updates `ratings` in place and returns each match's post-match ratings for both wrestlers.
+    """
+    post1 = np.empty(len(idx1), dtype=np.float64)
+    post2 = np.empty(len(idx1), dtype=np.float64)
+    if len(idx1) == 0:
+        return post1, post2
+
+    rounds = schedule_elo_rounds(idx1, idx2, len(ratings))
+    order = np.argsort(rounds, kind='stable')
+    bounds = np.flatnonzero(np.diff(rounds[order])) + 1
+
+    for sl in np.split(order, bounds):
+        a = idx1[sl]
+        b = idx2[sl]
+        rating_a = ratings[a]
+        rating_b = ratings[b]
+        expected1 = 1 / (1 + np.power(10.0, (rating_b - rating_a) / 400))
+        ratings[a] = rating_a + k_factor * (actual1[sl] - expected1)
+        ratings[b] = rating_b + k_factor * ((1 - actual1[sl]) - (1 - expected1))
+        post1[sl] = ratings[a]
+        post2[sl] = ratings[b]
+
+    return post1, post2
+
+
+def replay_elo_by_day(ratings, days, idx1, idx2, actual1, k_factor=32):
+    """
+    Same as replay_elo, one match date at a time, also snapshotting the rating array
+    at the end of each date. Returns (post1, post2, snapshots) where snapshots is a
+    list of (date, ratings copy, match slice).
+    """
+    post1 = np.empty(len(idx1), dtype=np.float64)
+    post2 = np.empty(len(idx1), dtype=np.float64)
+    snapshots = []
+    if len(idx1) == 0:
+        return post1, post2, snapshots
+
+    bounds = np.flatnonzero(np.diff(days)) + 1
+    starts = [0] + bounds.tolist()
+    stops = bounds.tolist() + [len(days)]
+    for start, stop in zip(starts, stops):
+        sl = slice(start, stop)
+        post1[sl], post2[sl] = replay_elo(ratings, idx1[sl], idx2[sl], actual1[sl], k_factor)
+        snapshots.append((days[start].astype(object), ratings.copy(), sl))
+
+    return post1, post2, snapshots
+
+
+def _replay_elo(season_id, weight_class=None, checkpoint=None, start_rating=None, k_factor=32):
+    """
+    Shared core of the full-season and incremental Elo replays.
+
+    Starts from each wrestler's season_start_elo (or `start_rating`), overridden by the
+    ratings stored in `checkpoint` if one is given, replays every later match, rebuilds
+    the checkpoints for the replayed dates and writes all ratings back in bulk.
+    """
+    timings = {}
+    stage_start = perf_counter()
+
+    wrestler_query = db.session.query(Wrestler.id, Wrestler.weight_class, Wrestler.season_start_elo).filter_by(season_id=season_id)
+    if weight_class is not None:
+        wrestler_query = wrestler_query.filter_by(weight_class=weight_class)
+    wrestler_rows = wrestler_query.all()
+
+    wrestler_ids = np.array([row[0] for row in wrestler_rows], dtype=np.int64)
+    weight_classes = np.array([row[1] for row in wrestler_rows], dtype=np.int64)
+    if start_rating is None:
+        ratings = np.array([row[2] or 1500 for row in wrestler_rows], dtype=np.float64)
+    else:
+        ratings = np.full(len(wrestler_rows), float(start_rating))
+    index = {wrestler_id: i for i, wrestler_id in enumerate(wrestler_ids.tolist())}
+
+    replay_start = None
+    if checkpoint is not None:
+        replay_start = checkpoint.as_of_date + timedelta(days=1)
+        for wrestler_id, rating in checkpoint.ratings.items():
+            i = index.get(int(wrestler_id))
+            if i is not None:
+                ratings[i] = rating
+
+    match_ids, dates, wrestler1_ids, wrestler2_ids, winner_ids = load_season_match_arrays(season_id, weight_class, replay_start)
+    timings['load'] = perf_counter() - stage_start
+
+    stage_start = perf_counter()
+    idx1 = np.array([index.get(w, -1) for w in wrestler1_ids.tolist()], dtype=np.int64)
+    idx2 = np.array([index.get(w, -1) for w in wrestler2_ids.tolist()], dtype=np.int64)
+    valid = (idx1 >= 0) & (idx2 >= 0)
+    skipped = int(len(valid) - valid.sum())
+    if skipped:
+        logger.warning(f"Season {season_id}: skipped {skipped} matches with wrestlers outside the season.")
+
+    idx1, idx2 = idx1[valid], idx2[valid]
+    days = dates[valid].astype('datetime64[D]')
+    actual1 = (winner_ids[valid] == wrestler1_ids[valid]).astype(np.float64)
+    post1, post2, snapshots = replay_elo_by_day(ratings, days, idx1, idx2, actual1, k_factor)
+    timings['replay'] = perf_counter() - stage_start
+
+    stage_start = perf_counter()
+    members = {wc: np.flatnonzero(weight_classes == wc) for wc in np.unique(weight_classes).tolist()}
+    checkpoint_rows = []
+    for day, snapshot, sl in snapshots:
+        for wc in np.unique(weight_classes[idx1[sl]]).tolist():
+            checkpoint_rows.append({
+                'season_id': season_id,
+                'weight_class': wc,
+                'as_of_date': day,
+                'ratings': {str(wrestler_ids[i]): float(snapshot[i]) for i in members[wc].tolist()},
+            })
+
+    history_rows = []
+    for match_id, match_date, i1, i2, rating1, rating2 in zip(
+            match_ids[valid].tolist(), dates[valid].astype(object).tolist(),
+            idx1.tolist(), idx2.tolist(), post1.tolist(), post2.tolist()):
+        for i, rating in ((i1, rating1), (i2, rating2)):
+            history_rows.append({
+                'season_id': season_id,
+                'weight_class': int(weight_classes[i]),
+                'wrestler_id': int(wrestler_ids[i]),
+                'match_id': match_id,
+                'match_date': match_date,
+                'elo_rating': rating,
+            })
 
     try:
+        if len(wrestler_ids):
+            db.session.execute(
+                db.update(Wrestler),
+                [{'id': wrestler_id, 'elo_rating': rating}
+                 for wrestler_id, rating in zip(wrestler_ids.tolist(), ratings.tolist())]
+            )
+
+        stale_checkpoints = EloCheckpoint.query.filter_by(season_id=season_id)
+        if weight_class is not None:
+            stale_checkpoints = stale_checkpoints.filter_by(weight_class=weight_class)
+        if replay_start is not None:
+            stale_checkpoints = stale_checkpoints.filter(EloCheckpoint.as_of_date >= replay_start)
+        stale_checkpoints.delete(synchronize_session=False)
+        if checkpoint_rows:
+            db.session.execute(db.insert(EloCheckpoint), checkpoint_rows)
+
+        stale_history = RatingHistory.query.filter_by(season_id=season_id)
+        if weight_class is not None:
+            stale_history = stale_history.filter_by(weight_class=weight_class)
+        if replay_start is not None:
+            stale_history = stale_history.filter(RatingHistory.match_date >= datetime.combine(replay_start, datetime.min.time()))
+        stale_history.delete(synchronize_session=False)
+        if history_rows:
+            db.session.execute(db.insert(RatingHistory), history_rows)
+
+        refresh_rank_index(season_id, None if weight_class is None else [weight_class])
         db.session.commit()
-        logger.info(f"Elo ratings reset for all wrestlers in season {season_id}.")
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Error resetting Elo ratings: {str(e)}")
-        return
+        logger.error(f"Error writing Elo ratings for season {season_id}: {str(e)}")
+        raise
+    timings['write'] = perf_counter() - stage_start
+
+    report = {
+        'season_id': season_id,
+        'weight_class': weight_class,
+        'replayed_from': replay_start,
+        'matches': int(valid.sum()),
+        'skipped_matches': skipped,
+        'wrestlers': len(wrestler_ids),
+        'checkpoints': len(checkpoint_rows),
+        'timings': timings,
+    }
+    logger.info(
+        f"Elo replay for season {season_id}: {report['matches']} matches, {report['wrestlers']} wrestlers | "
+        + ", ".join(f"{stage} {seconds * 1000:.1f} ms" for stage, seconds in timings.items())
+    )
+    return report
 
-    # Fetch all matches in the season, ordered by date
-    matches = Match.query.filter_by(season_id=season_id).order_by(Match.date).all()
 
-    if not matches:
-        logger.warning(f"No matches found for season {season_id}.")
-        return
+def replay_season_elo(season_id, start_rating=None, k_factor=32):
+    """
+    Recalculates Elo ratings for a whole season in one pass.
+
+    Matches are loaded once as arrays of IDs and dates, replayed chronologically over an
+    integer-indexed rating array starting from each wrestler's season_start_elo (or
+    `start_rating` if given), and every rating is written back with a single bulk UPDATE.
+    All Elo checkpoints for the season are rebuilt along the way.
+
+    Returns a report dict with match/wrestler counts and the time spent in each stage.
+    """
+    return _replay_elo(season_id, start_rating=start_rating, k_factor=k_factor)
+
+
+def recalculate_elo_from_date(season_id, weight_class, from_date, k_factor=32):
+    """
+    Recalculates Elo for one weight class after a match on `from_date` was added, edited or deleted.
+    Resumes from the latest checkpoint before that date, so only matches on or after it are replayed.
+    """
+    if isinstance(from_date, datetime):
+        from_date = from_date.date()
+
+    checkpoint = EloCheckpoint.query.filter(
+        EloCheckpoint.season_id == season_id,
+        EloCheckpoint.weight_class == weight_class,
+        EloCheckpoint.as_of_date < from_date
+    ).order_by(EloCheckpoint.as_of_date.desc()).first()
+
+    return _replay_elo(season_id, weight_class=weight_class, checkpoint=checkpoint, k_factor=k_factor)
+
+
+def get_rating_history(wrestler_id):
+    """
+    Returns a wrestler's Elo after each of their matches, oldest first, as RatingHistory rows.
+    """
+    return RatingHistory.query.filter_by(wrestler_id=wrestler_id)\
+                              .order_by(RatingHistory.match_date, RatingHistory.match_id)\
+                              .all()
+
+
+def get_season_ratings_as_of(season_id, as_of_date, weight_class=None):
+    """
+    Returns {wrestler_id: elo_rating} for every wrestler in a season (or one weight class)
+    at the end of `as_of_date`, resolved from the rating history with one indexed query.
+    Wrestlers without a match by then are at their season_start_elo.
+    """
+    latest = rating_as_of_subquery(season_id, as_of_date, weight_class)
+
+    rows = db.session.query(
+        Wrestler.id,
+        func.coalesce(latest.c.elo_rating, Wrestler.season_start_elo, 1500)
+    ).outerjoin(
+        latest, db.and_(latest.c.wrestler_id == Wrestler.id, latest.c.row_number == 1)
+    ).filter(Wrestler.season_id == season_id)
+    if weight_class is not None:
+        rows = rows.filter(Wrestler.weight_class == weight_class)
+
+    return {wrestler_id: rating for wrestler_id, rating in rows.all()}
+
+
+def rating_as_of_subquery(season_id, as_of_date, weight_class=None):
+    """
+    Rating history rows numbered newest first per wrestler up to the end of `as_of_date`;
+    the row with row_number == 1 holds each wrestler's Elo at that point.
+    """
+    if isinstance(as_of_date, datetime):
+        as_of_date = as_of_date.date()
+    cutoff = datetime.combine(as_of_date + timedelta(days=1), datetime.min.time())
+
+    latest = db.session.query(
+        RatingHistory.wrestler_id,
+        RatingHistory.elo_rating,
+        func.row_number().over(
+            partition_by=RatingHistory.wrestler_id,
+            order_by=(RatingHistory.match_date.desc(), RatingHistory.match_id.desc())
+        ).label('row_number')
+    ).filter(
+        RatingHistory.season_id == season_id,
+        RatingHistory.match_date < cutoff
+    )
+    if weight_class is not None:
+        latest = latest.filter(RatingHistory.weight_class == weight_class)
+    return latest.subquery()
+
+
+def get_weight_class_ratings_as_of(season_id, weight_class, as_of_date):
+    """
+    Returns {wrestler_id: elo_rating} for every wrestler in a weight class at the end of `as_of_date`.
+    """
+    return get_season_ratings_as_of(season_id, as_of_date, weight_class=weight_class)
+
+
+def parse_as_of_date(value):
+    """
+    Parses the optional `as_of` query argument (YYYY-MM-DD). Returns (date, error); the date is
+    None if the argument is missing or invalid, and the error is the message to render on the
+    page. The pages using it are cached, so the error is not flashed.
+    """
+    if not value:
+        return None, None
+    try:
+        return datetime.strptime(value.strip(), '%Y-%m-%d').date(), None
+    except ValueError:
+        return None, f"Invalid date '{value}'. Please use YYYY-MM-DD."
+
+
+GLICKO = Glicko2()
+GLICKO_PERIOD_DAYS = 7
+
 
-    # Process matches in chronological order
-    for match in matches:
-        wrestler1 = Wrestler.query.get(match.wrestler1_id)
-        wrestler2 = Wrestler.query.get(match.wrestler2_id)
+def glicko_period_index(season, match_date):
+    """Returns the weekly rating period (counted from the season start) that a date falls in."""
+    if isinstance(match_date, datetime):
+        match_date = match_date.date()
+    return max((match_date - season.start_date).days // GLICKO_PERIOD_DAYS, 0)
 
-        if not wrestler1 or not wrestler2:
-            logger.warning(f"Match {match.id} skipped: Wrestler not found.")
-            continue
 
-        # Calculate expected scores
-        expected1 = expected_score(wrestler1.elo_rating, wrestler2.elo_rating)
-        expected2 = 1 - expected1
+def update_glicko_periods(season_id, from_date=None):
+    """
+    Brings a season's Glicko-2 ratings up to date, one weekly rating period at a time.
 
-        # Determine actual scores
-        actual1 = 1 if match.winner_id == wrestler1.id else 0
-        actual2 = 1 - actual1
+    The state at the end of each period is persisted, so only periods after the last
+    stored one are processed. If `from_date` is given (a match on that date was added,
+    edited or deleted), stored periods from that date on are discarded and reprocessed.
+    """
+    timings = {}
+    stage_start = perf_counter()
 
-        # Update Elo ratings
-        new_rating1 = update_elo(wrestler1.elo_rating, expected1, actual1)
-        new_rating2 = update_elo(wrestler2.elo_rating, expected2, actual2)
+    season = Season.query.get(season_id)
+    if not season:
+        logger.error(f"Season {season_id} not found for Glicko-2 update.")
+        return None
 
-        # Log updates
-        logger.info(
-            f"Match on {match.date}: {wrestler1.name} ({wrestler1.elo_rating:.2f}) "
-            f"vs {wrestler2.name} ({wrestler2.elo_rating:.2f}) | "
-            f"Result: {'Win' if actual1 else 'Loss'} | "
-            f"New Elo: {new_rating1:.2f}, {new_rating2:.2f}"
-        )
+    if from_date is not None:
+        GlickoPeriod.query.filter(
+            GlickoPeriod.season_id == season_id,
+            GlickoPeriod.period_index >= glicko_period_index(season, from_date)
+        ).delete(synchronize_session=False)
+
+    last_period = GlickoPeriod.query.filter_by(season_id=season_id).order_by(GlickoPeriod.period_index.desc()).first()
+
+    wrestler_ids = [row[0] for row in db.session.query(Wrestler.id).filter_by(season_id=season_id).all()]
+    index = {wrestler_id: i for i, wrestler_id in enumerate(wrestler_ids)}
+    ratings = np.full(len(wrestler_ids), float(GLICKO.default_rating))
+    rds = np.full(len(wrestler_ids), float(GLICKO.default_rd))
+    vols = np.full(len(wrestler_ids), GLICKO.default_vol)
+
+    resume_from = None
+    if last_period is not None:
+        resume_from = last_period.period_start + timedelta(days=GLICKO_PERIOD_DAYS)
+        for wrestler_id, (rating, rd, vol) in last_period.ratings.items():
+            i = index.get(int(wrestler_id))
+            if i is not None:
+                ratings[i], rds[i], vols[i] = rating, rd, vol
+
+    match_ids, dates, wrestler1_ids, wrestler2_ids, winner_ids = load_season_match_arrays(season_id, since=resume_from)
+    timings['load'] = perf_counter() - stage_start
+
+    stage_start = perf_counter()
+    idx1 = np.array([index.get(w, -1) for w in wrestler1_ids.tolist()], dtype=np.int64)
+    idx2 = np.array([index.get(w, -1) for w in wrestler2_ids.tolist()], dtype=np.int64)
+    valid = (idx1 >= 0) & (idx2 >= 0)
+    idx1, idx2 = idx1[valid], idx2[valid]
+    score1 = (winner_ids[valid] == wrestler1_ids[valid]).astype(np.float64)
+    period_of_match = np.array(
+        [glicko_period_index(season, d) for d in dates[valid].astype('datetime64[D]').astype(object).tolist()],
+        dtype=np.int64
+    )
 
-        # Commit new ratings
-        wrestler1.elo_rating = new_rating1
-        wrestler2.elo_rating = new_rating2
+    period_rows = []
+    for period in np.unique(period_of_match).tolist():
+        in_period = period_of_match == period
+        a, b, s1 = idx1[in_period], idx2[in_period], score1[in_period]
+
+        # Every match gives one outcome to each wrestler, rated against the opponent's pre-period values
+        player_idx = np.concatenate([a, b])
+        opp_idx = np.concatenate([b, a])
+        scores = np.concatenate([s1, 1 - s1])
+        ratings, rds, vols = GLICKO.update_ratings(ratings, rds, vols, player_idx, ratings[opp_idx], rds[opp_idx], scores)
+
+        period_rows.append({
+            'season_id': season_id,
+            'period_index': period,
+            'period_start': season.start_date + timedelta(days=period * GLICKO_PERIOD_DAYS),
+            'match_count': int(in_period.sum()),
+            'ratings': {str(wrestler_id): list(state)
+                        for wrestler_id, state in zip(wrestler_ids, zip(ratings.tolist(), rds.tolist(), vols.tolist()))},
+        })
+    timings['replay'] = perf_counter() - stage_start
 
-    # Commit match updates
+    stage_start = perf_counter()
     try:
+        if wrestler_ids:
+            db.session.execute(
+                db.update(Wrestler),
+                [{'id': wrestler_id, 'glicko_rating': rating, 'glicko_rd': rd, 'glicko_vol': vol}
+                 for wrestler_id, rating, rd, vol in zip(wrestler_ids, ratings.tolist(), rds.tolist(), vols.tolist())]
+            )
+        if period_rows:
+            db.session.execute(db.insert(GlickoPeriod), period_rows)
+        mark_season_changed(season_id)
         db.session.commit()
-        logger.info(f"Completed Elo recalculation for season {season_id}.")
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Error committing match updates: {str(e)}")
+        logger.error(f"Error writing Glicko-2 ratings for season {season_id}: {str(e)}")
+        raise
+    timings['write'] = perf_counter() - stage_start
+
+    logger.info(
+        f"Glicko-2 update for season {season_id}: {len(period_rows)} periods, {int(valid.sum())} matches | "
+        + ", ".join(f"{stage} {seconds * 1000:.1f} ms" for stage, seconds in timings.items())
+    )
+    return {'season_id': season_id, 'periods': len(period_rows), 'matches': int(valid.sum()), 'timings': timings}
+
+
+def recalculate_elo_for_season(season_id):
+    """
+    Recalculates Elo ratings for all matches in a season chronologically by match date.
+    Resets all wrestlers' Elo to their season_start_elo at the beginning of recalculation.
+    """
+    return replay_season_elo(season_id)
 
 
 
@@ -886,6 +2042,299 @@ def recalculate_rpi(wrestler_id, season_id):
     logger.info(f"RPI recalculated for {wrestler.name}: {rpi:.3f}")
     return rpi
 
+def calculate_season_rpi(wrestler_ids, wrestler1_ids, wrestler2_ids, winner_ids):
+    """
+    Computes RPI for every wrestler in a season from its match arrays.
+
+    Builds the wrestler-opponent adjacency matrix once; OWP and OOWP are then averages
+    of win percentage over each row's distinct opponents and distinct opponents' opponents.
+    Returns (rpi, win_percentage, opponent_win_percentage, opponent_opponent_win_percentage) arrays.
+    """
+    n = len(wrestler_ids)
+    index = {wrestler_id: i for i, wrestler_id in enumerate(wrestler_ids)}
+    idx1 = np.array([index.get(w, -1) for w in wrestler1_ids], dtype=np.int64)
+    idx2 = np.array([index.get(w, -1) for w in wrestler2_ids], dtype=np.int64)
+    winners = np.array([index.get(w, -1) for w in winner_ids], dtype=np.int64)
+    valid = (idx1 >= 0) & (idx2 >= 0) & (idx1 != idx2)
+    idx1, idx2, winners = idx1[valid], idx2[valid], winners[valid]
+
+    wins = np.bincount(winners[winners >= 0], minlength=n)
+    total_matches = np.bincount(idx1, minlength=n) + np.bincount(idx2, minlength=n)
+    win_percentage = wins / np.maximum(total_matches, 1)
+
+    # Distinct opponents: symmetric 0/1 adjacency matrix
+    ones = np.ones(len(idx1))
+    adjacency = sparse.coo_matrix(
+        (np.concatenate([ones, ones]), (np.concatenate([idx1, idx2]), np.concatenate([idx2, idx1]))),
+        shape=(n, n)
+    ).tocsr()
+    adjacency.data[:] = 1
+
+    # Distinct opponents' opponents: non-zero pattern of the two-hop matrix
+    two_hop = (adjacency @ adjacency).tocsr()
+    two_hop.data[:] = 1
+
+    def mean_over(matrix):
+        counts = np.asarray(matrix.sum(axis=1)).ravel()
+        return np.divide(matrix @ win_percentage, counts, out=np.zeros(n), where=counts > 0)
+
+    opponent_win_percentage = mean_over(adjacency)
+    opponent_opponent_win_percentage = mean_over(two_hop)
+
+    rpi = 0.25 * win_percentage + 0.5 * opponent_win_percentage + 0.25 * opponent_opponent_win_percentage
+    rpi[total_matches < MIN_MATCHES] = 0
+    return rpi, win_percentage, opponent_win_percentage, opponent_opponent_win_percentage
+
+
+def recalculate_season_rpi(season_id):
+    """
+    Recalculates RPI for every wrestler in a season from one match query and writes
+    all values back with a single bulk UPDATE. Returns a report with per-stage timings.
+    """
+    timings = {}
+    stage_start = perf_counter()
+    wrestler_ids = [row[0] for row in db.session.query(Wrestler.id).filter_by(season_id=season_id).all()]
+    match_ids, dates, wrestler1_ids, wrestler2_ids, winner_ids = load_season_match_arrays(season_id)
+    timings['load'] = perf_counter() - stage_start
+
+    stage_start = perf_counter()
+    rpi = calculate_season_rpi(wrestler_ids, wrestler1_ids.tolist(), wrestler2_ids.tolist(), winner_ids.tolist())[0]
+    timings['compute'] = perf_counter() - stage_start
+
+    stage_start = perf_counter()
+    try:
+        if wrestler_ids:
+            db.session.execute(
+                db.update(Wrestler),
+                [{'id': wrestler_id, 'rpi': value} for wrestler_id, value in zip(wrestler_ids, rpi.tolist())]
+            )
+        refresh_rank_index(season_id)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error writing RPI for season {season_id}: {str(e)}")
+        raise
+    timings['write'] = perf_counter() - stage_start
+
+    logger.info(
+        f"RPI for season {season_id}: {len(wrestler_ids)} wrestlers, {len(match_ids)} matches | "
+        + ", ".join(f"{stage} {seconds * 1000:.1f} ms" for stage, seconds in timings.items())
+    )
+    return {'season_id': season_id, 'wrestlers': len(wrestler_ids), 'matches': len(match_ids), 'timings': timings}
+
+
+class SeasonRPIState:
+    """
+    In-memory RPI aggregates for one season, updated one match result at a time.
+
+    Keeps per-wrestler wins and match totals, opponent match counts, two-hop path counts
+    (common-opponent counts, matching the non-zero pattern used by calculate_season_rpi)
+    and the running win-percentage sums behind OWP and OOWP. Adding or removing a result
+    only touches the two wrestlers, their opponents and their opponents' opponents.
+    """
+
+    def __init__(self, season_id):
+        self.season_id = season_id
+        self.version = None  # Match version the aggregates reflect; None if unknown
+        self.match_count = 0
+        self.wins = defaultdict(int)
+        self.totals = defaultdict(int)
+        self.opponents = defaultdict(Counter)
+        self.two_hop = defaultdict(Counter)
+        self.owp_sum = defaultdict(float)
+        self.oowp_sum = defaultdict(float)
+
+    @classmethod
+    def build(cls, season_id):
+        """Builds the aggregates for a season from its matches with sparse matrix products."""
+        state = cls(season_id)
+        # The version is only trusted if no commit changed the matches while they were read
+        version = get_match_version(season_id)
+        match_ids, dates, wrestler1_ids, wrestler2_ids, winner_ids = load_season_match_arrays(season_id)
+        if get_match_version(season_id) == version:
+            state.version = version
+        state.match_count = len(match_ids)
+
+        valid = wrestler1_ids != wrestler2_ids
+        idx1, idx2, winners = wrestler1_ids[valid], wrestler2_ids[valid], winner_ids[valid]
+        wrestler_ids, inverse = np.unique(np.concatenate([idx1, idx2]), return_inverse=True)
+        n = len(wrestler_ids)
+        idx1, idx2 = inverse[:len(idx1)], inverse[len(idx1):]
+
+        ones = np.ones(len(idx1))
+        counts = sparse.coo_matrix(
+            (np.concatenate([ones, ones]), (np.concatenate([idx1, idx2]), np.concatenate([idx2, idx1]))),
+            shape=(n, n)
+        ).tocsr()
+        adjacency = counts.copy()
+        adjacency.data[:] = 1
+        two_hop = (adjacency @ adjacency).tocsr()
+
+        totals = np.bincount(idx1, minlength=n) + np.bincount(idx2, minlength=n)
+        wins = np.bincount(idx1[winners == wrestler1_ids[valid]], minlength=n) + \
+            np.bincount(idx2[winners == wrestler2_ids[valid]], minlength=n)
+        win_percentage = wins / np.maximum(totals, 1)
+        two_hop_pattern = two_hop.copy()
+        two_hop_pattern.data[:] = 1
+        owp_sum = adjacency @ win_percentage
+        oowp_sum = two_hop_pattern @ win_percentage
+
+        ids = wrestler_ids.tolist()
+        for i, wrestler_id in enumerate(ids):
+            state.wins[wrestler_id] = int(wins[i])
+            state.totals[wrestler_id] = int(totals[i])
+            state.owp_sum[wrestler_id] = float(owp_sum[i])
+            state.oowp_sum[wrestler_id] = float(oowp_sum[i])
+            row = slice(counts.indptr[i], counts.indptr[i + 1])
+            state.opponents[wrestler_id] = Counter(
+                dict(zip((ids[j] for j in counts.indices[row]), counts.data[row].astype(int).tolist()))
+            )
+            row = slice(two_hop.indptr[i], two_hop.indptr[i + 1])
+            state.two_hop[wrestler_id] = Counter(
+                dict(zip((ids[j] for j in two_hop.indices[row]), two_hop.data[row].astype(int).tolist()))
+            )
+        return state
+
+    def win_percentage(self, wrestler_id):
+        return self.wins[wrestler_id] / max(self.totals[wrestler_id], 1)
+
+    def rpi(self, wrestler_id):
+        if self.totals[wrestler_id] < MIN_MATCHES:
+            return 0
+        opponent_count = len(self.opponents[wrestler_id])
+        two_hop_count = len(self.two_hop[wrestler_id])
+        opponent_win_percentage = self.owp_sum[wrestler_id] / opponent_count if opponent_count else 0
+        opponent_opponent_win_percentage = self.oowp_sum[wrestler_id] / two_hop_count if two_hop_count else 0
+        return 0.25 * self.win_percentage(wrestler_id) + 0.5 * opponent_win_percentage + 0.25 * opponent_opponent_win_percentage
+
+    def _add_two_hop_paths(self, middle, end, sign, touched):
+        # Paths u - middle - end (and their mirror) appear or disappear with the edge middle - end
+        for u in list(self.opponents[middle]):
+            for a, b in {(u, end), (end, u)}:
+                before = self.two_hop[a][b]
+                self.two_hop[a][b] = before + sign
+                if before == 0:
+                    self.oowp_sum[a] += self.win_percentage(b)
+                elif before + sign == 0:
+                    del self.two_hop[a][b]
+                    self.oowp_sum[a] -= self.win_percentage(b)
+                touched.add(a)
+
+    def apply(self, wrestler1_id, wrestler2_id, winner_id, sign=1):
+        """
+        Adds (sign=1) or removes (sign=-1) one match result.
+        Returns the set of wrestler IDs whose RPI may have changed.
+        """
+        touched = {wrestler1_id, wrestler2_id}
+        self.match_count += sign
+        if wrestler1_id == wrestler2_id:
+            return touched
+
+        # 1. Opponent and two-hop sets change only when the pair gains its first or loses its last match
+        pair_before = self.opponents[wrestler1_id][wrestler2_id]
+        if sign < 0 and pair_before == 1:
+            # Drop the paths through the edge while it is still present
+            self._add_two_hop_paths(wrestler1_id, wrestler2_id, sign, touched)
+            self._add_two_hop_paths(wrestler2_id, wrestler1_id, sign, touched)
+        for a, b in ((wrestler1_id, wrestler2_id), (wrestler2_id, wrestler1_id)):
+            self.opponents[a][b] += sign
+            if self.opponents[a][b] == 0:
+                del self.opponents[a][b]
+                self.owp_sum[a] -= self.win_percentage(b)
+            elif sign > 0 and pair_before == 0:
+                self.owp_sum[a] += self.win_percentage(b)
+        if sign > 0 and pair_before == 0:
+            self._add_two_hop_paths(wrestler1_id, wrestler2_id, sign, touched)
+            self._add_two_hop_paths(wrestler2_id, wrestler1_id, sign, touched)
+
+        # 2. Win percentages move for both wrestlers; push the deltas to everyone averaging over them
+        for wrestler_id in (wrestler1_id, wrestler2_id):
+            before = self.win_percentage(wrestler_id)
+            self.totals[wrestler_id] += sign
+            if wrestler_id == winner_id:
+                self.wins[wrestler_id] += sign
+            delta = self.win_percentage(wrestler_id) - before
+            for opponent_id in self.opponents[wrestler_id]:
+                self.owp_sum[opponent_id] += delta
+                touched.add(opponent_id)
+            for other_id in self.two_hop[wrestler_id]:
+                self.oowp_sum[other_id] += delta
+                touched.add(other_id)
+        return touched
+
+
+# Season RPI aggregates kept between requests; rebuilt whenever they fall out of step with the database.
+# Request and import threads share them, so they are only read or changed under the lock
+season_rpi_states = {}
+season_rpi_lock = threading.Lock()
+
+
+def update_rpi_for_results(season_id, added=(), removed=()):
+    """
+    Incrementally updates RPI after match results were added to or removed from a season.
+
+    `added` and `removed` are (wrestler1_id, wrestler2_id, winner_id) tuples for changes
+    that are already committed. Only wrestlers within two hops of a changed result are
+    rewritten. The cached aggregates are only updated in place when the commit that made
+    the changes is the one commit since they were last in step with the database, as
+    told by the season's match version. Otherwise (first use, a write from another
+    process or thread, or a write path that bypassed this function) the season is
+    rebuilt and every wrestler's RPI is rewritten. It is also rebuilt when a changed
+    result names a wrestler that no longer exists, e.g. one deleted with their matches.
+    """
+    timings = {}
+    stage_start = perf_counter()
+    # Version produced by this session's commit of the changes
+    committed_version = db.session.info.get('match_versions', {}).pop(season_id, None)
+    # Held through the write too, so an older result can't overwrite a newer one
+    with season_rpi_lock:
+        state = season_rpi_states.get(season_id)
+        rebuilt = state is None or state.version is None or committed_version is None or state.version != committed_version - 1
+        if not rebuilt:
+            touched = set()
+            for wrestler1_id, wrestler2_id, winner_id in removed:
+                touched |= state.apply(wrestler1_id, wrestler2_id, winner_id, sign=-1)
+            for wrestler1_id, wrestler2_id, winner_id in added:
+                touched |= state.apply(wrestler1_id, wrestler2_id, winner_id)
+            state.version = committed_version
+            weight_classes = wrestler_weight_classes(touched)
+            rebuilt = len(weight_classes) < len(touched)
+        if rebuilt:
+            state = SeasonRPIState.build(season_id)
+            season_rpi_states[season_id] = state
+            # Matches left behind by a deleted wrestler still count, but only existing rows are written
+            season_wrestler_ids = set(db.session.execute(
+                db.select(Wrestler.id).where(Wrestler.season_id == season_id)
+            ).scalars())
+            touched = set(state.totals) & season_wrestler_ids
+        timings['update'] = perf_counter() - stage_start
+
+        stage_start = perf_counter()
+        try:
+            if rebuilt:
+                db.session.execute(db.update(Wrestler).where(Wrestler.season_id == season_id).values(rpi=0))
+            if touched:
+                db.session.execute(
+                    db.update(Wrestler),
+                    [{'id': wrestler_id, 'rpi': state.rpi(wrestler_id)} for wrestler_id in touched]
+                )
+            # Only the rewritten wrestlers' weight classes can reorder
+            refresh_rank_index(season_id, None if rebuilt else weight_classes.values())
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            season_rpi_states.pop(season_id, None)
+            logger.error(f"Error updating RPI for season {season_id}: {str(e)}")
+            raise
+        timings['write'] = perf_counter() - stage_start
+
+    logger.info(
+        f"RPI {'rebuilt' if rebuilt else 'updated'} for season {season_id}: {len(touched)} wrestlers | "
+        + ", ".join(f"{stage} {seconds * 1000:.1f} ms" for stage, seconds in timings.items())
+    )
+    return {'season_id': season_id, 'rebuilt': rebuilt, 'wrestlers': len(touched), 'timings': timings}
+
+
 def recalculate_hybrid(wrestler_id, season_id):
     wrestler = Wrestler.query.get(wrestler_id)
     """
@@ -905,60 +2354,67 @@ def recalculate_hybrid(wrestler_id, season_id):
 
 
 
-# Helper function to calculate Dominance Score
-MIN_MATCHES = 3  # Minimum matches required for dominance score calculation
-
-# Helper function to calculate Dominance Score
-def calculate_dominance_score(wrestler_id, season_id):
-    wrestler = Wrestler.query.get(wrestler_id)
-    
-    # Fetch matches for the wrestler in the specified season
-    matches = Match.query.filter(
-        ((Match.wrestler1_id == wrestler.id) | (Match.wrestler2_id == wrestler.id)),
-        Match.season_id == season_id
-    ).all()
-
-    match_count = len(matches)
-
-    # Ensure wrestler has the minimum number of matches
-    if match_count < MIN_MATCHES:
-        logger.info(f"{wrestler.name} has fewer than {MIN_MATCHES} matches. Dominance score not calculated.")
-        return 0  # Return 0 if wrestler does not meet minimum match requirement
-
-    total_score = 0
-    for match in matches:
-        if match.winner_id == wrestler.id:
-            if match.win_type == 'Fall':
-                total_score += 6
-            elif match.win_type == 'Technical Fall':
-                total_score += 5
-            elif match.win_type == 'Major Decision':
-                total_score += 4
-            elif match.win_type == 'Decision':
-                total_score += 3
-
-    # Calculate the average dominance score across all matches
-    dominance_score = round(total_score / match_count, 2)  # Round to 2 decimal places for readability
-    return dominance_score
-
-
+# Dominance points per win type; losses and unlisted win types score 0
+DOMINANCE_POINTS = {
+    'Fall': 6,
+    'Technical Fall': 5,
+    'Major Decision': 4,
+    'Decision': 3,
+}
 
+# Win types tallied into their own Wrestler columns
+WIN_TYPE_COLUMNS = {
+    'Fall': 'falls',
+    'Technical Fall': 'tech_falls',
+    'Major Decision': 'major_decisions',
+}
 
 
-def recalculate_dominance(wrestler_id, season_id):
+def recalculate_season_dominance(season_id, wrestler_ids=None):
     """
-    Recalculates and updates the dominance score for a given wrestler.
+    Recalculates dominance_score, falls, tech_falls and major_decisions for every wrestler
+    in a season (or only `wrestler_ids`) with a single UPDATE statement.
+
+    Each column is a correlated aggregate over the season's matches, so no matches are loaded
+    into Python. Dominance is the average of DOMINANCE_POINTS over all matches, rounded to
+    2 places, and 0 below MIN_MATCHES.
     """
-    wrestler = Wrestler.query.get(wrestler_id)
+    season_matches = db.select(func.count(Match.id)).where(Match.season_id == season_id)
+    wins = season_matches.where(Match.winner_id == Wrestler.id)
+
+    match_count = season_matches.where(
+        db.or_(Match.wrestler1_id == Wrestler.id, Match.wrestler2_id == Wrestler.id)
+    ).scalar_subquery()
+    points = db.select(
+        func.coalesce(func.sum(db.case(DOMINANCE_POINTS, value=Match.win_type, else_=0)), 0)
+    ).where(Match.season_id == season_id, Match.winner_id == Wrestler.id).scalar_subquery()
+
+    values = {
+        column: wins.where(Match.win_type == win_type).scalar_subquery()
+        for win_type, column in WIN_TYPE_COLUMNS.items()
+    }
+    values['dominance_score'] = db.case(
+        (match_count < MIN_MATCHES, 0.0),
+        else_=func.round(db.cast(points, db.Numeric) / match_count, 2)
+    )
 
-    # Calculate dominance score
-    dominance_score = calculate_dominance_score(wrestler_id, season_id)
-    wrestler.dominance_score = dominance_score  # Save it back to the wrestler
+    statement = db.update(Wrestler).where(Wrestler.season_id == season_id).values(**values)
+    if wrestler_ids is not None:
+        statement = statement.where(Wrestler.id.in_(list(wrestler_ids)))
 
-    db.session.commit()  # Commit the changes to the database
-    logger.info(f"Dominance score for {wrestler.name} recalculated: {dominance_score}")
-    
-    return wrestler.dominance_score
+    try:
+        result = db.session.execute(statement.execution_options(synchronize_session=False))
+        refresh_rank_index(season_id, None if wrestler_ids is None else wrestler_weight_classes(wrestler_ids).values())
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error recalculating dominance for season {season_id}: {str(e)}")
+        raise
+
+    # Objects already loaded in the session should pick up the new values on next access
+    db.session.expire_all()
+    logger.info(f"Dominance and win-type tallies recalculated for {result.rowcount} wrestlers in season {season_id}")
+    return result.rowcount
 
 
 
@@ -1005,6 +2461,147 @@ def get_stat_leaders(stat_column, season_id=None, limit=10, weight_class=None):
     return [(wrestler, getattr(wrestler, stat_mapping[stat_column].key)) for wrestler in query.all()]
 
 
+class ResponseCache:
+    """
+    Size-bounded LRU of rendered pages, shared by the threads of one worker.
+    Keys carry the season data version, so stale entries are never served; they age out.
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def set(self, key, entry):
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self.entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else None,
+            }
+
+
+response_cache = ResponseCache(app.config.get('RESPONSE_CACHE_SIZE', 256))
+
+
+def page_version_key(view_args, all_seasons=False):
+    """
+    Identity of the requested page at the current data version: endpoint, URL arguments,
+    the visitor's role and the version of the requested season (or of all seasons).
+    Returns (key, audience, updated_at).
+    """
+    version, updated_at = get_data_version(None if all_seasons else request.args.get('season_id'))
+
+    if current_user.is_authenticated:
+        audience = 'admin' if current_user.is_admin else 'user'
+    else:
+        audience = 'anonymous'
+    key = (
+        request.endpoint,
+        tuple(sorted(view_args.items())),
+        tuple(sorted(request.args.items(multi=True))),
+        audience,
+        version,
+    )
+    return key, audience, updated_at
+
+
+def cached_page(f):
+    """
+    Serves GET pages from response_cache, keyed by page_version_key.
+    Only for pages whose templates do not render flashed messages.
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if request.method != 'GET':
+            return f(*args, **kwargs)
+
+        key = page_version_key(kwargs)[0]
+        cached = response_cache.get(key)
+        if cached is not None:
+            body, status, content_type = cached
+            return app.response_class(body, status=status, content_type=content_type)
+
+        response = make_response(f(*args, **kwargs))
+        if response.status_code == 200 and not response.direct_passthrough:
+            response_cache.set(key, (response.get_data(), response.status_code, response.content_type))
+        return response
+    return decorated_function
+
+
+def conditional_get(all_seasons=False):
+    """
+    Adds a strong ETag and a Last-Modified header derived from the season data version and
+    answers If-None-Match / If-Modified-Since with 304 before the view runs.
+    Use all_seasons=True for pages that read more than the season named in `season_id`.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            if request.method != 'GET':
+                return f(*args, **kwargs)
+
+            key, audience, updated_at = page_version_key(kwargs, all_seasons)
+            etag = hashlib.sha1(repr(key).encode()).hexdigest()
+            last_modified = updated_at.replace(microsecond=0, tzinfo=timezone.utc) if updated_at else None
+
+            # If-None-Match wins over If-Modified-Since when both are sent
+            if request.if_none_match:
+                not_modified = request.if_none_match.contains(etag)
+            else:
+                not_modified = (last_modified is not None and request.if_modified_since is not None
+                                and last_modified <= request.if_modified_since)
+
+            if not_modified:
+                response = app.response_class(status=304)
+            else:
+                response = make_response(f(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag)
+            if last_modified is not None:
+                response.last_modified = last_modified
+            # Revalidate on every use; pages for signed-in visitors stay out of shared caches
+            response.cache_control.no_cache = True
+            if audience == 'anonymous':
+                response.cache_control.public = True
+            else:
+                response.cache_control.private = True
+            return response
+        return decorated_function
+    return decorator
+
+
 # Utility functions and decorators (admin_required goes here)
 def admin_required(f):
     @wraps(f)
@@ -1057,217 +2654,147 @@ def get_region_and_conference(school_name):
         return None, None  # Return None if the school is not found
 
 
-def get_weight_class_data(season_id=None):
-    weight_class_data = []
-    for weight in WEIGHT_CLASSES:
-        # Filter wrestlers by season if a season_id is provided
-        if season_id:
-            wrestlers = Wrestler.query.filter_by(weight_class=weight, season_id=season_id).order_by(Wrestler.elo_rating.desc()).limit(5).all()
-        else:
-            wrestlers = Wrestler.query.filter_by(weight_class=weight).order_by(Wrestler.elo_rating.desc()).limit(5).all()
-        
-        weight_class_data.append({
-            'weight': weight,
-            'wrestlers': wrestlers
-        })
-    return weight_class_data
+def get_weight_class_data(season_id=None, limit=None):
+    """
+    Top `limit` wrestlers by Elo in each of WEIGHT_CLASSES (HOME_TOP_N by default), fetched
+    with one ROW_NUMBER query partitioned by weight class. Ties keep ID order.
+    Returns a list of {'weight', 'wrestlers'} dicts in WEIGHT_CLASSES order.
+    """
+    limit = limit or app.config.get('HOME_TOP_N', 5)
+    position = func.row_number().over(
+        partition_by=Wrestler.weight_class,
+        order_by=(Wrestler.elo_rating.desc(), Wrestler.id)
+    ).label('position')
+    ranked = db.select(Wrestler, position).where(Wrestler.weight_class.in_(WEIGHT_CLASSES))
+    if season_id:
+        ranked = ranked.where(Wrestler.season_id == season_id)
+    ranked = ranked.subquery()
+    ranked_wrestler = aliased(Wrestler, ranked)
 
+    wrestlers_by_weight = defaultdict(list)
+    rows = db.session.execute(
+        db.select(ranked_wrestler).where(ranked.c.position <= limit).order_by(ranked.c.position)
+    ).scalars()
+    for wrestler in rows:
+        wrestlers_by_weight[wrestler.weight_class].append(wrestler)
 
-def calculate_wins_losses(wrestler_id, season_id):
-    matches = Match.query.filter(
-        (Match.wrestler1_id == wrestler_id) | (Match.wrestler2_id == wrestler_id),
-        Match.season_id == season_id
-    ).all()
+    return [{'weight': weight, 'wrestlers': wrestlers_by_weight[weight]} for weight in WEIGHT_CLASSES]
 
-    wins = 0
-    losses = 0
 
-    for match in matches:
-        if match.winner_id == wrestler_id:
-            wins += 1
-        else:
-            losses += 1
+def calculate_wins_losses(wrestler_id, season_id):
+    # Read from the materialized season stats instead of counting matches
+    stats = WrestlerSeasonStats.query.filter_by(wrestler_id=wrestler_id, season_id=season_id).first()
+    if not stats:
+        return 0, 0
+    return stats.wins, stats.losses
 
-    return wins, losses
 
+# Team points for the top 8 places in a weight class
+TEAM_POINTS = {1: 16, 2: 12, 3: 10, 4: 9, 5: 7, 6: 6, 7: 4, 8: 3}
 
-def recalculate_wrestler_stats(wrestler_id, season_id):
-    # Fetch the wrestler first
-    wrestler = Wrestler.query.get(wrestler_id)
-    
-    if not wrestler:  # Ensure wrestler exists
-        logging.warning(f"Wrestler with ID {wrestler_id} does not exist.")
-        return  # Early exit if wrestler does not exist
 
-    # Fetch matches for the wrestler in the selected season
-    matches = Match.query.filter(
-        (Match.wrestler1_id == wrestler_id) | (Match.wrestler2_id == wrestler_id),
-        Match.season_id == season_id
+def get_team_standings(season_id, as_of_date=None):
+    """
+    National and regional team standings for a season from a single query.
+
+    Within each weight class the top wrestler per school is picked with ROW_NUMBER, then those
+    wrestlers are numbered nationally and within their region; the top 8 of each score
+    TEAM_POINTS. Wrestlers are ranked by current Elo, or by their Elo at the end of
+    `as_of_date` when given.
+    Returns (national, regional): national is a list of (team, {'total_points', 'ranked_wrestlers'})
+    sorted by points, and regional maps each region to the same structure.
+    """
+    region_by_school = {school: info['region'] for school, info in D3_WRESTLING_SCHOOLS.items()}
+    region = db.case(region_by_school, value=Wrestler.school, else_=None)
+
+    query = db.select(Wrestler.id, Wrestler.name, Wrestler.school, Wrestler.weight_class, region.label('region'))
+    if as_of_date:
+        latest = rating_as_of_subquery(season_id, as_of_date)
+        elo = func.coalesce(latest.c.elo_rating, Wrestler.season_start_elo, 1500)
+        query = query.outerjoin(latest, db.and_(latest.c.wrestler_id == Wrestler.id, latest.c.row_number == 1))
+    else:
+        elo = func.coalesce(Wrestler.elo_rating, 0)
+    school_best = query.add_columns(
+        elo.label('elo'),
+        func.row_number().over(
+            partition_by=(Wrestler.weight_class, Wrestler.school),
+            order_by=(elo.desc(), Wrestler.id)
+        ).label('school_rank')
+    ).where(Wrestler.season_id == season_id).subquery()
+
+    def place(*partition):
+        return func.row_number().over(
+            partition_by=partition,
+            order_by=(school_best.c.elo.desc(), school_best.c.id)
+        )
+
+    placed = db.select(
+        school_best,
+        place(school_best.c.weight_class).label('national_rank'),
+        place(school_best.c.region, school_best.c.weight_class).label('regional_rank')
+    ).where(school_best.c.school_rank == 1).subquery()
+
+    rows = db.session.execute(
+        db.select(placed).where(db.or_(
+            placed.c.national_rank <= len(TEAM_POINTS),
+            db.and_(placed.c.region.isnot(None), placed.c.regional_rank <= len(TEAM_POINTS))
+        ))
     ).all()
 
-    # Initialize stats
-    falls = 0
-    tech_falls = 0
-    major_decisions = 0
+    national = {}
+    regional = {}
+    for team_name, team_info in D3_WRESTLING_SCHOOLS.items():
+        # Every school in a region is listed in its regional standings, even without points
+        regional.setdefault(team_info['region'], {})[team_name] = {'total_points': 0, 'ranked_wrestlers': []}
+
+    def add(teams, row, rank):
+        points = calculate_points(rank)
+        team = teams.setdefault(row.school, {'total_points': 0, 'ranked_wrestlers': []})
+        team['total_points'] += points
+        team['ranked_wrestlers'].append({
+            'id': row.id,
+            'name': row.name,
+            'weight_class': row.weight_class,
+            'ranking': rank,
+            'points': points
+        })
+
+    for row in rows:
+        if row.national_rank <= len(TEAM_POINTS):
+            add(national, row, row.national_rank)
+        if row.region is not None and row.regional_rank <= len(TEAM_POINTS):
+            add(regional[row.region], row, row.regional_rank)
 
-    # Loop through each match to calculate falls, tech falls, and major decisions
-    for match in matches:
-        if match.winner_id == wrestler_id:
-            if match.win_type == 'Fall':
-                falls += 1
-            elif match.win_type == 'Technical Fall':
-                tech_falls += 1
-            elif match.win_type == 'Major Decision':
-                major_decisions += 1
-
-    # Update the wrestler's stats
-    wrestler.falls = falls
-    wrestler.tech_falls = tech_falls
-    wrestler.major_decisions = major_decisions
+    def standings(teams):
+        # Each team's wrestlers by weight class, teams by points in descending order
+        for team_data in teams.values():
+            team_data['ranked_wrestlers'].sort(key=lambda x: x['weight_class'])
+        return sorted(teams.items(), key=lambda x: x[1]['total_points'], reverse=True)
+
+    return standings(national), {region_id: standings(teams) for region_id, teams in regional.items()}
 
-    try:
-        db.session.commit()  # Save changes
-        logging.info(f"Wrestler {wrestler.name} (ID: {wrestler_id}) stats updated: Falls={falls}, Tech_Falls={tech_falls}, Major_Decisions={major_decisions}.")
-    except Exception as e:
-        logging.error(f"Error updating stats for wrestler {wrestler.name} (ID: {wrestler_id}): {str(e)}")
-        db.session.rollback()  # Rollback if there was an error
 
-def get_team_scores(season_id):
+def get_team_scores(season_id, as_of_date=None):
     """
     Calculate team scores for the specified season, based on individual wrestler rankings.
     Only ranks the top wrestler per team per weight class.
-    Includes detailed data for each ranked wrestler to display in collapsible sections.
     """
-    teams = {}
-
-    # Fetch all weight classes for the specified season
-    weight_classes = set([wrestler.weight_class for wrestler in Wrestler.query.filter_by(season_id=season_id).all()])
-
-    for weight_class in weight_classes:
-        # Fetch wrestlers in the given weight class and season, ordered by Elo rating
-        wrestlers = Wrestler.query.filter_by(weight_class=weight_class, season_id=season_id).order_by(Wrestler.elo_rating.desc()).all()
+    return get_team_standings(season_id, as_of_date)[0]
 
-        # Dictionary to track top-ranked wrestler per team for this weight class
-        top_wrestlers_per_team = {}
-        for wrestler in wrestlers:
-            team_name = wrestler.school
-            # Only keep the first (top-ranked) wrestler for each team in this weight class
-            if team_name not in top_wrestlers_per_team:
-                top_wrestlers_per_team[team_name] = wrestler
-
-        # Extract the list of top-ranked wrestlers per team
-        top_wrestlers = list(top_wrestlers_per_team.values())
-
-        # Loop through the top 8 wrestlers (ranked 1 to 8) to assign points
-        for rank, wrestler in enumerate(top_wrestlers[:8], start=1):
-            team_name = wrestler.school
-            points = calculate_points(rank)
-
-            # Initialize team if not present in the dictionary
-            if team_name not in teams:
-                teams[team_name] = {'total_points': 0, 'ranked_wrestlers': []}
-
-            # Add points to the team total and append wrestler details
-            teams[team_name]['total_points'] += points
-            teams[team_name]['ranked_wrestlers'].append({
-                'id': wrestler.id,
-                'name': wrestler.name,
-                'weight_class': wrestler.weight_class,
-                'ranking': rank,
-                'points': points
-            })
-
-    # Sort each team's wrestlers by weight class in ascending order
-    for team_data in teams.values():
-        team_data['ranked_wrestlers'] = sorted(team_data['ranked_wrestlers'], key=lambda x: x['weight_class'])
-
-    # Return sorted list of teams by points in descending order
-    return sorted(teams.items(), key=lambda x: x[1]['total_points'], reverse=True)
 
-
-def get_regional_team_scores(season_id, region):
+def get_regional_team_scores(season_id, region, as_of_date=None):
     """
     Calculate team scores for a specific region and season.
-    Includes detailed data for each ranked wrestler to display in collapsible sections.
     Only ranks the top wrestler per team per weight class.
     """
-    teams = {}
-
-    # Initialize teams from the selected region with zero points
-    for team_name, team_info in D3_WRESTLING_SCHOOLS.items():
-        if team_info.get('region') == region:
-            teams[team_name] = {'total_points': 0, 'ranked_wrestlers': []}
-
-    # Fetch all weight classes for the specified season
-    weight_classes = set([wrestler.weight_class for wrestler in Wrestler.query.filter_by(season_id=season_id).all()])
-
-    for weight_class in weight_classes:
-        # Fetch wrestlers in the given weight class and season, filtered by region and ordered by Elo rating
-        wrestlers = [
-            wrestler for wrestler in Wrestler.query.filter_by(weight_class=weight_class, season_id=season_id).order_by(Wrestler.elo_rating.desc()).all()
-            if D3_WRESTLING_SCHOOLS.get(wrestler.school, {}).get('region') == region
-        ]
-
-        # Dictionary to track top-ranked wrestler per team for this weight class
-        top_wrestlers_per_team = {}
-        for wrestler in wrestlers:
-            team_name = wrestler.school
-            # Only keep the first (top-ranked) wrestler for each team in this weight class
-            if team_name not in top_wrestlers_per_team:
-                top_wrestlers_per_team[team_name] = wrestler
-
-        # Extract the list of top-ranked wrestlers per team
-        top_wrestlers = list(top_wrestlers_per_team.values())
-
-        # Loop through the top 8 wrestlers (ranked 1 to 8) to assign points
-        for rank, wrestler in enumerate(top_wrestlers[:8], start=1):
-            team_name = wrestler.school
-            points = calculate_points(rank)
-
-            # Initialize team if not present in the dictionary
-            if team_name not in teams:
-                teams[team_name] = {'total_points': 0, 'ranked_wrestlers': []}
-
-            # Add points to the team total and append wrestler details
-            teams[team_name]['total_points'] += points
-            teams[team_name]['ranked_wrestlers'].append({
-                'id': wrestler.id,
-                'name': wrestler.name,
-                'weight_class': wrestler.weight_class,
-                'ranking': rank,
-                'points': points
-            })
-
-    # Sort each team's wrestlers by weight class in ascending order
-    for team_data in teams.values():
-        team_data['ranked_wrestlers'] = sorted(team_data['ranked_wrestlers'], key=lambda x: x['weight_class'])
-
-    # Return sorted list of teams by points in descending order
-    return sorted(teams.items(), key=lambda x: x[1]['total_points'], reverse=True)
+    return get_team_standings(season_id, as_of_date)[1].get(region, [])
 
 
 def calculate_points(rank):
     """
     Returns points based on the rank.
     """
-    if rank == 1:
-        return 16
-    elif rank == 2:
-        return 12
-    elif rank == 3:
-        return 10
-    elif rank == 4:
-        return 9
-    elif rank == 5:
-        return 7
-    elif rank == 6:
-        return 6
-    elif rank == 7:
-        return 4
-    elif rank == 8:
-        return 3
-    else:
-        return 0
+    return TEAM_POINTS.get(rank, 0)
 
 
 
@@ -1279,115 +2806,56 @@ def landing():
     logout_user()
     return render_template('landing.html')
 
-@app.route('/')
-def home():
-    print("Accessing the home route...")
-    
-    # Redirect to landing page if not logged in
-    if not current_user.is_authenticated:
-        print("User is not authenticated. Redirecting to landing.")
-        return redirect(url_for('landing'))
-    
-    # Check if the user is an admin
-    is_admin = current_user.is_admin
-
+def render_home(is_admin):
+    """Renders home.html for the season in ?season_id=, defaulting to the most recent season."""
     # Get all available seasons, ordered by start_date descending
     seasons = Season.query.order_by(Season.start_date.desc()).all()
 
     # Get the most recent season
     recent_season = seasons[0] if seasons else None
 
-    # Get the selected season from the URL or default to the most recent season
-    selected_season_id = request.args.get('season_id')
-
-    if not selected_season_id and recent_season:
-        # Default to the most recent season if no season is selected
-        selected_season_id = recent_season.id
-
-    # Fetch the selected season object
-    selected_season = Season.query.get(selected_season_id) if selected_season_id else recent_season
+    # Pick the selected season out of the list already loaded
+    selected_season_id = request.args.get('season_id', type=int)
+    if selected_season_id:
+        selected_season = next((season for season in seasons if season.id == selected_season_id), None)
+    else:
+        selected_season = recent_season
 
     if not selected_season:
         flash('No seasons found. Please create a new season to proceed.', 'warning')
         return redirect(url_for('manage_seasons'))
 
-    # Initialize weight_class_data for storing wrestlers by weight class
-    weight_class_data = []
-
-    if selected_season:
-        # Fetch weight class data
-        for weight in WEIGHT_CLASSES:
-            wrestlers = Wrestler.query.filter_by(weight_class=weight, season_id=selected_season.id)\
-                                      .order_by(Wrestler.elo_rating.desc())\
-                                      .limit(5)\
-                                      .all()
-            weight_class_data.append({
-                'weight': weight,
-                'wrestlers': wrestlers
-            })
+    weight_class_data = get_weight_class_data(selected_season.id)
 
-    # Render the home template with season data
     return render_template('home.html',
                            weight_class_data=weight_class_data,
                            seasons=seasons,
                            selected_season=selected_season,
-                           selected_season_id=selected_season.id if selected_season else None,
+                           selected_season_id=selected_season.id,
                            recent_season=recent_season,
                            is_admin=is_admin)
 
+@app.route('/')
+@conditional_get()
+@cached_page
+def home():
+    # Redirect to landing page if not logged in
+    if not current_user.is_authenticated:
+        return redirect(url_for('landing'))
+
+    return render_home(current_user.is_admin)
+
 @app.route('/viewer-home')
+@conditional_get()
+@cached_page
 def viewer_home():
-    print("Accessing the viewer home route...")
-    
     # Treat this as a non-admin view
-    is_admin = False
-
-    # Get all available seasons, ordered by start_date descending
-    seasons = Season.query.order_by(Season.start_date.desc()).all()
-
-    # Get the most recent season
-    recent_season = seasons[0] if seasons else None
-
-    # Get the selected season from the URL or default to the most recent season
-    selected_season_id = request.args.get('season_id')
-
-    if not selected_season_id and recent_season:
-        # Default to the most recent season if no season is selected
-        selected_season_id = recent_season.id
-
-    # Fetch the selected season object
-    selected_season = Season.query.get(selected_season_id) if selected_season_id else recent_season
-
-    if not selected_season:
-        flash('No seasons found. Please create a new season to proceed.', 'warning')
-        return redirect(url_for('manage_seasons'))
-
-    # Initialize weight_class_data for storing wrestlers by weight class
-    weight_class_data = []
-
-    if selected_season:
-        # Fetch weight class data
-        for weight in WEIGHT_CLASSES:
-            wrestlers = Wrestler.query.filter_by(weight_class=weight, season_id=selected_season.id)\
-                                      .order_by(Wrestler.elo_rating.desc())\
-                                      .limit(5)\
-                                      .all()
-            weight_class_data.append({
-                'weight': weight,
-                'wrestlers': wrestlers
-            })
-
-    # Render the home template with season data, but treat as a non-admin view
-    return render_template('home.html',
-                           weight_class_data=weight_class_data,
-                           seasons=seasons,
-                           selected_season=selected_season,
-                           selected_season_id=selected_season.id if selected_season else None,
-                           recent_season=recent_season,
-                           is_admin=is_admin)
+    return render_home(is_admin=False)
 
 
 @app.route('/team-rankings', methods=['GET'])
+@conditional_get()
+@cached_page
 def team_rankings():
     selected_season_id = request.args.get('season_id')
     selected_region = request.args.get('region')
@@ -1407,11 +2875,15 @@ def team_rankings():
 
     selected_season_name = selected_season.name if selected_season else 'N/A'
 
-    # Get team scores based on region selection
+    # Optional point-in-time mode: rank by each wrestler's Elo at the end of the given date
+    as_of_date, as_of_error = parse_as_of_date(request.args.get('as_of'))
+
+    # National and regional standings come from the same single query
+    national_scores, regional_scores = get_team_standings(selected_season.id, as_of_date)
     if selected_region:
-        team_scores = get_regional_team_scores(selected_season.id, int(selected_region))
+        team_scores = regional_scores.get(int(selected_region), [])
     else:
-        team_scores = get_team_scores(selected_season.id)
+        team_scores = national_scores
 
     # Fetch available regions for the dropdown
     available_regions = sorted({info['region'] for info in D3_WRESTLING_SCHOOLS.values()})
@@ -1422,15 +2894,60 @@ def team_rankings():
                            selected_region=selected_region,
                            seasons=seasons,
                            selected_season_name=selected_season_name,
-                           available_regions=available_regions)
+                           available_regions=available_regions,
+                           as_of_date=as_of_date,
+                           as_of_error=as_of_error)
+
+
+
 
+def get_weight_class_rankings(season_id, weight_class):
+    """
+    One query for a weight class ranking table: every wrestler's ratings joined to their
+    materialized season record. Returns plain dicts with region, conference and win percentage
+    filled in, so callers can sort and filter without touching ORM state.
+    """
+    hybrid_score = db.case(
+        (db.and_(Wrestler.elo_rating.isnot(None), Wrestler.rpi.isnot(None)), 0.5 * Wrestler.elo_rating + 0.5 * Wrestler.rpi),
+        else_=None
+    )
+    rows = db.session.query(
+        Wrestler.id,
+        Wrestler.name,
+        Wrestler.school,
+        Wrestler.elo_rating,
+        Wrestler.season_start_elo,
+        Wrestler.rpi,
+        Wrestler.dominance_score,
+        Wrestler.glicko_rating,
+        Wrestler.glicko_rd,
+        hybrid_score.label('hybrid_score'),
+        func.coalesce(WrestlerSeasonStats.wins, 0).label('wins'),
+        func.coalesce(WrestlerSeasonStats.losses, 0).label('losses')
+    ).outerjoin(
+        WrestlerSeasonStats,
+        db.and_(WrestlerSeasonStats.wrestler_id == Wrestler.id, WrestlerSeasonStats.season_id == Wrestler.season_id)
+    ).filter(
+        Wrestler.weight_class == weight_class,
+        Wrestler.season_id == season_id
+    ).all()
 
+    rankings = []
+    for row in rows:
+        wrestler = row._asdict()
+        school_info = D3_WRESTLING_SCHOOLS.get(wrestler['school'], {})
+        wrestler['region'] = school_info.get("region", "Unknown")
+        wrestler['conference'] = school_info.get("conference", "Unknown")
+        wrestler['win_percentage'] = wrestler['wins'] / max(wrestler['wins'] + wrestler['losses'], 1) * 100
+        rankings.append(wrestler)
+    return rankings
 
 
 @app.route('/rankings/<int:weight_class>')
+@conditional_get()
+@cached_page
 def rankings(weight_class):
-    import time
-    start_time = time.time()  # Start the timer for performance measurement
+    start_time = perf_counter()  # Start the timer for performance measurement
 
     selected_season_id = request.args.get('season_id')  # Get the selected season ID from the query string
 
@@ -1443,27 +2960,15 @@ def rankings(weight_class):
     if not selected_season:
         return "Selected season not found", 404  # Error handling
 
-    # Fetch all wrestlers for the given weight class and season
-    wrestlers_query = Wrestler.query.filter_by(weight_class=weight_class, season_id=selected_season_id)
-    wrestlers = wrestlers_query.all()
-
-    # Log the number of wrestlers found
-    print(f"Wrestlers found: {len(wrestlers)}")
-    
-    # Assign region and conference based on the school
-    for wrestler in wrestlers:
-        wrestler_details = D3_WRESTLING_SCHOOLS.get(wrestler.school)
-        if wrestler_details:
-            wrestler.region = wrestler_details.get("region", "Unknown")
-            wrestler.conference = wrestler_details.get("conference", "Unknown")
-        else:
-            wrestler.region = "Unknown"
-            wrestler.conference = "Unknown"
-            print(f"School '{wrestler.school}' not found in D3_WRESTLING_SCHOOLS")
+    # Ratings, record, region and conference for the whole weight class in one query
+    wrestlers = get_weight_class_rankings(selected_season.id, weight_class)
 
-    # Print wrestler details for debugging
-    for wrestler in wrestlers:
-        print(f"Wrestler: {wrestler.name}, School: {wrestler.school}, Region: {wrestler.region}, Conference: {wrestler.conference}")
+    # Optional point-in-time mode: show each wrestler's Elo at the end of the given date
+    as_of_date, as_of_error = parse_as_of_date(request.args.get('as_of'))
+    if as_of_date:
+        as_of_ratings = get_weight_class_ratings_as_of(selected_season.id, weight_class, as_of_date)
+        for wrestler in wrestlers:
+            wrestler['as_of_elo'] = as_of_ratings.get(wrestler['id'], wrestler['season_start_elo'])
 
     sort_by = request.args.get('sort_by', 'elo')  # Default to Elo sorting
     selected_region = request.args.get('region', None)
@@ -1475,62 +2980,29 @@ def rankings(weight_class):
 
     # Filter by selected region if applicable
     if selected_region:
-        wrestlers = [wrestler for wrestler in wrestlers if wrestler.region == int(selected_region)]
-        print(f"Filtered by region: {selected_region}, Wrestlers count: {len(wrestlers)}")
+        wrestlers = [wrestler for wrestler in wrestlers if wrestler['region'] == int(selected_region)]
 
     # Filter by selected conference if applicable
     if selected_conference:
-        wrestlers = [wrestler for wrestler in wrestlers if wrestler.conference == selected_conference]
-        print(f"Filtered by conference: {selected_conference}, Wrestlers count: {len(wrestlers)}")
-
-    # Ensure that we still have wrestlers after filtering
-    print(f"Total wrestlers after filtering: {len(wrestlers)}")
-
-    # Calculate wins and losses for each wrestler
-    for wrestler in wrestlers:
-        wins, losses = calculate_wins_losses(wrestler.id, selected_season_id)
-        wrestler.wins = wins
-        wrestler.losses = losses
-
-    # Calculate Dominance Score for each wrestler
-    for wrestler in wrestlers:
-        matches_wrestler1 = Match.query.filter_by(wrestler1_id=wrestler.id, season_id=selected_season_id).all()
-        matches_wrestler2 = Match.query.filter_by(wrestler2_id=wrestler.id, season_id=selected_season_id).all()
-        matches = matches_wrestler1 + matches_wrestler2
-        total_points = 0
-        total_matches = len(matches)
-
-        # Calculate dominance score
-        for match in matches:
-            if match.winner_id == wrestler.id:
-                if match.win_type == 'Fall':
-                    total_points += 6
-                elif match.win_type == 'Technical Fall':
-                    total_points += 5
-                elif match.win_type == 'Major Decision':
-                    total_points += 4
-                elif match.win_type == 'Decision':
-                    total_points += 3
-
-        wrestler.dominance_score = total_points / total_matches if total_matches > 0 else 0
+        wrestlers = [wrestler for wrestler in wrestlers if wrestler['conference'] == selected_conference]
 
     # Handle sorting
     if sort_by == 'rpi':
-        wrestlers = sorted(wrestlers, key=lambda w: (w.rpi is None, w.rpi), reverse=True)
+        wrestlers = sorted(wrestlers, key=lambda w: (w['rpi'] is not None, w['rpi'] or 0), reverse=True)
     elif sort_by == 'hybrid':
-        wrestlers = sorted(wrestlers, key=lambda w: (w.hybrid_score is None, w.hybrid_score), reverse=True)
+        wrestlers = sorted(wrestlers, key=lambda w: (w['hybrid_score'] is not None, w['hybrid_score'] or 0), reverse=True)
     elif sort_by == 'dominance':
-        wrestlers = sorted(wrestlers, key=lambda w: (w.dominance_score is None, w.dominance_score), reverse=True)
+        wrestlers = sorted(wrestlers, key=lambda w: (w['dominance_score'] is not None, w['dominance_score'] or 0), reverse=True)
+    elif sort_by == 'glicko':
+        wrestlers = sorted(wrestlers, key=lambda w: (w['glicko_rating'] is not None, w['glicko_rating'] or 0), reverse=True)
     elif sort_by == 'region':
-        wrestlers = sorted(wrestlers, key=lambda w: (w.region is None, w.region))
+        wrestlers = sorted(wrestlers, key=lambda w: str(w['region']))
     elif sort_by == 'conference':
-        wrestlers = sorted(wrestlers, key=lambda w: (w.conference is None, w.conference))
+        wrestlers = sorted(wrestlers, key=lambda w: w['conference'])
+    elif as_of_date:
+        wrestlers = sorted(wrestlers, key=lambda w: w['as_of_elo'], reverse=True)
     else:
-        wrestlers = sorted(wrestlers, key=lambda w: (w.elo_rating is None, w.elo_rating), reverse=True)
-
-    # Calculate win percentage
-    for wrestler in wrestlers:
-        wrestler.win_percentage = (wrestler.wins / max(wrestler.total_matches, 1)) * 100  # Convert to percentage
+        wrestlers = sorted(wrestlers, key=lambda w: (w['elo_rating'] is not None, w['elo_rating'] or 0), reverse=True)
 
     # Clear filter flag
     clear_filters = bool(selected_region or selected_conference)
@@ -1539,7 +3011,7 @@ def rankings(weight_class):
     is_admin = current_user.is_authenticated and current_user.is_admin  # Adjust based on your auth system
 
     # Log query time for performance analysis
-    print(f"Query time: {time.time() - start_time:.2f} seconds")  # Log query time
+    logger.info(f"Rankings for {weight_class} (season {selected_season.id}): {len(wrestlers)} wrestlers in {(perf_counter() - start_time) * 1000:.1f} ms")
 
     return render_template('rankings.html',
                            weight_class=weight_class,
@@ -1552,10 +3024,13 @@ def rankings(weight_class):
                            conferences=conferences,
                            selected_season_id=selected_season_id,
                            selected_season=selected_season,
+                           as_of_date=as_of_date,
+                           as_of_error=as_of_error,
                            is_admin=is_admin)  # Pass the is_admin flag
 
 
 @app.route('/wrestler/<int:wrestler_id>', methods=['GET', 'POST'])
+@conditional_get()
 def wrestler_detail(wrestler_id):
     # Get the selected season from query parameters
     selected_season_id = request.args.get('season_id')
@@ -1600,20 +3075,12 @@ def wrestler_detail(wrestler_id):
     # Get wins and losses using the utility function
     wins, losses = calculate_wins_losses(wrestler_id, selected_season_id)
 
-    # Query for all wrestlers in the same weight class and season
-    all_wrestlers_in_weight_class = Wrestler.query.filter_by(weight_class=wrestler.weight_class, season_id=selected_season_id).all()
-
-    # Sort wrestlers by Elo, RPI, Hybrid, and Dominance Score and determine the ranks
-    sorted_by_elo = sorted(all_wrestlers_in_weight_class, key=lambda w: w.elo_rating, reverse=True)
-    sorted_by_rpi = sorted(all_wrestlers_in_weight_class, key=lambda w: w.rpi if w.rpi else 0, reverse=True)
-    sorted_by_hybrid = sorted(all_wrestlers_in_weight_class, key=lambda w: w.hybrid_score if w.hybrid_score else 0, reverse=True)
-    sorted_by_dominance = sorted(all_wrestlers_in_weight_class, key=lambda w: recalculate_dominance(w.id, selected_season_id), reverse=True)
-
-    # Find the ranks of the current wrestler
-    elo_rank = sorted_by_elo.index(wrestler) + 1
-    rpi_rank = sorted_by_rpi.index(wrestler) + 1
-    hybrid_rank = sorted_by_hybrid.index(wrestler) + 1
-    dominance_rank = sorted_by_dominance.index(wrestler) + 1
+    # Elo, RPI, Hybrid and Dominance ranks within the weight class from the rank index
+    ranks = get_wrestler_ranks(wrestler)
+    elo_rank = ranks.elo_rank
+    rpi_rank = ranks.rpi_rank
+    hybrid_rank = ranks.hybrid_rank
+    dominance_rank = ranks.dominance_rank
 
     # Get stats and ranks using the same logic as the leaderboards
     fall_leaders = get_stat_leaders('Fall', selected_season_id)
@@ -1637,6 +3104,10 @@ def wrestler_detail(wrestler_id):
     # Combine and sort the matches by ID to ensure they appear in the order uploaded
     matches = sorted(matches_wrestler1 + matches_wrestler2, key=lambda m: m.id)
 
+    # Elo after each match, read from the precomputed rating history
+    elo_history = get_rating_history(wrestler_id)
+    elo_after_match = {entry.match_id: entry.elo_rating for entry in elo_history}
+
     # Prepare list for match details to be rendered
     match_details = []
     for match in matches:
@@ -1657,18 +3128,11 @@ def wrestler_detail(wrestler_id):
             'win_type': match.win_type,
             'wrestler1_score': match.wrestler1_score,
             'wrestler2_score': match.wrestler2_score,
-            'match_time': match.match_time if match.match_time else "N/A"
+            'match_time': match.match_time if match.match_time else "N/A",
+            'elo_after': elo_after_match.get(match.id)
         })
 
-    # Avoid division by zero when calculating the dominance score
-    total_points = sum(
-        6 if match['win_type'] == 'Fall' else
-        5 if match['win_type'] == 'Technical Fall' else
-        4 if match['win_type'] == 'Major Decision' else
-        3 if match['win_type'] == 'Decision' else 0
-        for match in match_details if match['result'] == 'Win'
-    )
-    dominance_score = total_points / len(matches) if matches else 0
+    dominance_score = wrestler.dominance_score
 
     # Render the wrestler profile template with all the calculated data, including rankings and individual stats
     return render_template('wrestler_detail.html', 
@@ -1692,7 +3156,21 @@ def wrestler_detail(wrestler_id):
                         selected_season=selected_season,
                         selected_season_id=selected_season_id,
                         current_elo=wrestler.elo_rating,
-                        season_start_elo=wrestler.season_start_elo)
+                        season_start_elo=wrestler.season_start_elo,
+                        elo_history=[entry.to_dict() for entry in elo_history])
+
+
+@app.route('/wrestler/<int:wrestler_id>/elo_history', methods=['GET'])
+@conditional_get()
+def wrestler_elo_history(wrestler_id):
+    # Elo after each match for trend charts, served from the rating history table
+    wrestler = Wrestler.query.get_or_404(wrestler_id)
+    return jsonify({
+        'wrestler_id': wrestler.id,
+        'season_id': wrestler.season_id,
+        'season_start_elo': wrestler.season_start_elo,
+        'history': [entry.to_dict() for entry in get_rating_history(wrestler_id)]
+    })
            
 
 
@@ -1734,8 +3212,50 @@ def add_wrestler():
         logger.info(f"Added new wrestler: {new_wrestler.name}, School: {new_wrestler.school}, Weight Class: {new_wrestler.weight_class}")
         return redirect(url_for('home'))
 
-    return render_template('add_wrestler.html', weight_classes=WEIGHT_CLASSES, schools=D3_WRESTLING_SCHOOLS)
+    return render_template('add_wrestler.html', weight_classes=WEIGHT_CLASSES, schools=D3_WRESTLING_SCHOOLS)
+
+
+def rebuild_season_ratings(season_id):
+    """Recomputes a season's Elo, Glicko, RPI, stats and dominance from its matches."""
+    replay_season_elo(season_id)
+    season = db.session.get(Season, season_id)
+    if season:
+        update_glicko_periods(season_id, season.start_date)
+    with season_rpi_lock:
+        season_rpi_states.pop(season_id, None)
+    recalculate_season_rpi(season_id)
+    rebuild_wrestler_season_stats(season_id)
+    recalculate_season_dominance(season_id)
+
+
+def recompute_after_match_change(season_id, replay_from, added=(), removed=(), wrestler_ids=None):
+    """
+    Updates a season's derived ratings after a committed match add, edit or delete: replays
+    Elo per weight class from the dates in `replay_from` ({weight_class: date}), then updates
+    Glicko, RPI and dominance (for `wrestler_ids`). If a step fails, the season is rebuilt
+    instead. Returns False, after logging, if that fails too; the match itself stays saved.
+    """
+    try:
+        for weight_class, start in replay_from.items():
+            recalculate_elo_from_date(season_id, weight_class, start)
+        update_glicko_periods(season_id, min(replay_from.values()))
+        update_rpi_for_results(season_id, added=added, removed=removed)
+        recalculate_season_dominance(season_id, wrestler_ids)
+        return True
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error updating ratings for season {season_id}, rebuilding the season: {str(e)}")
+    try:
+        rebuild_season_ratings(season_id)
+        return True
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error rebuilding ratings for season {season_id}: {str(e)}")
+        return False
+
 
+# Shown when a match change was saved but its season's ratings could not be brought up to date
+RATINGS_STALE_MESSAGE = 'Ratings could not be updated; recalculate the season\'s Elo to refresh them.'
 
 
 @app.route('/add_match', methods=['GET', 'POST'])
@@ -1755,7 +3275,11 @@ def add_match():
             win_type = request.form['win_type']
             wrestler1_score = int(request.form['wrestler1_score'])  # Ensure this field exists
             wrestler2_score = int(request.form['wrestler2_score'])  # Ensure this field exists
-            season_id = int(request.form['season_id'])  # Get the season_id from the form
+            # Use the season chosen on the form, or the one whose dates cover the match
+            season_id = request.form.get('season_id', type=int) or season_index.get().season_for(date)
+            if season_id is None:
+                flash(f'No season covers {date.strftime("%Y-%m-%d")}.', 'error')
+                return redirect(url_for('add_match'))
 
             # Fetch wrestler data from the database
             wrestler1 = Wrestler.query.get(wrestler1_id)
@@ -1773,13 +3297,20 @@ def add_match():
                 flash('Wrestlers must be in the same weight class to compete.', 'error')
                 return redirect(url_for('add_match'))
 
-            # Check if a match already exists
-            existing_match = Match.query.filter_by(
+            # Check if the same result already exists (in either wrestler order)
+            backfill_match_fingerprints([season_id])
+            candidate = Match(
+                date=date,
                 wrestler1_id=wrestler1_id,
                 wrestler2_id=wrestler2_id,
-                date=date,
+                winner_id=winner_id,
+                win_type=win_type,
+                wrestler1_score=wrestler1_score,
+                wrestler2_score=wrestler2_score,
                 season_id=season_id
-            ).first()
+            )
+            candidate.calculate_win_type()
+            existing_match = Match.query.filter_by(fingerprint=candidate.calculate_fingerprint()).first()
 
             if existing_match:
                 flash(f'Match between {wrestler1.name} and {wrestler2.name} on {date.strftime("%Y-%m-%d")} already exists.', 'error')
@@ -1825,20 +3356,13 @@ def add_match():
 
             # Commit the new match and updates
             db.session.commit()
-
-            # Recalculate stats for both wrestlers with the season_id
-            recalculate_elo(wrestler1.id, season_id)
-            recalculate_elo(wrestler2.id, season_id)
-            recalculate_rpi(wrestler1.id, season_id)
-            recalculate_rpi(wrestler2.id, season_id)
-            recalculate_hybrid(wrestler1.id, season_id)
-            recalculate_hybrid(wrestler2.id, season_id)
-            recalculate_dominance(wrestler1.id, season_id)
-            recalculate_dominance(wrestler2.id, season_id)
-            recalculate_wrestler_stats(wrestler1.id, season_id)
-            recalculate_wrestler_stats(wrestler2.id, season_id)
-
             flash(f'Match added: {wrestler1.name} vs {wrestler2.name}', 'success')
+
+            # Replay Elo for the weight class from the match date, then recalculate the other stats
+            if not recompute_after_match_change(season_id, {wrestler1.weight_class: date},
+                                                added=[(wrestler1_id, wrestler2_id, winner_id)],
+                                                wrestler_ids=[wrestler1.id, wrestler2.id]):
+                flash(RATINGS_STALE_MESSAGE, 'warning')
             return redirect(url_for('home', season_id=season_id))
 
         except Exception as e:
@@ -1877,6 +3401,11 @@ def edit_match(match_id):
             # Log the incoming form data
             app.logger.info(f"Form Data: {request.form}")
 
+            # Remember where the match was before the edit so Elo can be replayed from there
+            old_date = match.date
+            old_weight_class = match.wrestler1.weight_class if match.wrestler1 else None
+            old_result = (match.wrestler1_id, match.wrestler2_id, match.winner_id)
+
             # Get form data
             match.date = datetime.strptime(request.form['date'], '%Y-%m-%d')
             match.wrestler1_id = int(request.form['wrestler1_id'])
@@ -1902,6 +3431,12 @@ def edit_match(match_id):
             else:
                 match.match_time = None
 
+            # Store the win type and flags as add_match does (flags cleared, then derived), so an
+            # edited match fingerprints the same as the same result added fresh
+            for flag in MATCH_RESULT_FLAGS:
+                setattr(match, flag, False)
+            match.calculate_win_type()
+
             # Include season_id from the form or fallback to the current match's season
             season_id = request.form.get('season_id', match.season_id)
             if season_id:
@@ -1919,6 +3454,19 @@ def edit_match(match_id):
                 flash('Wrestlers not found. Please verify the input.', 'error')
                 return redirect(url_for('edit_match', match_id=match.id, season_id=season_id))
 
+            # Refuse an edit that turns the match into a copy of another stored result
+            with db.session.no_autoflush:
+                duplicate = Match.query.filter(
+                    Match.fingerprint == match_fingerprint(match.season_id, match.wrestler1_id, match.wrestler2_id, match.date,
+                                                           match.wrestler1_score, match.wrestler2_score, new_winner_id,
+                                                           match.win_type),
+                    Match.id != match.id
+                ).first()
+            if duplicate:
+                db.session.rollback()
+                flash(f'This result already exists as match {duplicate.id}; the edit was not saved.', 'error')
+                return redirect(url_for('edit_match', match_id=match.id, season_id=season_id))
+
             # Revert old win/loss records
             old_winner = Wrestler.query.get(match.winner_id)
             old_loser = wrestler1 if old_winner == wrestler2 else wrestler2
@@ -1933,23 +3481,17 @@ def edit_match(match_id):
             new_loser.losses += 1
 
             db.session.commit()
-
-            # Recalculate stats for both wrestlers
-            recalculate_elo(wrestler1.id, season_id)
-            recalculate_elo(wrestler2.id, season_id)
-            recalculate_rpi(wrestler1.id, season_id)
-            recalculate_rpi(wrestler2.id, season_id)
-            recalculate_hybrid(wrestler1.id, season_id)
-            recalculate_hybrid(wrestler2.id, season_id)
-            recalculate_dominance(wrestler1.id, season_id)
-            recalculate_dominance(wrestler2.id, season_id)
-            recalculate_wrestler_stats(wrestler1.id, season_id)
-            recalculate_wrestler_stats(wrestler2.id, season_id)
-
-            # Commit all changes
-            db.session.commit()
-
             flash('Match has been updated.', 'success')
+
+            # Replay Elo from the earlier of the old and new match dates, in the old weight class too;
+            # RPI swaps the old result for the new one
+            replay_from = min(old_date, match.date)
+            weight_classes = {wrestler1.weight_class, old_weight_class} - {None}
+            if not recompute_after_match_change(match.season_id, dict.fromkeys(weight_classes, replay_from),
+                                                added=[(match.wrestler1_id, match.wrestler2_id, match.winner_id)],
+                                                removed=[old_result],
+                                                wrestler_ids=[wrestler1.id, wrestler2.id]):
+                flash(RATINGS_STALE_MESSAGE, 'warning')
             return redirect(url_for('wrestler_detail', wrestler_id=wrestler1.id, season_id=season_id))
 
         except Exception as e:
@@ -1980,7 +3522,8 @@ def edit_wrestler(wrestler_id):
         new_year_in_school = request.form['year_in_school']  # New field for year in school
 
         # Check if the weight class has changed
-        weight_class_changed = wrestler.weight_class != new_weight_class
+        old_weight_class = wrestler.weight_class
+        weight_class_changed = old_weight_class != new_weight_class
 
         # Update the wrestler's details
         wrestler.name = new_name
@@ -2006,6 +3549,9 @@ def edit_wrestler(wrestler_id):
 
         # Commit changes to the database
         try:
+            if weight_class_changed:
+                # The wrestler moves from one weight class ranking to another
+                refresh_rank_index(wrestler.season_id, [old_weight_class, new_weight_class])
             db.session.commit()
             flash(f'Wrestler {wrestler.name} has been updated.', 'success')
         except Exception as e:
@@ -2026,13 +3572,16 @@ def delete_wrestler(wrestler_id):
     wrestler = Wrestler.query.get_or_404(wrestler_id)
 
     # Get the current season ID from the request
-    current_season_id = request.args.get('season_id')  # Assuming you pass the current season ID in the query parameters
+    current_season_id = request.args.get('season_id', type=int)  # Assuming you pass the current season ID in the query parameters
 
     # Get matches for the current season
     matches = wrestler.matches_as_wrestler1.filter_by(season_id=current_season_id).all() + \
               wrestler.matches_as_wrestler2.filter_by(season_id=current_season_id).all()
 
-    # Adjust win/loss and stats for opponents in all matches
+    # Adjust win/loss records for opponents and note where each weight class must replay Elo from
+    opponent_ids = set()
+    replay_from = {}  # Opponent weight class -> earliest deleted match date
+    removed_results = []
     for match in matches:
         opponent = match.wrestler2 if match.wrestler1_id == wrestler.id else match.wrestler1
 
@@ -2041,23 +3590,27 @@ def delete_wrestler(wrestler_id):
         else:
             opponent.wins -= 1
 
-        # Recalculate stats for opponent
-        recalculate_elo(opponent.id, current_season_id)
-        recalculate_rpi(opponent.id, current_season_id)
-        recalculate_hybrid(opponent.id, current_season_id)
-        recalculate_dominance(opponent.id, current_season_id)
-
-        # Recalculate wrestler stats for opponents (still necessary)
-        recalculate_wrestler_stats(opponent.id, current_season_id)
+        opponent_ids.add(opponent.id)
+        replay_from[opponent.weight_class] = min(replay_from.get(opponent.weight_class, match.date), match.date)
+        removed_results.append((match.wrestler1_id, match.wrestler2_id, match.winner_id))
 
         # Delete the match from the database
         db.session.delete(match)
 
     # Delete the wrestler after processing their matches
+    wrestler_name, wrestler_season_id, wrestler_weight_class = wrestler.name, wrestler.season_id, wrestler.weight_class
     db.session.delete(wrestler)
     db.session.commit()
+    flash(f'Wrestler {wrestler_name} and all their matches in the current season have been deleted.', 'success')
+
+    # Replay the opponents' weight classes from the earliest deleted match through the checkpoints,
+    # then update Glicko, RPI and dominance; the remaining wrestlers' rank positions move up either way
+    if replay_from and not recompute_after_match_change(current_season_id, replay_from, removed=removed_results,
+                                                        wrestler_ids=opponent_ids):
+        flash(RATINGS_STALE_MESSAGE, 'warning')
+    refresh_rank_index(wrestler_season_id, [wrestler_weight_class])
+    db.session.commit()
 
-    flash(f'Wrestler {wrestler.name} and all their matches in the current season have been deleted.', 'success')
     return redirect(url_for('home', season_id=current_season_id))
 
 
@@ -2081,30 +3634,21 @@ def delete_match(match_id):
 
     # Determine the current season based on the match
     season_id = match.season_id  # Assuming each match has a season_id field
+    match_date = match.date
+    removed_result = (match.wrestler1_id, match.wrestler2_id, match.winner_id)
 
     # Delete the match from the database
     db.session.delete(match)
-
-    # Recalculate stats for both wrestlers after match deletion
-    recalculate_wrestler_stats(wrestler1.id, season_id)
-    recalculate_wrestler_stats(wrestler2.id, season_id)
-
-    # Recalculate Elo, RPI, Hybrid, and Dominance for both wrestlers
-    recalculate_elo(wrestler1.id, season_id)
-    recalculate_elo(wrestler2.id, season_id)
-    recalculate_rpi(wrestler1.id, season_id)
-    recalculate_rpi(wrestler2.id, season_id)
-    recalculate_hybrid(wrestler1.id, season_id)
-    recalculate_hybrid(wrestler2.id, season_id)
-    recalculate_dominance(wrestler1.id, season_id)
-    recalculate_dominance(wrestler2.id, season_id)
-
-    # Commit the changes to the database
     db.session.commit()
 
     # Flash a success message
     flash(f'Match between {wrestler1.name} and {wrestler2.name} has been deleted.', 'success')
 
+    # Replay Elo from the deleted match's date, then recalculate RPI, Hybrid, and Dominance
+    if not recompute_after_match_change(season_id, {wrestler1.weight_class: match_date}, removed=[removed_result],
+                                        wrestler_ids=[wrestler1.id, wrestler2.id]):
+        flash(RATINGS_STALE_MESSAGE, 'warning')
+
     # Get the wrestler_id and season_id from the request arguments, defaulting to wrestler1 if not provided
     wrestler_id = request.args.get('wrestler_id', default=wrestler1.id)
     season_id = request.args.get('season_id')
@@ -2197,51 +3741,573 @@ def normalize_name(name):
 
 
 
-def get_or_create_wrestler(name, school, weight_class, season_id):
+# Columns every upload file must provide
+CSV_REQUIRED_HEADERS = ['Date', 'Wrestler1', 'School1', 'Wrestler2', 'School2', 'WeightClass', 'Wrestler1_Score', 'Wrestler2_Score', 'Winner', 'WinType', 'Match_Time']
+
+# Accepted WinType spellings and the Match flag each one sets
+CSV_WIN_TYPE_FLAGS = {
+    'decision': 'decision',
+    'dec': 'decision',
+    'major decision': 'major_decision',
+    'major': 'major_decision',
+    'fall': 'fall',
+    'pin': 'fall',
+    'technical fall': 'technical_fall',
+    'tech fall': 'technical_fall',
+    'injury default': 'injury_default',
+    'injury': 'injury_default',
+    'sudden victory': 'sudden_victory',
+    'sv-1': 'sudden_victory',
+    'sudden victory - 1': 'sudden_victory',
+    'tiebreaker': 'tiebreaker_1',
+    'tie breaker': 'tiebreaker_1',
+    'tb-1': 'tiebreaker_1',
+    'tb-2': 'tiebreaker_2',
+    'tiebreaker - 1': 'tiebreaker_1',
+    'tiebreaker - 2 (riding time)': 'tiebreaker_2',
+    'medical forfeit': 'medical_forfeit',
+    'med forfeit': 'medical_forfeit',
+    'disqualification': 'disqualification',
+    'dq': 'disqualification'
+}
+
+MATCH_RESULT_FLAGS = ['decision', 'major_decision', 'fall', 'technical_fall', 'injury_default', 'sudden_victory',
+                      'double_overtime', 'tiebreaker_1', 'tiebreaker_2', 'medical_forfeit', 'disqualification']
+
+
+def d3_team_lookup():
+    # Lowercased official D3 school names and aliases, for validating uploaded schools
+    lookup = {normalize_school_name(school).lower() for school in D3_WRESTLING_SCHOOLS.keys()}
+    for aliases in SCHOOL_ALIASES.values():
+        lookup.update(normalize_school_name(alias).lower() for alias in aliases)
+    return lookup
+
+
+def parse_csv_row(row_num, row, seasons, team_lookup):
     """
-    This function normalizes the name and school, checks for an existing wrestler
-    in the given season, and creates a new one if none exists.
+    Validates one upload row without touching the database.
+
+    `seasons` is a SeasonIntervals snapshot and `team_lookup` the result of d3_team_lookup().
+    Returns (parsed, None) for a valid row or (None, feedback) otherwise.
     """
-    # Normalize the wrestler's name with aliases and capitalization
-    name = normalize_name(name)  # Use the global normalization function
-    name = name.strip().title()  # Further normalize the name if needed
+    try:
+        # Process each field and strip whitespace
+        wrestler1_name = row['Wrestler1'].strip()
+        school1_name = normalize_school_name(row['School1'].strip()).lower()
+        wrestler2_name = row['Wrestler2'].strip()
+        school2_name = normalize_school_name(row['School2'].strip()).lower()
+        weight_class = int(row['WeightClass'].strip())
+        wrestler1_score = int(row['Wrestler1_Score'].strip())
+        wrestler2_score = int(row['Wrestler2_Score'].strip())
+        winner_name = row['Winner'].strip()
+        win_type = row['WinType'].strip().lower()
+
+        # Validate D3 school status for both wrestlers
+        if school1_name not in team_lookup or school2_name not in team_lookup:
+            return None, f"Row {row_num}: Match not uploaded because one or both teams are not Division 3 (School1: {school1_name}, School2: {school2_name})."
 
-    # Normalize the school name using the alias normalization function
-    school = normalize_school_name(school)
+        try:
+            match_date = parse_date(row['Date'])
+        except ValueError as e:
+            return None, f"Row {row_num}: Invalid date format '{row['Date']}' ({str(e)})."
+
+        # Assign the season based on the match date
+        season_id = seasons.season_for(match_date)
+        if season_id is None:
+            return None, f"Row {row_num}: No matching season found for date {match_date}."
+
+        if win_type not in CSV_WIN_TYPE_FLAGS:
+            valid_win_types = ", ".join(CSV_WIN_TYPE_FLAGS.keys())
+            return None, f"Row {row_num}: Unrecognized win type '{win_type}'. Valid win types are: {valid_win_types}."
+        win_flags = dict.fromkeys(MATCH_RESULT_FLAGS, False)
+        win_flags[CSV_WIN_TYPE_FLAGS[win_type]] = True
+
+        # Match time is only recorded for falls and technical falls
+        match_time = None
+        if win_flags['fall'] or win_flags['technical_fall']:
+            try:
+                match_time = datetime.strptime(row['Match_Time'].strip(), '%M:%S').time()
+            except ValueError:
+                return None, f"Row {row_num}: Invalid match time format for '{win_type}' win type."
 
-    # Attempt to find a wrestler in the database for the specific season to prevent duplicates
-    wrestler = Wrestler.query.filter(
-        db.func.lower(Wrestler.name) == name.lower(),
-        db.func.lower(Wrestler.school) == school.lower(),
-        Wrestler.weight_class == int(weight_class),
-        Wrestler.season_id == season_id  # Ensure the wrestler is tied to the correct season
-    ).first()
+        if weight_class not in WEIGHT_CLASSES:
+            return None, f"Row {row_num}: Invalid weight class '{weight_class}'."
 
-    if not wrestler:
-        # If no match found, log the new wrestler creation and create a new record
-        app.logger.info(f"Creating new wrestler: {name} from {school} for season {season_id}")
-        wrestler = Wrestler(
-            name=name, 
-            school=school, 
-            weight_class=int(weight_class), 
-            season_id=season_id,  # Assign to the given season
-            wins=0, 
-            losses=0, 
-            elo_rating=1500,  # Default Elo rating
-            rpi=0.0,
-            dominance_score=0.0,  # Initialize other stats
-            falls=0,  # Initialize falls
-            tech_falls=0,  # Initialize tech falls
-            major_decisions=0  # Initialize major decisions
+        if not all([wrestler1_name, school1_name, wrestler2_name, school2_name, winner_name]):
+            return None, f"Row {row_num}: Missing required fields."
+
+        # Wrestlers are stored under their normalized names, so the winner is checked against those
+        wrestler1_normalized = normalize_name(wrestler1_name)
+        wrestler2_normalized = normalize_name(wrestler2_name)
+        winner_normalized = winner_name.lower()
+        if winner_normalized not in (wrestler1_normalized.lower(), wrestler2_normalized.lower()):
+            closest_matches = difflib.get_close_matches(winner_name, [wrestler1_normalized, wrestler2_normalized], n=1)
+            suggestion = f"Did you mean '{closest_matches[0]}'?" if closest_matches else "No close match found."
+            return None, f"Row {row_num}: Winner '{winner_name}' does not match wrestler1 or wrestler2. {suggestion}"
+
+        return {
+            'row_num': row_num,
+            'season_id': season_id,
+            'weight_class': weight_class,
+            'date': match_date,
+            'wrestler1': (wrestler1_normalized, normalize_school_name(school1_name)),
+            'wrestler2': (wrestler2_normalized, normalize_school_name(school2_name)),
+            'wrestler1_won': winner_normalized == wrestler1_normalized.lower(),
+            'wrestler1_score': wrestler1_score,
+            'wrestler2_score': wrestler2_score,
+            'match_time': match_time,
+            'win_flags': win_flags,
+            'display_names': (wrestler1_name, wrestler2_name),
+            'win_type': win_type
+        }, None
+
+    except Exception as e:
+        return None, (
+            f"Row {row_num}: Error processing match for '{row.get('Wrestler1')}' (Weight Class: {row.get('WeightClass')}) "
+            f"vs '{row.get('Wrestler2')}' (Weight Class: {row.get('WeightClass')}) ({str(e)})."
+        )
+
+
+# Starting values for wrestlers created by an upload
+NEW_WRESTLER_DEFAULTS = {
+    'wins': 0,
+    'losses': 0,
+    'elo_rating': 1500,  # Default Elo rating
+    'rpi': 0.0,
+    'dominance_score': 0.0,
+    'falls': 0,
+    'tech_falls': 0,
+    'major_decisions': 0
+}
+
+# Legacy per-wrestler counters kept up to date by match writes
+WRESTLER_COUNTER_COLUMNS = ['wins', 'losses', 'falls', 'tech_falls', 'major_decisions']
+
+
+def wrestler_key(name, school, weight_class, season_id):
+    # Identity used to match uploaded wrestlers to existing ones (case-insensitive name and school)
+    return name.lower(), school.lower(), int(weight_class), season_id
+
+
+class WrestlerIdentityMap:
+    """
+    Wrestlers of a set of seasons keyed by wrestler_key, loaded with one query.
+
+    Names are looked up in memory. Wrestlers that are not found are created as transient objects
+    and only inserted by add_new(), with one multi-row INSERT. When several stored wrestlers share
+    a key, the lowest ID wins.
+    """
+
+    def __init__(self, season_ids, weight_classes=None):
+        self.by_key = {}
+        self.new = []
+        query = Wrestler.query.filter(Wrestler.season_id.in_(season_ids))
+        if weight_classes is not None:
+            query = query.filter(Wrestler.weight_class.in_(weight_classes))
+        for wrestler in query.order_by(Wrestler.id):
+            self.by_key.setdefault(wrestler_key(wrestler.name, wrestler.school, wrestler.weight_class, wrestler.season_id), wrestler)
+
+    def get_or_create(self, name, school, weight_class, season_id):
+        """Returns the wrestler for the normalized name and school, creating it in memory if needed."""
+        key = wrestler_key(name, school, weight_class, season_id)
+        wrestler = self.by_key.get(key)
+        if wrestler is None:
+            wrestler = Wrestler(name=name, school=school, weight_class=int(weight_class), season_id=season_id,
+                                **NEW_WRESTLER_DEFAULTS)
+            self.by_key[key] = wrestler
+            self.new.append(wrestler)
+        return wrestler
+
+    def add_new(self):
+        """
+        Inserts the wrestlers created so far with one multi-row INSERT, sets their IDs and
+        returns them. Runs in the caller's transaction.
+        """
+        if not self.new:
+            return []
+        created, self.new = self.new, []
+        rows = db.session.execute(
+            db.insert(Wrestler).returning(Wrestler.id, Wrestler.name, Wrestler.school, Wrestler.weight_class, Wrestler.season_id),
+            [dict(name=wrestler.name, school=wrestler.school, weight_class=wrestler.weight_class,
+                  season_id=wrestler.season_id, **NEW_WRESTLER_DEFAULTS) for wrestler in created]
+        )
+        # RETURNING order is not guaranteed, so IDs are matched back by key
+        for wrestler_id, *identity in rows:
+            self.by_key[wrestler_key(*identity)].id = wrestler_id
+        app.logger.info(f"Created {len(created)} new wrestlers")
+        return [wrestler.id for wrestler in created]
+
+
+def file_sha256(file):
+    # Hashes a binary file object in chunks and rewinds it for parsing
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: file.read(64 * 1024), b''):
+        digest.update(chunk)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+def validate_csv_rows(rows, seasons, team_lookup):
+    """Runs parse_csv_row over (row_num, row) pairs; picklable so it can run in the validation pool."""
+    return [(row_num, *parse_csv_row(row_num, row, seasons, team_lookup)) for row_num, row in rows]
+
+
+class ValidationPool:
+    """
+    Process pool that validates CSV rows off the importing thread, so parsing large uploads
+    scales with cores. Workers are spawned rather than forked because imports run on
+    background threads; they only parse rows and never touch the database.
+    """
+
+    def __init__(self, workers=1):
+        self.workers = workers
+        self.executor = None
+        self.lock = threading.Lock()
+
+    def map(self, batches, seasons, team_lookup):
+        """Yields each batch's validate_csv_rows result in order, keeping a bounded number in flight."""
+        with self.lock:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context('spawn'))
+        pending = deque()
+        try:
+            for batch in batches:
+                pending.append(self.executor.submit(validate_csv_rows, batch, seasons, team_lookup))
+                if len(pending) > self.workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+validation_pool = ValidationPool(app.config.get('CSV_VALIDATION_WORKERS', 1))
+
+
+def validated_csv_rows(numbered_rows, seasons, team_lookup):
+    """
+    Yields (row_num, parsed, error) for each (row_num, row) pair in file order. Rows are
+    validated in batches on the validation pool once a file spans more than one batch.
+    """
+    batch_rows = app.config.get('CSV_VALIDATION_BATCH_ROWS', 1000)
+    batches = iter(lambda: list(islice(numbered_rows, batch_rows)), [])
+    first_batch = next(batches, [])
+    batches = chain([first_batch], batches)
+    if validation_pool.workers <= 1 or len(first_batch) < batch_rows:
+        for batch in batches:
+            yield from validate_csv_rows(batch, seasons, team_lookup)
+    else:
+        for results in validation_pool.map(batches, seasons, team_lookup):
+            yield from results
+
+
+# Parse progress is reported every this many rows
+CSV_PROGRESS_EVERY = 500
+
+# Serializes the write stages of concurrent imports within one worker process. Imports in
+# different processes are not serialized: a match both insert is still rejected by its unique
+# fingerprint, but both may create the same new wrestler
+csv_import_lock = threading.Lock()
+
+
+def csv_import_outcome(success, message, category, report_id=None, feedback=None, preview=None):
+    # Result of validate_and_process_csv; the caller decides how to show `message`
+    return {'success': success, 'message': message, 'category': category,
+            'report_id': report_id, 'feedback': feedback or [], 'preview': preview}
+
+
+def added_match_feedback(row, dry_run=False):
+    wrestler1_name, wrestler2_name = row['display_names']
+    outcome = 'would be added' if dry_run else 'added'
+    return (
+        f"Row {row['row_num']}: Match {outcome} successfully: '{wrestler1_name}' (Weight Class: {row['weight_class']}) "
+        f"vs '{wrestler2_name}' (Weight Class: {row['weight_class']}) with win type '{row['win_type']}'."
+    )
+
+
+def resolve_csv_rows(parsed_rows, feedback, backfill=True):
+    """
+    Resolves parsed rows to wrestlers and drops duplicates, without writing anything except
+    the fingerprint backfill (skipped with `backfill=False`). Duplicate rows get their
+    feedback in `feedback`.
+
+    Returns (identity_map, new_matches, skipped_duplicates); new_matches holds (row, match,
+    wrestler1, wrestler2) with transient matches and possibly transient wrestlers.
+    """
+    # Resolve wrestlers in memory, then find duplicates within the chunk by fingerprinting
+    # wrestler keys and against stored matches with one fingerprint lookup
+    skipped_duplicates = 0
+    candidates = []
+    file_fingerprints = set()
+    season_ids = {row['season_id'] for row in parsed_rows}
+    if backfill and parsed_rows:
+        backfill_match_fingerprints(season_ids)
+    identity_map = WrestlerIdentityMap(season_ids, {row['weight_class'] for row in parsed_rows})
+    for row in parsed_rows:
+        wrestler1 = identity_map.get_or_create(*row['wrestler1'], row['weight_class'], row['season_id'])
+        wrestler2 = identity_map.get_or_create(*row['wrestler2'], row['weight_class'], row['season_id'])
+
+        # Build a transient Match so the stored win type and flags are computed as on insert;
+        # IDs of new wrestlers are filled in once they are inserted
+        match = Match(
+            date=row['date'],
+            win_type=row['win_type'],
+            wrestler1_score=row['wrestler1_score'],
+            wrestler2_score=row['wrestler2_score'],
+            match_time=row['match_time'],
+            season_id=row['season_id'],
+            **row['win_flags']
         )
-        db.session.add(wrestler)
+        match.calculate_win_type()
+
+        key1 = wrestler_key(*row['wrestler1'], row['weight_class'], row['season_id'])
+        key2 = wrestler_key(*row['wrestler2'], row['weight_class'], row['season_id'])
+        file_fingerprint = match_fingerprint(row['season_id'], key1, key2, row['date'], match.wrestler1_score,
+                                             match.wrestler2_score, key1 if row['wrestler1_won'] else key2, match.win_type)
+        if file_fingerprint in file_fingerprints:
+            feedback[row['row_num']] = f"Row {row['row_num']}: Duplicate match detected (already exists)."
+            skipped_duplicates += 1
+            continue
+        file_fingerprints.add(file_fingerprint)
+
+        # Only results between two stored wrestlers can already exist
+        if wrestler1.id is not None and wrestler2.id is not None:
+            match.wrestler1_id = wrestler1.id
+            match.wrestler2_id = wrestler2.id
+            match.winner_id = wrestler1.id if row['wrestler1_won'] else wrestler2.id
+            match.calculate_fingerprint()
+        candidates.append((row, match, wrestler1, wrestler2))
+
+    stored_fingerprints = [match.fingerprint for _, match, _, _ in candidates if match.fingerprint]
+    existing_fingerprints = set(db.session.scalars(
+        db.select(Match.fingerprint).where(Match.fingerprint.in_(stored_fingerprints))
+    )) if stored_fingerprints else set()
+    new_matches = []
+    for candidate in candidates:
+        row, match = candidate[:2]
+        if match.fingerprint in existing_fingerprints:
+            feedback[row['row_num']] = f"Row {row['row_num']}: Duplicate match detected (already exists)."
+            skipped_duplicates += 1
+        else:
+            new_matches.append(candidate)
+    return identity_map, new_matches, skipped_duplicates
+
+
+def simulate_weight_class_rankings(season_id, weight_class, new_matches, k_factor=32):
+    """
+    Replays one weight class's season in memory with `new_matches` (from resolve_csv_rows)
+    added, writing nothing. Returns the wrestlers whose Elo rank would change, and any new
+    wrestlers, ordered by new rank.
+    """
+    wrestlers = Wrestler.query.filter_by(season_id=season_id, weight_class=weight_class).order_by(Wrestler.id).all()
+    index = {wrestler.id: i for i, wrestler in enumerate(wrestlers)}
+    # New wrestlers have no ID yet, so they are placed by object identity after the stored ones
+    position = {id(wrestler): i for i, wrestler in enumerate(wrestlers)}
+    for _, _, wrestler1, wrestler2 in new_matches:
+        for wrestler in (wrestler1, wrestler2):
+            if id(wrestler) not in position:
+                position[id(wrestler)] = len(wrestlers)
+                wrestlers.append(wrestler)
+
+    _, dates, wrestler1_ids, wrestler2_ids, winner_ids = load_season_match_arrays(season_id, weight_class)
+    idx1 = np.array([index.get(w, -1) for w in wrestler1_ids.tolist()], dtype=np.int64)
+    idx2 = np.array([index.get(w, -1) for w in wrestler2_ids.tolist()], dtype=np.int64)
+    valid = (idx1 >= 0) & (idx2 >= 0)
+    actual1 = (winner_ids[valid] == wrestler1_ids[valid]).astype(np.float64)
+
+    # New matches sort after stored ones on the same date, as their higher IDs would
+    dates = np.concatenate([dates[valid], np.array([row['date'] for row, *_ in new_matches], dtype='datetime64[s]')])
+    idx1 = np.concatenate([idx1[valid], np.array([position[id(w1)] for _, _, w1, _ in new_matches], dtype=np.int64)])
+    idx2 = np.concatenate([idx2[valid], np.array([position[id(w2)] for _, _, _, w2 in new_matches], dtype=np.int64)])
+    actual1 = np.concatenate([actual1, np.array([float(row['wrestler1_won']) for row, *_ in new_matches])])
+    order = np.argsort(dates, kind='stable')
+
+    ratings = np.array([wrestler.season_start_elo or 1500 for wrestler in wrestlers], dtype=np.float64)
+    replay_elo(ratings, idx1[order], idx2[order], actual1[order], k_factor)
+
+    stored = range(len(index))
+    old_order = sorted(stored, key=lambda i: (-(wrestlers[i].elo_rating or 1500), i))
+    old_rank = {i: rank for rank, i in enumerate(old_order, start=1)}
+    new_order = sorted(range(len(wrestlers)), key=lambda i: (-ratings[i], i))
+    changes = []
+    for rank, i in enumerate(new_order, start=1):
+        if old_rank.get(i) == rank:
+            continue
+        wrestler = wrestlers[i]
+        changes.append({
+            'wrestler_id': wrestler.id,
+            'name': wrestler.name,
+            'school': wrestler.school,
+            'old_rank': old_rank.get(i),
+            'new_rank': rank,
+            'old_elo': wrestler.elo_rating if i in old_rank else None,
+            'new_elo': round(float(ratings[i]), 1),
+        })
+    return changes
+
+
+def preview_csv_rows(parsed_rows, feedback, timings):
+    """
+    Dry run of import_csv_chunk: resolves and de-duplicates the rows and simulates the Elo
+    rankings they would produce, all in memory. Each row's outcome is added to `feedback`.
+
+    Returns (added, skipped_duplicates, new_wrestlers, ranking_changes).
+    """
+    stage_start = perf_counter()
+    # Without the backfill, stored matches that predate fingerprints are not checked for duplicates
+    identity_map, new_matches, skipped_duplicates = resolve_csv_rows(parsed_rows, feedback, backfill=False)
+    for row, *_ in new_matches:
+        feedback[row['row_num']] = added_match_feedback(row, dry_run=True)
+    new_wrestlers = [
+        {'name': wrestler.name, 'school': wrestler.school, 'weight_class': wrestler.weight_class, 'season_id': wrestler.season_id}
+        for wrestler in identity_map.new
+    ]
+    timings['resolve'] = timings.get('resolve', 0) + perf_counter() - stage_start
+
+    stage_start = perf_counter()
+    by_weight_class = defaultdict(list)
+    for new_match in new_matches:
+        row = new_match[0]
+        by_weight_class[(row['season_id'], row['weight_class'])].append(new_match)
+    ranking_changes = [
+        {'season_id': season_id, 'weight_class': weight_class,
+         'wrestlers': simulate_weight_class_rankings(season_id, weight_class, matches)}
+        for (season_id, weight_class), matches in sorted(by_weight_class.items())
+    ]
+    timings['simulate'] = perf_counter() - stage_start
+    return len(new_matches), skipped_duplicates, new_wrestlers, ranking_changes
+
+
+def import_csv_chunk(parsed_rows, feedback, timings, report_id=None):
+    """
+    Resolves, de-duplicates and inserts one chunk of parsed rows in a single transaction, then
+    commits it. Each row's outcome is added to `feedback`. With `report_id` (streaming uploads)
+    the chunk's feedback, including earlier parse errors, is written to csv_upload_feedback in
+    the same transaction and `feedback` is cleared.
+
+    Returns (added, skipped_duplicates, created_wrestler_ids); added holds (row, match_id,
+    wrestler1_id, wrestler2_id, winner_id) for each inserted match. Streaming uploads also
+    record the created wrestlers on their report in the chunk's transaction. Raises after
+    rolling back if the chunk can't be saved.
+    """
+    stage_start = perf_counter()
+    identity_map, new_matches, skipped_duplicates = resolve_csv_rows(parsed_rows, feedback)
+    timings['resolve'] = timings.get('resolve', 0) + perf_counter() - stage_start
+
+    # Insert new wrestlers, every new match and the wrestlers' counters in one transaction
+    stage_start = perf_counter()
+    added = []
+    created_wrestler_ids = []
+    counter_deltas = defaultdict(Counter)  # Wrestler ID -> WRESTLER_COUNTER_COLUMNS increments
+    try:
+        if new_matches:
+            created_wrestler_ids = identity_map.add_new()
+            for row, match, wrestler1, wrestler2 in new_matches:
+                match.wrestler1_id = wrestler1.id
+                match.wrestler2_id = wrestler2.id
+                match.winner_id = wrestler1.id if row['wrestler1_won'] else wrestler2.id
+                match.calculate_fingerprint()
+            # A Core INSERT keeps rows with and without match_time in one multi-row statement;
+            # RETURNING order is not guaranteed, so IDs are matched back by fingerprint
+            table = Match.__table__
+            columns = [column.key for column in table.columns if column.key != 'id']
+            match_id_by_fingerprint = dict(db.session.execute(
+                db.insert(table).returning(table.c.fingerprint, table.c.id),
+                [{column: getattr(match, column) for column in columns} for _, match, _, _ in new_matches]
+            ).all())
+
+        for row, match, wrestler1, wrestler2 in new_matches:
+            winner, loser = (wrestler1, wrestler2) if row['wrestler1_won'] else (wrestler2, wrestler1)
+            counter_deltas[winner.id]['wins'] += 1
+            counter_deltas[loser.id]['losses'] += 1
+            if match.fall:
+                counter_deltas[winner.id]['falls'] += 1
+            if match.technical_fall:
+                counter_deltas[winner.id]['tech_falls'] += 1
+            if match.major_decision:
+                counter_deltas[winner.id]['major_decisions'] += 1
+
+            added.append((row, match_id_by_fingerprint[match.fingerprint], wrestler1.id, wrestler2.id, winner.id))
+            feedback[row['row_num']] = added_match_feedback(row)
+
+        # Apply the counter increments atomically, all wrestlers in one executemany
+        if counter_deltas:
+            table = Wrestler.__table__
+            db.session.execute(
+                db.update(table)
+                .where(table.c.id == db.bindparam('wrestler_id'))
+                .values({column: func.coalesce(table.c[column], 0) + db.bindparam(f'add_{column}')
+                         for column in WRESTLER_COUNTER_COLUMNS}),
+                [{'wrestler_id': wrestler_id, **{f'add_{column}': deltas[column] for column in WRESTLER_COUNTER_COLUMNS}}
+                 for wrestler_id, deltas in counter_deltas.items()]
+            )
+
+        if report_id is not None and feedback:
+            match_id_by_row = {row['row_num']: match_id for row, match_id, _, _, _ in added}
+            db.session.execute(
+                db.insert(CSVUploadFeedback.__table__),
+                [{'report_id': report_id, 'row_num': row_num, 'message': message, 'match_id': match_id_by_row.get(row_num)}
+                 for row_num, message in sorted(feedback.items())]
+            )
+            feedback.clear()
+        if report_id is not None and created_wrestler_ids:
+            table = CSVUploadReport.__table__
+            stored = db.session.execute(db.select(table.c.wrestler_ids).where(table.c.id == report_id)).scalar()
+            db.session.execute(
+                db.update(table).where(table.c.id == report_id)
+                .values(wrestler_ids=json.dumps(json_id_list(stored) + created_wrestler_ids))
+            )
+
+        # The bulk INSERTs bypass the mapper events, so mark the seasons here
+        for season_id in {row['season_id'] for row, *_ in added}:
+            mark_matches_changed(season_id)
         db.session.commit()
-    
-    return wrestler
+    except Exception as e:
+        db.session.rollback()
+        logging.error(f"Error inserting CSV matches: {str(e)}")
+        raise
+    timings['insert'] = timings.get('insert', 0) + perf_counter() - stage_start
+    return added, skipped_duplicates, created_wrestler_ids
 
 
-def validate_and_process_csv(file, user_id=None):  # Optionally pass the user ID
+def validate_and_process_csv(file, user_id=None, progress=None, streaming=False, dry_run=False):
+    """
+    Imports a match CSV (a binary file object) in stages: parse and validate the rows (on the
+    validation pool for files over one batch), resolve wrestlers and duplicates in bulk,
+    insert the new matches with one bulk INSERT in a single transaction, then recompute each
+    affected season's derived stats once. Stage timings are logged and stored on the
+    CSVUploadReport.
+
+    With `streaming`, the file is read and imported CSV_CHUNK_ROWS rows at a time, one
+    transaction per chunk, and feedback is written to csv_upload_feedback as each chunk
+    commits, so memory use does not grow with the file. Chunks committed before a failing
+    one stay imported and are recomputed and reported as usual.
+
+    With `dry_run`, nothing is written: the rows are validated and resolved as above, the
+    new matches' effect on Elo rankings is simulated in memory, and the outcome's `preview`
+    holds the report a real import would save, plus the wrestlers it would create and the
+    rank changes.
+
+    A file identical to one already imported (and not reverted) is skipped without parsing.
+    `progress(stage, rows_processed, row_errors)` is called as the import advances, never while
+    the import holds uncommitted writes. Returns a csv_import_outcome dict.
+    """
     try:
+        timings = {}
+        stage_start = perf_counter()
+
+        file_hash = file_sha256(file)
+        previous_upload = CSVUploadReport.query.filter_by(file_hash=file_hash, is_reverted=False).first()
+        if previous_upload:
+            return csv_import_outcome(
+                False,
+                f"This file was already uploaded on {previous_upload.uploaded_at.strftime('%Y-%m-%d %H:%M')} "
+                f"(report {previous_upload.id}); nothing was imported.",
+                'warning',
+                report_id=previous_upload.id
+            )
+
         csv_file = TextIOWrapper(file, encoding='utf-8')
         csv_reader = csv.DictReader(csv_file)
 
@@ -2249,280 +4315,386 @@ def validate_and_process_csv(file, user_id=None):  # Optionally pass the user ID
         csv_reader.fieldnames = [header.strip() for header in csv_reader.fieldnames]
 
         # Ensure required columns exist
-        required_headers = ['Date', 'Wrestler1', 'School1', 'Wrestler2', 'School2', 'WeightClass', 'Wrestler1_Score', 'Wrestler2_Score', 'Winner', 'WinType', 'Match_Time']
-        missing_headers = list(set(required_headers).difference(set(csv_reader.fieldnames)))
+        missing_headers = list(set(CSV_REQUIRED_HEADERS).difference(set(csv_reader.fieldnames)))
         if missing_headers:
-            flash(f"Missing required columns in CSV: {', '.join(missing_headers)}", 'error')
             logging.error(f"Missing columns: {missing_headers}")
-            return False
+            return csv_import_outcome(False, f"Missing required columns in CSV: {', '.join(missing_headers)}", 'error')
+
+        # Streaming uploads get their report up front so feedback rows can point at it
+        streaming = streaming and not dry_run
+        upload_report = None
+        if streaming:
+            upload_report = CSVUploadReport(user_id=user_id, detailed_feedback=json.dumps([]), match_ids=json.dumps([]),
+                                            streamed=True)
+            db.session.add(upload_report)
+            db.session.commit()
 
-        # Initialize counters and lists to collect feedback
-        added_matches = 0
-        skipped_duplicates = 0
+        # Feedback is keyed by row number so it reads in file order whichever stage produced it
+        feedback = {}
+        rows_read = 0
         row_errors = 0
-        detailed_feedback = []
-        match_ids = []  # List to track added match IDs
-
-        # Flatten D3 team and alias lookup for validation (case insensitive)
-        D3_TEAM_LOOKUP = {normalize_school_name(school).lower() for school in D3_WRESTLING_SCHOOLS.keys()}
-        for aliases in SCHOOL_ALIASES.values():
-            D3_TEAM_LOOKUP.update(normalize_school_name(alias).lower() for alias in aliases)
-
-        # Process rows
-        for row_num, row in enumerate(csv_reader, start=1):
+        skipped_duplicates = 0
+        added_matches = 0
+        match_ids = []
+        wrestler_ids = []  # Wrestlers created by the non-streaming import, for its report
+        elo_replay_from = {}  # Earliest new match date per (season_id, weight_class)
+        rpi_results = defaultdict(list)  # New (wrestler1_id, wrestler2_id, winner_id) results per season
+        touched_wrestlers = defaultdict(set)
+        chunk_error = None
+        rows_committed = 0
+        new_wrestlers = []
+        ranking_changes = []
+
+        seasons = season_index.get()
+        team_lookup = d3_team_lookup()
+        validated_rows = validated_csv_rows(enumerate(csv_reader, start=1), seasons, team_lookup)
+        chunk_rows = app.config.get('CSV_CHUNK_ROWS', 2000) if streaming else None
+        timings['parse'] = perf_counter() - stage_start
+
+        while True:
             try:
-                # Process each field and strip whitespace
-                wrestler1_name = row['Wrestler1'].strip()
-                school1_name = normalize_school_name(row['School1'].strip()).lower()  # Normalize and lowercase school names
-                wrestler2_name = row['Wrestler2'].strip()
-                school2_name = normalize_school_name(row['School2'].strip()).lower()  # Normalize and lowercase school names
-                weight_class = int(row['WeightClass'].strip())
-                wrestler1_score = int(row['Wrestler1_Score'].strip())
-                wrestler2_score = int(row['Wrestler2_Score'].strip())
-                winner_name = row['Winner'].strip()
-                win_type = row['WinType'].strip().lower()  # Convert to lowercase for consistency
-
-                # Validate D3 school status for both wrestlers
-                if school1_name not in D3_TEAM_LOOKUP or school2_name not in D3_TEAM_LOOKUP:
-                    detailed_feedback.append(
-                        f"Row {row_num}: Match not uploaded because one or both teams are not Division 3 (School1: {school1_name}, School2: {school2_name})."
-                    )
-                    row_errors += 1
-                    continue
-
-                # Parse the date using the flexible date parsing function
-                try:
-                    raw_date = row['Date']
-                    match_date = parse_date(raw_date)  # Use the parse_date function
-                except ValueError as e:
-                    detailed_feedback.append(f"Row {row_num}: Invalid date format '{raw_date}' ({str(e)}).")
-                    row_errors += 1
-                    continue
-
-                # Assign the correct season based on the match date
-                season = Season.query.filter(Season.start_date <= match_date, Season.end_date >= match_date).first()
-                if not season:
-                    detailed_feedback.append(f"Row {row_num}: No matching season found for date {match_date}.")
-                    row_errors += 1
-                    continue
-
-                season_id = season.id  # Define season_id here
-
-                # Initialize flags for different types of wins
-                match_time = None
-                win_flags = {
-                    "decision": False,
-                    "major_decision": False,
-                    "fall": False,
-                    "technical_fall": False,
-                    "injury_default": False,
-                    "sudden_victory": False,
-                    "double_overtime": False,
-                    "tiebreaker_1": False,
-                    "tiebreaker_2": False,
-                    "medical_forfeit": False,
-                    "disqualification": False,
-                }
-
-                # Handle win types and match times
-                win_type_mapping = {
-                    'decision': 'decision',
-                    'dec': 'decision',
-                    'major decision': 'major_decision',
-                    'major': 'major_decision',
-                    'fall': 'fall',
-                    'pin': 'fall',
-                    'technical fall': 'technical_fall',
-                    'tech fall': 'technical_fall',
-                    'injury default': 'injury_default',
-                    'injury': 'injury_default',
-                    'sudden victory': 'sudden_victory',
-                    'sv-1': 'sudden_victory',
-                    'sudden victory - 1': 'sudden_victory',
-                    'tiebreaker': 'tiebreaker_1',
-                    'tie breaker': 'tiebreaker_1',
-                    'tb-1': 'tiebreaker_1',
-                    'tb-2': 'tiebreaker_2',
-                    'tiebreaker - 1': 'tiebreaker_1',
-                    'tiebreaker - 2 (riding time)': 'tiebreaker_2',
-                    'medical forfeit': 'medical_forfeit',
-                    'med forfeit': 'medical_forfeit',
-                    'disqualification': 'disqualification',
-                    'dq': 'disqualification'
-                }
-
-                if win_type in win_type_mapping:
-                    win_flags[win_type_mapping[win_type]] = True
-
-                    # Match time handling for fall and technical fall
-                    if win_flags["fall"] or win_flags["technical_fall"]:
-                        try:
-                            match_time = datetime.strptime(row['Match_Time'].strip(), '%M:%S').time()
-                        except ValueError:
-                            detailed_feedback.append(f"Row {row_num}: Invalid match time format for '{win_type}' win type.")
-                            row_errors += 1
-                            continue
-                else:
-                    valid_win_types = ", ".join(win_type_mapping.keys())
-                    detailed_feedback.append(f"Row {row_num}: Unrecognized win type '{win_type}'. Valid win types are: {valid_win_types}.")
-                    row_errors += 1
-                    continue
-
-                # Validate weight class
-                if weight_class not in WEIGHT_CLASSES:
-                    detailed_feedback.append(f"Row {row_num}: Invalid weight class '{weight_class}'.")
-                    row_errors += 1
-                    continue
-
-                # Validate other fields
-                if not all([wrestler1_name, school1_name, wrestler2_name, school2_name, winner_name]):
-                    detailed_feedback.append(f"Row {row_num}: Missing required fields.")
-                    row_errors += 1
-                    continue
-
-                # Get or create wrestlers for the season
-                wrestler1 = get_or_create_wrestler(wrestler1_name, school1_name, weight_class, season_id)
-                wrestler2 = get_or_create_wrestler(wrestler2_name, school2_name, weight_class, season_id)
-
-                # Normalize and strip names to ensure they are compared correctly (case-insensitive)
-                wrestler1_name_normalized = wrestler1.name.strip().lower()
-                wrestler2_name_normalized = wrestler2.name.strip().lower()
-                winner_name_normalized = winner_name.strip().lower()
-
-                # Validate winner name
-                if winner_name_normalized not in [wrestler1_name_normalized, wrestler2_name_normalized]:
-                    possible_winners = [wrestler1.name, wrestler2.name]
-                    closest_matches = difflib.get_close_matches(winner_name, possible_winners, n=1)
-
-                    if closest_matches:
-                        suggestion = f"Did you mean '{closest_matches[0]}'?"
+                # Parse and validate the chunk's rows before touching the database
+                stage_start = perf_counter()
+                parsed_rows = []
+                for row_num, parsed, error in islice(validated_rows, chunk_rows):
+                    rows_read = row_num
+                    if error:
+                        feedback[row_num] = error
+                        row_errors += 1
                     else:
-                        suggestion = "No close match found."
-
-                    detailed_feedback.append(f"Row {row_num}: Winner '{winner_name}' does not match wrestler1 or wrestler2. {suggestion}")
-                    row_errors += 1
-                    continue
-
-                # Check for existing match
-                existing_match = Match.query.filter(
-                    db.or_(
-                        db.and_(
-                            Match.wrestler1_id == wrestler1.id,
-                            Match.wrestler2_id == wrestler2.id
-                        ),
-                        db.and_(
-                            Match.wrestler1_id == wrestler2.id,
-                            Match.wrestler2_id == wrestler1.id
-                        )
-                    ),
-                    Match.date == match_date,
-                    Match.wrestler1_score == wrestler1_score,
-                    Match.wrestler2_score == wrestler2_score,
-                    Match.win_type == win_type,
-                    Match.season_id == season_id,
-                    db.or_(
-                        Match.match_time == match_time,
-                        Match.match_time == None
-                    )
-                ).first()
-
-                if existing_match:
-                    detailed_feedback.append(f"Row {row_num}: Duplicate match detected (already exists).")
-                    skipped_duplicates += 1
-                    continue
-
-                # Create and add new match
-                winner = wrestler1 if winner_name_normalized == wrestler1_name_normalized else wrestler2
-                new_match = Match(
-                    date=match_date,
-                    wrestler1_id=wrestler1.id,
-                    wrestler2_id=wrestler2.id,
-                    winner_id=winner.id,
-                    win_type=win_type,
-                    wrestler1_score=wrestler1_score,
-                    wrestler2_score=wrestler2_score,
-                    match_time=match_time,
-                    **win_flags,  # Unpack win flags directly
-                    season_id=season_id  # Use season_id
-                )
-                db.session.add(new_match)
-                db.session.flush()
-
-                match_ids.append(new_match.id)
-
-                # Update win/loss records and increment falls/tech falls/major decisions
-                if winner == wrestler1:
-                    wrestler1.wins += 1
-                    wrestler2.losses += 1
-                    if win_flags["fall"]:
-                        wrestler1.falls += 1  # Increment falls for wrestler1
-                    if win_flags["technical_fall"]:
-                        wrestler1.tech_falls += 1  # Increment tech falls for wrestler1
-                    if win_flags["major_decision"]:
-                        wrestler1.major_decisions += 1  # Increment major decisions for wrestler1
-                else:
-                    wrestler2.wins += 1
-                    wrestler1.losses += 1
-                    if win_flags["fall"]:
-                        wrestler2.falls += 1  # Increment falls for wrestler2
-                    if win_flags["technical_fall"]:
-                        wrestler2.tech_falls += 1  # Increment tech falls for wrestler2
-                    if win_flags["major_decision"]:
-                        wrestler2.major_decisions += 1  # Increment major decisions for wrestler2
-
-                # After adding the match and updating win/loss records, recalculate statistics
-                recalculate_elo(wrestler1.id, season_id)
-                recalculate_elo(wrestler2.id, season_id)
-                recalculate_rpi(wrestler1.id, season_id)
-                recalculate_rpi(wrestler2.id, season_id)
-                recalculate_hybrid(wrestler1.id, season_id)
-                recalculate_hybrid(wrestler2.id, season_id)
-                recalculate_dominance(wrestler1.id, season_id)
-                recalculate_dominance(wrestler2.id, season_id)
-
-                # Commit after processing each match
-                db.session.commit()
-                added_matches += 1
-                detailed_feedback.append(
-                    f"Row {row_num}: Match added successfully: '{wrestler1_name}' (Weight Class: {weight_class}) vs '{wrestler2_name}' (Weight Class: {weight_class}) with win type '{win_type}'."
-                )
-
+                        parsed_rows.append(parsed)
+                    if progress and row_num % CSV_PROGRESS_EVERY == 0:
+                        progress('parse', row_num, row_errors)
+                timings['parse'] += perf_counter() - stage_start
+                if not parsed_rows and not feedback:
+                    break
+                if dry_run:
+                    added_matches, skipped_duplicates, new_wrestlers, ranking_changes = preview_csv_rows(parsed_rows, feedback, timings)
+                    break
+
+                # One import writes at a time; parsing can overlap
+                if progress:
+                    progress('resolve', rows_read, row_errors)
+                with csv_import_lock:
+                    added, skipped, created = import_csv_chunk(parsed_rows, feedback, timings,
+                                                               report_id=upload_report.id if streaming else None)
             except Exception as e:
-                detailed_feedback.append(
-                    f"Row {row_num}: Error processing match for '{wrestler1_name}' (Weight Class: {weight_class}) vs '{wrestler2_name}' (Weight Class: {weight_class}) ({str(e)})."
-                )
-                row_errors += 1
-                db.session.rollback()
-                continue
-
-        # Save the CSV upload report to the database
-        try:
-            upload_report = CSVUploadReport(
+                # Nothing is committed before the only chunk of a non-streaming import
+                if not streaming:
+                    raise
+                chunk_error = e
+                break
+            rows_committed = rows_read
+            skipped_duplicates += skipped
+            if not streaming:
+                wrestler_ids += created
+            added_matches += len(added)
+
+            for row, match_id, wrestler1_id, wrestler2_id, winner_id in added:
+                season_id = row['season_id']
+                elo_key = (season_id, row['weight_class'])
+                elo_replay_from[elo_key] = min(elo_replay_from.get(elo_key, row['date']), row['date'])
+                # Streaming imports recompute whole seasons, so only the non-streaming path keeps results
+                if not streaming:
+                    match_ids.append(match_id)
+                    rpi_results[season_id].append((wrestler1_id, wrestler2_id, winner_id))
+                    touched_wrestlers[season_id].update((wrestler1_id, wrestler2_id))
+            if not streaming:
+                break
+
+        if dry_run:
+            detailed_feedback = [feedback[row_num] for row_num in sorted(feedback)]
+            logger.info(
+                f"CSV dry run: {added_matches} would be added, {skipped_duplicates} duplicates, {row_errors} errors; "
+                + ", ".join(f"{stage} {seconds * 1000:.1f} ms" for stage, seconds in timings.items())
+            )
+            # Never added to the session; it only shapes the preview like a saved report
+            preview = CSVUploadReport(
+                uploaded_at=datetime.utcnow(),
                 user_id=user_id,
                 total_matches=added_matches + skipped_duplicates + row_errors,
                 added_matches=added_matches,
                 skipped_duplicates=skipped_duplicates,
                 row_errors=row_errors,
-                detailed_feedback=json.dumps(detailed_feedback),
-                match_ids=json.dumps(match_ids)
+                detailed_feedback=detailed_feedback,
+                match_ids=[],
+                is_reverted=False,
+                stage_timings=timings
+            ).to_dict()
+            preview.update(dry_run=True, new_wrestlers=new_wrestlers, ranking_changes=ranking_changes)
+            return csv_import_outcome(
+                True,
+                f"Dry run: {added_matches} matches would be added, {skipped_duplicates} duplicates skipped, "
+                f"{row_errors} errors encountered, {len(new_wrestlers)} new wrestlers. Nothing was saved.",
+                'info',
+                feedback=detailed_feedback,
+                preview=preview
             )
-            db.session.add(upload_report)
+
+        # Recompute derived stats once per affected season
+        if progress:
+            progress('recompute', rows_read, row_errors)
+        stage_start = perf_counter()
+        changed_seasons = sorted({season_id for season_id, _ in elo_replay_from})
+        with csv_import_lock:
+            for season_id in changed_seasons:
+                rebuild_wrestler_season_stats(season_id, None if streaming else touched_wrestlers[season_id])
+            # Replay Elo from the earliest new match date in each affected weight class
+            for (season_id, weight_class), replay_from in elo_replay_from.items():
+                recalculate_elo_from_date(season_id, weight_class, replay_from)
+            for season_id in changed_seasons:
+                update_glicko_periods(season_id, min(d for key, d in elo_replay_from.items() if key[0] == season_id))
+                if streaming:
+                    # A full sparse pass is cheaper than applying a whole archive result by result
+                    recalculate_season_rpi(season_id)
+                    with season_rpi_lock:
+                        season_rpi_states.pop(season_id, None)
+                else:
+                    update_rpi_for_results(season_id, added=rpi_results[season_id])
+                recalculate_season_dominance(season_id)
+        timings['recompute'] = perf_counter() - stage_start
+
+        detailed_feedback = [feedback[row_num] for row_num in sorted(feedback)]
+        logger.info(
+            f"CSV upload: {added_matches} added, {skipped_duplicates} duplicates, {row_errors} errors; "
+            + ", ".join(f"{stage} {seconds * 1000:.1f} ms" for stage, seconds in timings.items())
+        )
+
+        # Save the CSV upload report to the database
+        counts = {
+            'total_matches': added_matches + skipped_duplicates + row_errors,
+            'added_matches': added_matches,
+            'skipped_duplicates': skipped_duplicates,
+            'row_errors': row_errors,
+            'stage_timings': timings
+        }
+        try:
+            if upload_report is None:
+                upload_report = CSVUploadReport(
+                    user_id=user_id,
+                    detailed_feedback=json.dumps(detailed_feedback),
+                    match_ids=json.dumps(match_ids),
+                    wrestler_ids=json.dumps(wrestler_ids),
+                    file_hash=file_hash,
+                    **counts
+                )
+                db.session.add(upload_report)
+            else:
+                for column, value in counts.items():
+                    setattr(upload_report, column, value)
+                # The hash is only set once the whole file is in, so a partly imported file (a failed chunk
+                # or a worker that died) may be uploaded again; its imported rows are skipped as duplicates
+                if chunk_error is None:
+                    upload_report.file_hash = file_hash
             db.session.commit()
 
             logging.info(f"CSV upload report saved successfully with report ID: {upload_report.id}")
         except Exception as e:
             logging.error(f"Error saving CSV upload report: {str(e)}")
             db.session.rollback()
+        report_id = upload_report.id if upload_report and upload_report.id else None
+
+        if chunk_error is not None:
+            logging.error(f"CSV import stopped after row {rows_committed}: {str(chunk_error)}")
+            message = f"An error occurred during CSV processing: {str(chunk_error)}"
+            if rows_committed:
+                message += f" Rows 1-{rows_committed} were imported ({added_matches} matches added)."
+            return csv_import_outcome(False, message, 'error', report_id=report_id)
+
+        return csv_import_outcome(
+            True,
+            f"CSV file processed successfully! {added_matches} matches added, {skipped_duplicates} duplicates skipped, {row_errors} errors encountered.",
+            'success',
+            report_id=report_id,
+            feedback=detailed_feedback
+        )
 
-        flash(f"CSV file processed successfully! {added_matches} matches added, {skipped_duplicates} duplicates skipped, {row_errors} errors encountered.", 'success')
-        session['csv_feedback'] = detailed_feedback
+    except Exception as e:
+        db.session.rollback()
+        logging.error(f"An error occurred during CSV processing: {str(e)}")
+        return csv_import_outcome(False, f"An error occurred during CSV processing: {str(e)}", 'error')
 
-        return True
 
+def update_import_job(job_id, **values):
+    """
+    Writes ImportJob columns in a transaction of their own, so progress is visible to
+    pollers while the import itself runs in the job's session.
+    """
+    table = ImportJob.__table__
+    try:
+        with db.engine.begin() as connection:
+            connection.execute(db.update(table).where(table.c.id == job_id).values(**values))
     except Exception as e:
-        flash(f"An error occurred during CSV processing: {str(e)}", 'error')
-        logging.error(f"An error occurred during CSV processing: {str(e)}")
-        return False
+        logger.error(f"Error updating import job {job_id}: {str(e)}")
+
+
+def run_import_job(job_id):
+    """Processes one ImportJob on a pool thread, in an app context (and session) of its own."""
+    with app.app_context():
+        # Claim the job with one conditional UPDATE, so a requeued job runs in only one process
+        table = ImportJob.__table__
+        now = datetime.utcnow()
+        with db.engine.begin() as connection:
+            claimed = connection.execute(
+                db.update(table)
+                .where(table.c.id == job_id, table.c.status == 'queued')
+                .values(status='running', started_at=now, heartbeat_at=now)
+            ).rowcount
+        if not claimed:
+            return
+        job = db.session.get(ImportJob, job_id)
+
+        def progress(stage, rows_processed, row_errors):
+            update_import_job(job_id, stage=stage, rows_processed=rows_processed, row_errors=row_errors)
+
+        try:
+            # Large files are imported in chunks so memory stays flat however long the file is
+            streaming = os.path.getsize(job.file_path) >= app.config.get('CSV_STREAMING_MIN_BYTES', 5 * 1024 * 1024)
+            with open(job.file_path, 'rb') as file:
+                outcome = validate_and_process_csv(file, user_id=job.user_id, progress=progress, streaming=streaming,
+                                                   dry_run=job.dry_run)
+        except Exception as e:
+            logger.error(f"Import job {job_id} failed: {str(e)}")
+            outcome = csv_import_outcome(False, f"An error occurred during CSV processing: {str(e)}", 'error')
+
+        report = db.session.get(CSVUploadReport, outcome['report_id']) if outcome['report_id'] else None
+        values = {
+            'status': 'done' if outcome['success'] else 'failed',
+            'stage': None,
+            'message': outcome['message'],
+            'message_category': outcome['category'],
+            'report_id': outcome['report_id'],
+            'finished_at': datetime.utcnow()
+        }
+        if report is not None and outcome['success']:
+            values['rows_processed'] = report.total_matches
+            values['row_errors'] = report.row_errors
+        preview = outcome.get('preview')
+        if preview:
+            preview['detailed_feedback'] = preview['detailed_feedback'][:app.config.get('CSV_FEEDBACK_PREVIEW', 1000)]
+            values['preview'] = json.dumps(preview)
+            values['rows_processed'] = preview['total_matches']
+            values['row_errors'] = preview['row_errors']
+        update_import_job(job_id, **values)
+
+        try:
+            os.remove(job.file_path)
+        except OSError as e:
+            logger.error(f"Could not remove upload {job.file_path}: {str(e)}")
+
+
+class ImportQueue:
+    """
+    In-process pool that runs ImportJobs on background threads. Jobs are rows in the
+    import_job table, so no broker is needed; each worker process runs the jobs it accepted.
+
+    A recovery thread heartbeats the jobs this process is running and picks up jobs left
+    behind by processes that were restarted: queued jobs nobody started are requeued here,
+    and running jobs whose heartbeat stopped are marked failed.
+    """
+
+    def __init__(self, workers=2, recovery_seconds=60, stale_seconds=300):
+        self.workers = workers
+        self.recovery_seconds = recovery_seconds
+        self.stale_seconds = stale_seconds
+        self.executor = None
+        self.recovery_thread = None
+        self.submitted = set()  # Job IDs handed to this process's executor and not finished
+        self.lock = threading.Lock()
+
+    def submit(self, job_id):
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='csv-import')
+            self.submitted.add(job_id)
+        return self.executor.submit(self.run, job_id)
+
+    def run(self, job_id):
+        try:
+            run_import_job(job_id)
+        finally:
+            with self.lock:
+                self.submitted.discard(job_id)
+
+    def start_recovery(self):
+        """Starts the recovery thread once per process; its first pass runs right away."""
+        with self.lock:
+            if self.recovery_thread is not None:
+                return
+            self.recovery_thread = threading.Thread(target=self.recovery_loop, name='csv-import-recovery', daemon=True)
+        self.recovery_thread.start()
+
+    def recovery_loop(self):
+        while True:
+            with app.app_context():
+                try:
+                    self.recover()
+                except Exception as e:
+                    logger.error(f"Import job recovery failed: {str(e)}")
+            sleep(self.recovery_seconds)
+
+    def recover(self):
+        table = ImportJob.__table__
+        now = datetime.utcnow()
+        stale_before = now - timedelta(seconds=self.stale_seconds)
+        with self.lock:
+            submitted = set(self.submitted)
+
+        with db.engine.begin() as connection:
+            if submitted:
+                connection.execute(
+                    db.update(table)
+                    .where(table.c.id.in_(submitted), table.c.status == 'running')
+                    .values(heartbeat_at=now)
+                )
+            orphaned = connection.execute(
+                db.select(table.c.id, table.c.file_path)
+                .where(table.c.status == 'running',
+                       func.coalesce(table.c.heartbeat_at, table.c.started_at, table.c.created_at) < stale_before)
+            ).all()
+            for job_id, file_path in orphaned:
+                # Conditional, in case the job's own process finished it meanwhile
+                failed = connection.execute(
+                    db.update(table)
+                    .where(table.c.id == job_id, table.c.status == 'running')
+                    .values(status='failed', stage=None, finished_at=now, message_category='error',
+                            message='The import was interrupted because its worker stopped. '
+                                    'Upload the file again; rows that were already imported are skipped as duplicates.')
+                ).rowcount
+                if failed:
+                    logger.error(f"Import job {job_id} was orphaned by a stopped worker; marked failed")
+                    try:
+                        os.remove(file_path)
+                    except OSError:
+                        pass
+            stranded = connection.execute(
+                db.select(table.c.id)
+                .where(table.c.status == 'queued', table.c.created_at < stale_before)
+                .order_by(table.c.id)
+            ).scalars().all()
+
+        for job_id in stranded:
+            if job_id not in submitted:
+                logger.info(f"Requeueing import job {job_id}")
+                self.submit(job_id)
+
+
+import_queue = ImportQueue(app.config.get('IMPORT_WORKERS', 2), app.config.get('IMPORT_RECOVERY_SECONDS', 60),
+                           app.config.get('IMPORT_JOB_STALE_SECONDS', 300))
+
+
+@app.before_request
+def start_import_recovery():
+    # Only processes that serve requests run imports, so recovery starts with the first request
+    import_queue.start_recovery()
+
+
+@app.route('/import_jobs/<int:job_id>', methods=['GET'])
+@login_required
+@admin_required
+def import_job_status(job_id):
+    job = ImportJob.query.get_or_404(job_id)
+    return jsonify(job.to_dict())
 
 
 @app.route('/csv_reports', defaults={'page': 1}, methods=['GET'])
@@ -2541,9 +4713,11 @@ def csv_reports(page):
 
     # Filter by search term if provided
     if search:
+        streamed_matches = db.select(CSVUploadFeedback.report_id).where(CSVUploadFeedback.message.ilike(f'%{search}%'))
         reports_query = reports_query.filter(
             (CSVUploadReport.detailed_feedback.ilike(f'%{search}%')) |
-            (CSVUploadReport.total_matches.ilike(f'%{search}%'))
+            (CSVUploadReport.total_matches.ilike(f'%{search}%')) |
+            (CSVUploadReport.id.in_(streamed_matches))
         )
 
     # Filter by status (active or reverted)
@@ -2557,7 +4731,11 @@ def csv_reports(page):
 
     # Process each report's detailed feedback
     for report in paginated_reports.items:
-        if report.detailed_feedback:
+        if report.streamed:
+            # Load a preview without marking the report dirty in the long-lived session
+            set_committed_value(report, 'detailed_feedback',
+                                report.feedback_messages(limit=app.config.get('CSV_FEEDBACK_PREVIEW', 1000)))
+        elif report.detailed_feedback:
             try:
                 # Check if `detailed_feedback` is already a list
                 if not isinstance(report.detailed_feedback, list):
@@ -2581,6 +4759,170 @@ def csv_reports(page):
     )
 
 
+# IDs per statement when reverting; older SQLite builds allow at most 999 bound parameters
+REVERT_BATCH_SIZE = 900
+
+
+def json_id_list(value):
+    # Report ID columns hold a JSON array, stored as an encoded string by older writers
+    if isinstance(value, str):
+        value = json.loads(value)
+    return [int(item) for item in value or []]
+
+
+def csv_report_match_ids(report):
+    # Matches added by an upload, from the feedback table for streamed reports
+    if report.streamed:
+        return db.session.scalars(
+            db.select(CSVUploadFeedback.match_id)
+            .where(CSVUploadFeedback.report_id == report.id, CSVUploadFeedback.match_id.isnot(None))
+        ).all()
+    return json_id_list(report.match_ids)
+
+
+def delete_unused_wrestlers(wrestler_ids):
+    """
+    Deletes the given wrestlers that no match refers to, with their stats, rank and rating
+    history rows, and refreshes the rank index of their weight classes. Runs in the caller's
+    transaction. Returns the number deleted.
+    """
+    wrestler_ids = list(wrestler_ids)
+    unused = []
+    for start in range(0, len(wrestler_ids), REVERT_BATCH_SIZE):
+        batch = wrestler_ids[start:start + REVERT_BATCH_SIZE]
+        unused += db.session.execute(
+            db.select(Wrestler.id, Wrestler.season_id, Wrestler.weight_class)
+            .where(Wrestler.id.in_(batch),
+                   ~db.exists().where(db.or_(Match.wrestler1_id == Wrestler.id, Match.wrestler2_id == Wrestler.id)))
+        ).all()
+
+    weight_classes = defaultdict(set)  # Season ID -> weight classes that lost a wrestler
+    for start in range(0, len(unused), REVERT_BATCH_SIZE):
+        batch = [wrestler_id for wrestler_id, _, _ in unused[start:start + REVERT_BATCH_SIZE]]
+        # Bulk deletes skip wrestler_stats_before_delete, so the dependent rows go first here
+        for table in (WrestlerSeasonStats.__table__, WrestlerRank.__table__, RatingHistory.__table__):
+            db.session.execute(db.delete(table).where(table.c.wrestler_id.in_(batch)))
+        db.session.execute(db.delete(Wrestler).where(Wrestler.id.in_(batch)).execution_options(synchronize_session=False))
+    for _, season_id, weight_class in unused:
+        if season_id is not None:
+            weight_classes[season_id].add(weight_class)
+    for season_id, classes in weight_classes.items():
+        refresh_rank_index(season_id, classes)
+    return len(unused)
+
+
+def revert_csv_upload(report_id):
+    """
+    Removes every match a CSV upload added, as a set-based operation: the matches and their
+    rating history are deleted in bulk, wrestler counters are decremented with one
+    executemany, and each affected season's stats, Elo, Glicko, RPI and dominance are
+    recomputed once. Matches already deleted by hand are skipped. Wrestlers the upload
+    created are deleted last, unless a match added since still refers to them.
+
+    Flashes the reason and returns False if the report can't be reverted.
+    """
+    report = db.session.get(CSVUploadReport, report_id)
+    if report is None:
+        flash(f"CSV upload {report_id} not found.", 'error')
+        return False
+    if report.is_reverted:
+        flash(f"CSV upload {report_id} has already been reverted.", 'warning')
+        return False
+
+    timings = {}
+    stage_start = perf_counter()
+    match_ids = csv_report_match_ids(report)
+    batches = [match_ids[i:i + REVERT_BATCH_SIZE] for i in range(0, len(match_ids), REVERT_BATCH_SIZE)]
+
+    with csv_import_lock:
+        rows = []
+        for batch in batches:
+            rows += db.session.execute(
+                db.select(Match.season_id, Wrestler.weight_class, Match.date, Match.wrestler1_id, Match.wrestler2_id,
+                          Match.winner_id, Match.fall, Match.technical_fall, Match.major_decision)
+                .join(Wrestler, Wrestler.id == Match.wrestler1_id)
+                .where(Match.id.in_(batch))
+            ).all()
+
+        counter_deltas = defaultdict(Counter)  # Wrestler ID -> WRESTLER_COUNTER_COLUMNS decrements
+        removed_results = defaultdict(list)  # Removed (wrestler1_id, wrestler2_id, winner_id) results per season
+        touched_wrestlers = defaultdict(set)
+        elo_replay_from = {}  # Earliest removed match date per (season_id, weight_class)
+        for season_id, weight_class, match_date, wrestler1_id, wrestler2_id, winner_id, fall, technical_fall, major_decision in rows:
+            loser_id = wrestler2_id if winner_id == wrestler1_id else wrestler1_id
+            counter_deltas[winner_id]['wins'] += 1
+            counter_deltas[loser_id]['losses'] += 1
+            if fall:
+                counter_deltas[winner_id]['falls'] += 1
+            if technical_fall:
+                counter_deltas[winner_id]['tech_falls'] += 1
+            if major_decision:
+                counter_deltas[winner_id]['major_decisions'] += 1
+
+            removed_results[season_id].append((wrestler1_id, wrestler2_id, winner_id))
+            touched_wrestlers[season_id].update((wrestler1_id, wrestler2_id))
+            elo_key = (season_id, weight_class)
+            elo_replay_from[elo_key] = min(elo_replay_from.get(elo_key, match_date), match_date)
+        timings['load'] = perf_counter() - stage_start
+
+        # Delete the matches, undo their counters and mark the report in one transaction
+        stage_start = perf_counter()
+        try:
+            for batch in batches:
+                db.session.execute(db.delete(RatingHistory).where(RatingHistory.match_id.in_(batch)))
+                db.session.execute(db.delete(Match).where(Match.id.in_(batch)))
+
+            if counter_deltas:
+                table = Wrestler.__table__
+                db.session.execute(
+                    db.update(table)
+                    .where(table.c.id == db.bindparam('wrestler_id'))
+                    .values({column: func.coalesce(table.c[column], 0) - db.bindparam(f'remove_{column}')
+                             for column in WRESTLER_COUNTER_COLUMNS}),
+                    [{'wrestler_id': wrestler_id, **{f'remove_{column}': deltas[column] for column in WRESTLER_COUNTER_COLUMNS}}
+                     for wrestler_id, deltas in counter_deltas.items()]
+                )
+
+            for season_id, wrestler_ids in touched_wrestlers.items():
+                rebuild_wrestler_season_stats(season_id, wrestler_ids, connection=db.session.connection())
+                mark_matches_changed(season_id)
+            report.is_reverted = True
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error reverting CSV upload {report_id}: {str(e)}")
+            flash(f"Error reverting CSV upload {report_id}: {str(e)}", 'error')
+            return False
+        timings['delete'] = perf_counter() - stage_start
+
+        # Recompute derived stats once per affected season
+        stage_start = perf_counter()
+        for (season_id, weight_class), replay_from in elo_replay_from.items():
+            recalculate_elo_from_date(season_id, weight_class, replay_from)
+        for season_id, results in removed_results.items():
+            update_glicko_periods(season_id, min(d for key, d in elo_replay_from.items() if key[0] == season_id))
+            update_rpi_for_results(season_id, removed=results)
+            recalculate_season_dominance(season_id)
+        timings['recompute'] = perf_counter() - stage_start
+
+        # After the recompute, which writes ratings by wrestler ID, so none of them is gone yet
+        stage_start = perf_counter()
+        removed_wrestlers = 0
+        try:
+            removed_wrestlers = delete_unused_wrestlers(json_id_list(report.wrestler_ids))
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error removing wrestlers created by CSV upload {report_id}: {str(e)}")
+        timings['wrestlers'] = perf_counter() - stage_start
+
+    logger.info(
+        f"Reverted CSV upload {report_id}: {len(rows)} matches and {removed_wrestlers} wrestlers removed; "
+        + ", ".join(f"{stage} {seconds * 1000:.1f} ms" for stage, seconds in timings.items())
+    )
+    return True
+
+
 @app.route('/revert_upload/<int:report_id>', methods=['POST'])
 @login_required
 @admin_required
@@ -2596,6 +4938,7 @@ def revert_upload(report_id):
 @app.route('/export_rankings')
 @login_required
 @admin_required
+@conditional_get()
 def export_rankings():
     try:
         output = io.StringIO()
@@ -2634,6 +4977,7 @@ def export_rankings():
 @app.route('/export_wrestlers')
 @login_required
 @admin_required
+@conditional_get()
 def export_wrestlers():
     try:
         output = io.StringIO()
@@ -2670,6 +5014,7 @@ def export_wrestlers():
 @app.route('/export_matches')
 @login_required
 @admin_required
+@conditional_get()
 def export_matches():
     try:
         output = io.StringIO()
@@ -2718,6 +5063,13 @@ def bulk_delete_wrestlers():
 
     # List to store deleted wrestler data
     deleted_wrestlers_data = []
+    deleted_match_ids = set()  # Each match once, even when both its wrestlers are deleted
+    deleted_ids = {wrestler.id for wrestler in wrestlers}
+    deleted_weight_classes = {wrestler.weight_class for wrestler in wrestlers}
+    # Where each season's weight classes must replay Elo from, and the results RPI loses
+    replay_from = defaultdict(dict)  # Season ID -> {weight class -> earliest deleted match date}
+    removed_results = defaultdict(list)
+    opponent_ids = defaultdict(set)
 
     for wrestler in wrestlers:
         # Get all matches where this wrestler participated
@@ -2739,19 +5091,26 @@ def bulk_delete_wrestlers():
         ]
         deleted_wrestlers_data.append(wrestler_data)
 
-        # Delete the matches and update opponent stats
+        # Delete the matches and update opponent win/loss records
         for match in matches_as_wrestler1 + matches_as_wrestler2:
+            if match.id in deleted_match_ids:
+                continue
             opponent = match.wrestler2 if match.wrestler1_id == wrestler.id else match.wrestler1
             if match.winner_id == wrestler.id:
                 opponent.losses -= 1
             else:
                 opponent.wins -= 1
-            recalculate_elo(opponent.id, selected_season_id)  # Recalculate opponent's Elo after updating wins/losses
+            season_replay = replay_from[match.season_id]
+            season_replay[wrestler.weight_class] = min(season_replay.get(wrestler.weight_class, match.date), match.date)
+            removed_results[match.season_id].append((match.wrestler1_id, match.wrestler2_id, match.winner_id))
+            opponent_ids[match.season_id].update({match.wrestler1_id, match.wrestler2_id} - deleted_ids)
+            deleted_match_ids.add(match.id)
             db.session.delete(match)
 
         # Delete the wrestler
         db.session.delete(wrestler)
 
+
     # Store deleted wrestler data for undo functionality
     session['last_action'] = {
         'action': 'bulk_delete_wrestlers',
@@ -2759,19 +5118,22 @@ def bulk_delete_wrestlers():
         'weight_class': request.form.get('weight_class')
     }
 
+    # Get the weight class of the first wrestler deleted
+    weight_class = wrestlers[0].weight_class if wrestlers else request.form.get('weight_class')
+    deleted_count = len(wrestlers)
     db.session.commit()
+    flash(f'Successfully deleted {deleted_count} wrestler(s) and their associated matches.', 'success')
 
-    # Get the weight class of the first wrestler deleted
+    # Replay the affected weight classes through the Elo checkpoints, then Glicko, RPI and dominance
+    for season_id, season_replay in replay_from.items():
+        if not recompute_after_match_change(season_id, season_replay, removed=removed_results[season_id],
+                                            wrestler_ids=opponent_ids[season_id]):
+            flash(RATINGS_STALE_MESSAGE, 'warning')
     if wrestlers:
-        weight_class = wrestlers[0].weight_class
-
-        # Recalculate stats for all remaining wrestlers in the same weight class
-        remaining_wrestlers = Wrestler.query.filter_by(weight_class=weight_class, season_id=selected_season_id).all()
-        for wrestler in remaining_wrestlers:
-            recalculate_wrestler_stats(wrestler.id, selected_season_id)  # Recalculate all relevant stats for remaining wrestlers
+        refresh_rank_index(int(selected_season_id), deleted_weight_classes)
+        db.session.commit()
 
-    # Flash message and redirect to rankings page
-    flash(f'Successfully deleted {len(wrestlers)} wrestler(s) and their associated matches.', 'success')
+    # Redirect to rankings page
     return redirect(url_for('rankings', weight_class=weight_class))
 
 
@@ -2787,8 +5149,15 @@ def clear_data():
         return redirect(url_for('home'))
 
     try:
-        # Clear matches for the selected season
+        # Clear rating history, matches and rating checkpoints for the selected season;
+        # the bulk delete skips the mapper events, so the match version is bumped here
+        mark_matches_changed(selected_season_id)
+        db.session.query(RatingHistory).filter_by(season_id=selected_season_id).delete()
         db.session.query(Match).filter_by(season_id=selected_season_id).delete()
+        db.session.query(EloCheckpoint).filter_by(season_id=selected_season_id).delete()
+        db.session.query(GlickoPeriod).filter_by(season_id=selected_season_id).delete()
+        db.session.query(WrestlerSeasonStats).filter_by(season_id=selected_season_id).delete()
+        db.session.query(WrestlerRank).filter_by(season_id=selected_season_id).delete()
         db.session.commit()
 
         # Clear wrestlers for the selected season
@@ -2808,11 +5177,9 @@ def clear_data():
 @login_required
 @admin_required
 def recalculate_all_rpi():
-    wrestlers = Wrestler.query.all()
-    for wrestler in wrestlers:
-        recalculate_rpi(wrestler)
-        recalculate_hybrid(wrestler)
-    db.session.commit()
+    # One sparse RPI pass per season; hybrid scores follow automatically as a property
+    for season in Season.query.all():
+        recalculate_season_rpi(season.id)
     flash('RPI and Hybrid scores recalculated for all wrestlers.', 'success')
     return redirect(url_for('home'))
 
@@ -2834,8 +5201,15 @@ def recalculate_season_elo():
 
     try:
         # Recalculate Elo for the given season
-        recalculate_elo_for_season(season_id)
-        flash(f"Elo recalculation completed successfully for season {season_id}.", "success")
+        report = recalculate_elo_for_season(season_id)
+        season = Season.query.get(season_id)
+        if season:
+            update_glicko_periods(season_id, season.start_date)
+        recalculate_season_rpi(season_id)
+        rebuild_wrestler_season_stats(season_id)
+        stage_times = ", ".join(f"{stage} {seconds * 1000:.0f} ms" for stage, seconds in report['timings'].items())
+        flash(f"Elo recalculation completed successfully for season {season_id} "
+              f"({report['matches']} matches; {stage_times}).", "success")
         logger.info(f"Elo recalculation completed for season {season_id}.")
     except Exception as e:
         db.session.rollback()  # Rollback any partial changes in case of error
@@ -2856,9 +5230,6 @@ def recalculate_season_elo():
 @admin_required
 def upload_csv():
     if request.method == 'POST':
-        # Clear previous feedback from session before processing a new file
-        session.pop('csv_feedback', None)
-
         # Check if a file was uploaded
         if 'file' not in request.files or request.files['file'].filename == '':
             flash('No file selected', 'error')
@@ -2867,30 +5238,47 @@ def upload_csv():
         file = request.files['file']
 
         # Check if the uploaded file is a CSV
-        if file.filename.endswith('.csv'):
-            try:
-                # Call the function to process the CSV and get feedback
-                feedback, success = validate_and_process_csv(file)
-
-                # If processing was successful
-                if success:
-                    flash('CSV uploaded and processed successfully!', 'success')
-                else:
-                    session['csv_feedback'] = feedback  # Store feedback in session
-                    flash('CSV upload failed. Check the feedback for details.', 'error')
-            except Exception as e:
-                flash(f'Error processing file: {str(e)}', 'error')
-        else:
+        if not file.filename.endswith('.csv'):
             flash('Invalid file type. Please upload a CSV file.', 'error')
+            return redirect(url_for('upload_csv'))
 
-        return redirect(url_for('upload_csv'))
-
-    # For GET request, show the form and fetch feedback from the session
-    csv_feedback = session.get('csv_feedback', None)  # Get feedback if it exists
-    return render_template('upload_csv.html', csv_feedback=csv_feedback)
+        # Save the file and queue it; the import (or dry run) runs in the background
+        try:
+            upload_folder = app.config.get('UPLOAD_FOLDER', os.path.join(app.instance_path, 'uploads'))
+            os.makedirs(upload_folder, exist_ok=True)
+            file_path = os.path.join(upload_folder, f"{uuid.uuid4().hex}.csv")
+            file.save(file_path)
+
+            job = ImportJob(user_id=current_user.id, filename=file.filename, file_path=file_path,
+                            dry_run=bool(request.form.get('dry_run')))
+            db.session.add(job)
+            db.session.commit()
+            import_queue.submit(job.id)
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error queueing CSV upload: {str(e)}")
+            flash(f'Error processing file: {str(e)}', 'error')
+            return redirect(url_for('upload_csv'))
+
+        if request.accept_mimetypes.best == 'application/json':
+            return jsonify(job.to_dict()), 202
+        return redirect(url_for('upload_csv', job_id=job.id))
+
+    # For GET request, show the form and, for a finished job, its feedback or dry run preview
+    job = ImportJob.query.get(request.args.get('job_id', type=int)) if request.args.get('job_id') else None
+    csv_feedback = None
+    preview = None
+    if job and job.preview and job.status == 'done':
+        preview = json.loads(job.preview)
+        csv_feedback = preview['detailed_feedback']
+    elif job and job.report_id and job.status == 'done':
+        report = CSVUploadReport.query.get(job.report_id)
+        csv_feedback = report.feedback_messages(limit=app.config.get('CSV_FEEDBACK_PREVIEW', 1000)) if report else None
+    return render_template('upload_csv.html', csv_feedback=csv_feedback, preview=preview, job=job)
 
 
 @app.route('/search', methods=['GET'])
+@conditional_get(all_seasons=True)
 def search_wrestler():
     query = request.args.get('query', '')
     season_id = request.args.get('season_id', None)  # Get the season_id from query string
@@ -2916,6 +5304,7 @@ def search_wrestler():
 
 
 @app.route('/autocomplete', methods=['GET'])
+@conditional_get(all_seasons=True)
 def autocomplete():
     query = request.args.get('query', '')
     season_id = request.args.get('season_id', None)  # Get the season_id from query string
@@ -2938,6 +5327,8 @@ def autocomplete():
 from sqlalchemy.sql import func  # Add this import
 
 @app.route('/global-leaderboards', methods=['GET'])
+@conditional_get()
+@cached_page
 def global_leaderboards():
     # Fetch all seasons for the dropdown
     seasons = Season.query.order_by(Season.start_date.desc()).all()
@@ -3070,34 +5461,9 @@ def update_all():
         return redirect(url_for('home'))
 
     try:
-        # Loop through all wrestlers for the selected season
-        wrestlers = Wrestler.query.filter_by(season_id=selected_season_id).all()
-        for wrestler in wrestlers:
-            logger.info(f'Updating stats for wrestler: {wrestler.name}, ID: {wrestler.id}')  # Log wrestler being processed
-
-            # Reset specific stats to recalculate them
-            wrestler.falls = 0
-            wrestler.tech_falls = 0
-            wrestler.major_decisions = 0
-
-            # Fetch all matches for the wrestler in the selected season
-            matches = Match.query.filter(
-                ((Match.wrestler1_id == wrestler.id) | (Match.wrestler2_id == wrestler.id)) &
-                (Match.season_id == selected_season_id)
-            ).all()
-            
-            # Recalculate falls, tech falls, and major decisions
-            for match in matches:
-                if match.winner_id == wrestler.id:
-                    if match.win_type == 'Fall':
-                        wrestler.falls += 1
-                    elif match.win_type == 'Technical Fall':
-                        wrestler.tech_falls += 1
-                    elif match.win_type == 'Major Decision':
-                        wrestler.major_decisions += 1
-
-        # Commit all changes to the database at once
-        db.session.commit()
+        # One set-based pass over the season's matches
+        recalculate_season_dominance(int(selected_season_id))
+        rebuild_wrestler_season_stats(int(selected_season_id))
         flash(f'Falls, Tech Falls, and Major Decisions for Season {selected_season_id} have been successfully updated!', 'success')
     except Exception as e:
         # Rollback changes in case of an error
@@ -3108,6 +5474,14 @@ def update_all():
 
 
 
+@app.route('/admin/cache-stats', methods=['GET'])
+@login_required
+@admin_required
+def cache_stats():
+    return jsonify(response_cache.stats())
+
+
+
 @app.route('/add_season', methods=['POST'])
 @login_required
 def add_season():
@@ -3432,6 +5806,11 @@ def delete_season(season_id):
     try:
         # Delete all related data (like wrestlers, matches) before deleting the season
         # Adjust the logic based on how relationships are defined in your models
+        EloCheckpoint.query.filter_by(season_id=season.id).delete()
+        GlickoPeriod.query.filter_by(season_id=season.id).delete()
+        RatingHistory.query.filter_by(season_id=season.id).delete()
+        WrestlerSeasonStats.query.filter_by(season_id=season.id).delete()
+        WrestlerRank.query.filter_by(season_id=season.id).delete()
         Wrestler.query.filter_by(season_id=season.id).delete()
         db.session.delete(season)
         db.session.commit()
@@ -16,4 +16,32 @@ class Config:
     # Other useful configurations
     SEND_FILE_MAX_AGE_DEFAULT = 0
 
+    # Maximum number of rendered pages kept in each worker's response cache
+    RESPONSE_CACHE_SIZE = int(os.getenv('RESPONSE_CACHE_SIZE', 256))
+
     
+
+    # Number of wrestlers listed per weight class on the home page
+    HOME_TOP_N = int(os.getenv('HOME_TOP_N', 5))
+
+    # Background threads per worker process that run queued CSV imports
+    IMPORT_WORKERS = int(os.getenv('IMPORT_WORKERS', 2))
+
+    # Where uploaded CSV files wait for their import job
+    UPLOAD_FOLDER = os.getenv('UPLOAD_FOLDER', os.path.join(basedir, 'instance', 'uploads'))
+
+    # CSV uploads at least this large are imported in chunks of CSV_CHUNK_ROWS rows, one transaction each
+    CSV_STREAMING_MIN_BYTES = int(os.getenv('CSV_STREAMING_MIN_BYTES', 5 * 1024 * 1024))
+    CSV_CHUNK_ROWS = int(os.getenv('CSV_CHUNK_ROWS', 2000))
+
+    # Most feedback messages shown per upload report
+    CSV_FEEDBACK_PREVIEW = int(os.getenv('CSV_FEEDBACK_PREVIEW', 1000))
+
+    # Processes that validate CSV rows in batches of CSV_VALIDATION_BATCH_ROWS; 1 validates on the importing thread
+    CSV_VALIDATION_WORKERS = int(os.getenv('CSV_VALIDATION_WORKERS', os.cpu_count() or 1))
+    CSV_VALIDATION_BATCH_ROWS = int(os.getenv('CSV_VALIDATION_BATCH_ROWS', 1000))
+
+    # How often each worker heartbeats its import jobs and recovers jobs left by stopped workers,
+    # and how long a queued job or a running job's heartbeat may go untouched before recovery acts
+    IMPORT_RECOVERY_SECONDS = int(os.getenv('IMPORT_RECOVERY_SECONDS', 60))
+    IMPORT_JOB_STALE_SECONDS = int(os.getenv('IMPORT_JOB_STALE_SECONDS', 300))
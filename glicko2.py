@@ -1,4 +1,5 @@
 import math
+import numpy as np
 
 class Glicko2:
     def __init__(self, tau=0.5):
@@ -10,8 +11,9 @@ class Glicko2:
     def g(self, rd):
         return 1 / math.sqrt(1 + (3 * rd**2) / (math.pi**2))
 
-    def E(self, rating, opp_rating, opp_rd):
-        return 1 / (1 + math.exp(-self.g(opp_rd) * (rating - opp_rating) / 400))
+    def E(self, mu, opp_mu, opp_phi):
+        # Expected score on the Glicko-2 scale
+        return 1 / (1 + math.exp(-self.g(opp_phi) * (mu - opp_mu)))
 
     def update_rating(self, rating, rd, vol, outcomes):
         # Convert rating and RD to Glicko-2 scale
@@ -29,6 +31,7 @@ class Glicko2:
             delta += g_phi * (score - E)
         
         v = 1 / v_inv if v_inv != 0 else 0
+        improvement = delta
         delta *= v
 
         a = math.log(vol**2)
@@ -66,9 +69,103 @@ class Glicko2:
 
         phi_star = math.sqrt(phi**2 + new_vol**2)
         new_phi = 1 / math.sqrt(1 / phi_star**2 + 1 / v)
-        new_mu = mu + new_phi**2 * delta
+        new_mu = mu + new_phi**2 * improvement
 
         new_rating = 173.7178 * new_mu + self.default_rating
         new_rd = 173.7178 * new_phi
 
-        return new_rating, new_rd, new_vol
\ No newline at end of file
+        return new_rating, new_rd, new_vol
+
+    def update_ratings(self, ratings, rds, vols, player_idx, opp_ratings, opp_rds, scores):
+        """
+        Batch version of update_rating for one rating period.
+
+        ratings, rds and vols hold every wrestler's pre-period values. Outcomes are given
+        as parallel arrays with one entry per game: player_idx (index into ratings),
+        the opponent's pre-period rating and RD, and the score (1 win, 0 loss).
+        Uses the same formulas as update_rating, with the volatility iteration run for
+        all wrestlers together. Wrestlers without games in the period are returned unchanged.
+        Returns (new_ratings, new_rds, new_vols) as NumPy arrays.
+        """
+        ratings = np.asarray(ratings, dtype=np.float64)
+        rds = np.asarray(rds, dtype=np.float64)
+        vols = np.asarray(vols, dtype=np.float64)
+        player_idx = np.asarray(player_idx, dtype=np.int64)
+        opp_ratings = np.asarray(opp_ratings, dtype=np.float64)
+        opp_rds = np.asarray(opp_rds, dtype=np.float64)
+        scores = np.asarray(scores, dtype=np.float64)
+        n = len(ratings)
+
+        # Convert rating and RD to Glicko-2 scale
+        mu = (ratings - self.default_rating) / 173.7178
+        phi = rds / 173.7178
+        opp_mu = (opp_ratings - self.default_rating) / 173.7178
+        opp_phi = opp_rds / 173.7178
+
+        g_phi = 1 / np.sqrt(1 + (3 * opp_phi**2) / (math.pi**2))
+        E = 1 / (1 + np.exp(-g_phi * (mu[player_idx] - opp_mu)))
+        v_inv = np.bincount(player_idx, weights=g_phi**2 * E * (1 - E), minlength=n)
+        delta_sum = np.bincount(player_idx, weights=g_phi * (scores - E), minlength=n)
+
+        new_ratings = ratings.copy()
+        new_rds = rds.copy()
+        new_vols = vols.copy()
+        active = np.flatnonzero(v_inv != 0)
+        if len(active) == 0:
+            return new_ratings, new_rds, new_vols
+
+        mu, phi, vol = mu[active], phi[active], vols[active]
+        v = 1 / v_inv[active]
+        improvement = delta_sum[active]
+        delta = v * improvement
+
+        a = np.log(vol**2)
+        tau = self.tau
+
+        def f(x, rows):
+            ex = np.exp(x)
+            num1 = ex * (delta[rows]**2 - phi[rows]**2 - v[rows] - ex)
+            den1 = 2 * (phi[rows]**2 + v[rows] + ex)**2
+            return (num1 / den1) - ((x - a[rows]) / tau**2)
+
+        all_rows = np.arange(len(active))
+        epsilon = 0.000001
+        A = a.copy()
+        B = np.empty_like(a)
+        big_delta = delta**2 > phi**2 + v
+        B[big_delta] = np.log(delta[big_delta]**2 - phi[big_delta]**2 - v[big_delta])
+
+        # Bracket the root for the remaining wrestlers by stepping down in multiples of tau
+        k = np.ones_like(a)
+        stepping = np.flatnonzero(~big_delta)
+        while len(stepping):
+            still_negative = f(a[stepping] - k[stepping] * tau, stepping) < 0
+            k[stepping[still_negative]] += 1
+            stepping = stepping[still_negative]
+        B[~big_delta] = a[~big_delta] - k[~big_delta] * tau
+
+        # Illinois iteration, advancing only the wrestlers that have not converged yet
+        fa = f(A, all_rows)
+        fb = f(B, all_rows)
+        rows = np.flatnonzero(np.abs(B - A) > epsilon)
+        while len(rows):
+            C = A[rows] + (A[rows] - B[rows]) * fa[rows] / (fb[rows] - fa[rows])
+            fc = f(C, rows)
+            swap = fc * fb[rows] < 0
+            A[rows] = np.where(swap, B[rows], A[rows])
+            fa[rows] = np.where(swap, fb[rows], fa[rows] / 2)
+            B[rows] = C
+            fb[rows] = fc
+            rows = rows[np.abs(B[rows] - A[rows]) > epsilon]
+
+        vol_out = np.exp(A / 2)
+
+        phi_star = np.sqrt(phi**2 + vol_out**2)
+        new_phi = 1 / np.sqrt(1 / phi_star**2 + 1 / v)
+        new_mu = mu + new_phi**2 * improvement
+
+        new_ratings[active] = 173.7178 * new_mu + self.default_rating
+        new_rds[active] = 173.7178 * new_phi
+        new_vols[active] = vol_out
+
+        return new_ratings, new_rds, new_vols
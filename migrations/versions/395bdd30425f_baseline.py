@@ -0,0 +1,27 @@
+"""Baseline schema
+
+Existing databases are stamped with this revision, which predates the versions directory.
+It makes no changes; later revisions upgrade from it.
+
+Revision ID: 395bdd30425f
+Revises:
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '395bdd30425f'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    pass
+
+
+def downgrade():
+    pass
@@ -0,0 +1,235 @@
+"""Rating engine, derived stats and CSV import tables
+
+Adds the columns and tables the models gained since the baseline (Glicko ratings, match
+fingerprints, upload report details, Elo checkpoints and rating history, Glicko periods,
+per-season stats and rank index, data versions, streamed upload feedback and import jobs),
+plus the wrestler and match columns some databases stamped at the baseline still lack.
+Every step is skipped when its column, table or index already exists, so a database
+created with db.create_all() can be upgraded too.
+
+After upgrading, the new tables are empty. Run "Recalculate Season Elo" (POST
+/recalculate_season_elo) for each existing season to fill Elo checkpoints, rating history,
+Glicko periods, RPI, per-season stats and the rank index, then "Update All"
+(POST /admin/update-all) to refresh dominance. Match fingerprints are backfilled per season
+the first time a match or CSV upload is added to it.
+
+Revision ID: 8d2f61c4a7b3
+Revises: 395bdd30425f
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d2f61c4a7b3'
+down_revision = '395bdd30425f'
+branch_labels = None
+depends_on = None
+
+
+def existing_columns(table_name):
+    return {column['name'] for column in sa.inspect(op.get_bind()).get_columns(table_name)}
+
+
+def existing_tables():
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def existing_indexes(table_name):
+    return {index['name'] for index in sa.inspect(op.get_bind()).get_indexes(table_name)}
+
+
+def add_missing_columns(table_name, *columns):
+    present = existing_columns(table_name)
+    for column in columns:
+        if column.name not in present:
+            op.add_column(table_name, column)
+
+
+def create_missing_index(name, table_name, columns, unique=False):
+    if name not in existing_indexes(table_name):
+        op.create_index(name, table_name, columns, unique=unique)
+
+
+def upgrade():
+    # NOT NULL columns get a server default so existing rows are valid
+    add_missing_columns(
+        'wrestler',
+        sa.Column('falls', sa.Integer(), nullable=True, server_default='0'),
+        sa.Column('tech_falls', sa.Integer(), nullable=True, server_default='0'),
+        sa.Column('major_decisions', sa.Integer(), nullable=True, server_default='0'),
+        sa.Column('season_start_elo', sa.Float(), nullable=False, server_default='1500'),
+        sa.Column('glicko_rating', sa.Float(), nullable=False, server_default='1500'),
+        sa.Column('glicko_rd', sa.Float(), nullable=False, server_default='350'),
+        sa.Column('glicko_vol', sa.Float(), nullable=False, server_default='0.06'),
+    )
+    add_missing_columns(
+        'match',
+        sa.Column('tiebreaker_1', sa.Boolean(), nullable=True),
+        sa.Column('tiebreaker_2', sa.Boolean(), nullable=True),
+        sa.Column('fingerprint', sa.String(length=40), nullable=True),
+    )
+    create_missing_index('ix_match_fingerprint', 'match', ['fingerprint'], unique=True)
+
+    add_missing_columns(
+        'csv_upload_report',
+        sa.Column('stage_timings', sa.JSON(), nullable=True),
+        sa.Column('file_hash', sa.String(length=64), nullable=True),
+        sa.Column('streamed', sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column('wrestler_ids', sa.JSON(), nullable=True),
+    )
+    create_missing_index('ix_csv_upload_report_file_hash', 'csv_upload_report', ['file_hash'])
+
+    tables = existing_tables()
+    if 'elo_checkpoint' not in tables:
+        op.create_table(
+            'elo_checkpoint',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('season_id', sa.Integer(), nullable=False),
+            sa.Column('weight_class', sa.Integer(), nullable=False),
+            sa.Column('as_of_date', sa.Date(), nullable=False),
+            sa.Column('ratings', sa.JSON(), nullable=False),
+            sa.ForeignKeyConstraint(['season_id'], ['season.id']),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('season_id', 'weight_class', 'as_of_date', name='uq_elo_checkpoint_date')
+        )
+    if 'rating_history' not in tables:
+        op.create_table(
+            'rating_history',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('season_id', sa.Integer(), nullable=False),
+            sa.Column('weight_class', sa.Integer(), nullable=False),
+            sa.Column('wrestler_id', sa.Integer(), nullable=False),
+            sa.Column('match_id', sa.Integer(), nullable=False),
+            sa.Column('match_date', sa.DateTime(), nullable=False),
+            sa.Column('elo_rating', sa.Float(), nullable=False),
+            sa.ForeignKeyConstraint(['season_id'], ['season.id']),
+            sa.ForeignKeyConstraint(['wrestler_id'], ['wrestler.id'], ondelete='CASCADE'),
+            sa.ForeignKeyConstraint(['match_id'], ['match.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('id')
+        )
+    create_missing_index('ix_rating_history_wrestler_date', 'rating_history', ['wrestler_id', 'match_date', 'match_id'])
+    create_missing_index('ix_rating_history_class_date', 'rating_history', ['season_id', 'weight_class', 'match_date'])
+    create_missing_index('ix_rating_history_match', 'rating_history', ['match_id'])
+
+    if 'glicko_period' not in tables:
+        op.create_table(
+            'glicko_period',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('season_id', sa.Integer(), nullable=False),
+            sa.Column('period_index', sa.Integer(), nullable=False),
+            sa.Column('period_start', sa.Date(), nullable=False),
+            sa.Column('match_count', sa.Integer(), nullable=False),
+            sa.Column('ratings', sa.JSON(), nullable=False),
+            sa.ForeignKeyConstraint(['season_id'], ['season.id']),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('season_id', 'period_index', name='uq_glicko_period_index')
+        )
+    if 'wrestler_season_stats' not in tables:
+        op.create_table(
+            'wrestler_season_stats',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('wrestler_id', sa.Integer(), nullable=False),
+            sa.Column('season_id', sa.Integer(), nullable=False),
+            sa.Column('wins', sa.Integer(), nullable=False),
+            sa.Column('losses', sa.Integer(), nullable=False),
+            sa.Column('match_count', sa.Integer(), nullable=False),
+            sa.Column('falls', sa.Integer(), nullable=False),
+            sa.Column('tech_falls', sa.Integer(), nullable=False),
+            sa.Column('major_decisions', sa.Integer(), nullable=False),
+            sa.Column('decisions', sa.Integer(), nullable=False),
+            sa.Column('dominance_points', sa.Integer(), nullable=False),
+            sa.Column('last_match_date', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['wrestler_id'], ['wrestler.id'], ondelete='CASCADE'),
+            sa.ForeignKeyConstraint(['season_id'], ['season.id']),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('wrestler_id', 'season_id', name='uq_wrestler_season_stats')
+        )
+    create_missing_index('ix_wrestler_season_stats_season', 'wrestler_season_stats', ['season_id'])
+
+    if 'wrestler_rank' not in tables:
+        op.create_table(
+            'wrestler_rank',
+            sa.Column('wrestler_id', sa.Integer(), nullable=False),
+            sa.Column('season_id', sa.Integer(), nullable=False),
+            sa.Column('weight_class', sa.Integer(), nullable=False),
+            sa.Column('elo_rank', sa.Integer(), nullable=False),
+            sa.Column('rpi_rank', sa.Integer(), nullable=False),
+            sa.Column('hybrid_rank', sa.Integer(), nullable=False),
+            sa.Column('dominance_rank', sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(['wrestler_id'], ['wrestler.id'], ondelete='CASCADE'),
+            sa.ForeignKeyConstraint(['season_id'], ['season.id']),
+            sa.PrimaryKeyConstraint('wrestler_id')
+        )
+    create_missing_index('ix_wrestler_rank_season_class', 'wrestler_rank', ['season_id', 'weight_class'])
+
+    if 'data_version' not in tables:
+        op.create_table(
+            'data_version',
+            sa.Column('scope', sa.String(length=32), nullable=False),
+            sa.Column('version', sa.Integer(), nullable=False),
+            sa.Column('updated_at', sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint('scope')
+        )
+    if 'csv_upload_feedback' not in tables:
+        op.create_table(
+            'csv_upload_feedback',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('report_id', sa.Integer(), nullable=False),
+            sa.Column('row_num', sa.Integer(), nullable=False),
+            sa.Column('message', sa.Text(), nullable=False),
+            sa.Column('match_id', sa.Integer(), nullable=True),
+            sa.ForeignKeyConstraint(['report_id'], ['csv_upload_report.id']),
+            sa.PrimaryKeyConstraint('id')
+        )
+    create_missing_index('ix_csv_upload_feedback_report_id', 'csv_upload_feedback', ['report_id'])
+
+    if 'import_job' not in tables:
+        op.create_table(
+            'import_job',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('user_id', sa.Integer(), nullable=True),
+            sa.Column('filename', sa.String(length=255), nullable=False),
+            sa.Column('file_path', sa.String(length=500), nullable=False),
+            sa.Column('status', sa.String(length=20), nullable=False),
+            sa.Column('stage', sa.String(length=20), nullable=True),
+            sa.Column('rows_processed', sa.Integer(), nullable=False),
+            sa.Column('row_errors', sa.Integer(), nullable=False),
+            sa.Column('message', sa.Text(), nullable=True),
+            sa.Column('message_category', sa.String(length=20), nullable=True),
+            sa.Column('report_id', sa.Integer(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=False),
+            sa.Column('started_at', sa.DateTime(), nullable=True),
+            sa.Column('finished_at', sa.DateTime(), nullable=True),
+            sa.Column('heartbeat_at', sa.DateTime(), nullable=True),
+            sa.Column('dry_run', sa.Boolean(), nullable=False),
+            sa.Column('preview', sa.Text(), nullable=True),
+            sa.ForeignKeyConstraint(['user_id'], ['user.id']),
+            sa.ForeignKeyConstraint(['report_id'], ['csv_upload_report.id']),
+            sa.PrimaryKeyConstraint('id')
+        )
+    else:
+        add_missing_columns(
+            'import_job',
+            sa.Column('heartbeat_at', sa.DateTime(), nullable=True),
+            sa.Column('dry_run', sa.Boolean(), nullable=False, server_default=sa.false()),
+            sa.Column('preview', sa.Text(), nullable=True),
+        )
+
+
+def downgrade():
+    for table_name in ('import_job', 'csv_upload_feedback', 'data_version', 'wrestler_rank', 'wrestler_season_stats',
+                       'glicko_period', 'rating_history', 'elo_checkpoint'):
+        op.drop_table(table_name)
+    op.drop_index('ix_csv_upload_report_file_hash', table_name='csv_upload_report')
+    op.drop_index('ix_match_fingerprint', table_name='match')
+    with op.batch_alter_table('csv_upload_report') as batch_op:
+        for column_name in ('wrestler_ids', 'streamed', 'file_hash', 'stage_timings'):
+            batch_op.drop_column(column_name)
+    with op.batch_alter_table('match') as batch_op:
+        batch_op.drop_column('fingerprint')
+    with op.batch_alter_table('wrestler') as batch_op:
+        for column_name in ('glicko_vol', 'glicko_rd', 'glicko_rating'):
+            batch_op.drop_column(column_name)
@@ -1,37 +1,44 @@
 from glicko2 import Glicko2
 from wrestler_data import WrestlingDatabase
-from typing import Dict, List, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime
+import numpy as np
 
 def weekly_update(db: WrestlingDatabase, glicko: Glicko2, start_date: datetime, end_date: datetime):
     weekly_matches = [m for m in db.matches if start_date <= m.date < end_date]
 
-    wrestler_matches: Dict[str, List[Tuple[str, int]]] = {}
+    # Index every wrestler once so the whole rating period runs as a single batch
+    wrestler_ids = list(db.wrestlers)
+    index = {wrestler_id: i for i, wrestler_id in enumerate(wrestler_ids)}
+    ratings = np.array([db.wrestlers[w].rating for w in wrestler_ids], dtype=np.float64)
+    rds = np.array([db.wrestlers[w].rd for w in wrestler_ids], dtype=np.float64)
+    vols = np.array([db.wrestlers[w].vol for w in wrestler_ids], dtype=np.float64)
+
+    # One outcome per wrestler per match, against the opponent's pre-period rating
+    player_idx = []
+    opp_idx = []
+    scores = []
     for match in weekly_matches:
-        winner_id = match.winner_id
-        loser_id = match.wrestler1_id if winner_id == match.wrestler2_id else match.wrestler2_id
-        
-        if winner_id not in wrestler_matches:
-            wrestler_matches[winner_id] = []
-        if loser_id not in wrestler_matches:
-            wrestler_matches[loser_id] = []
-        
-        wrestler_matches[winner_id].append((loser_id, 1))  # 1 for win
-        wrestler_matches[loser_id].append((winner_id, 0))  # 0 for loss
-
-    for wrestler_id, matches in wrestler_matches.items():
+        winner = index[match.winner_id]
+        loser = index[match.wrestler1_id if match.winner_id == match.wrestler2_id else match.wrestler2_id]
+
+        player_idx += [winner, loser]
+        opp_idx += [loser, winner]
+        scores += [1, 0]  # 1 for win, 0 for loss
+
+    opp_idx = np.array(opp_idx, dtype=np.int64)
+    new_ratings, new_rds, new_vols = glicko.update_ratings(
+        ratings, rds, vols, player_idx, ratings[opp_idx], rds[opp_idx], scores
+    )
+
+    for i, wrestler_id in enumerate(wrestler_ids):
         wrestler = db.wrestlers[wrestler_id]
-        outcomes = [(db.wrestlers[opp_id].rating, db.wrestlers[opp_id].rd, result) for opp_id, result in matches]
-        
-        new_rating, new_rd, new_vol = glicko.update_rating(wrestler.rating, wrestler.rd, wrestler.vol, outcomes)
-        
-        wrestler.rating = new_rating
-        wrestler.rd = new_rd
-        wrestler.vol = new_vol
+        wrestler.rating = float(new_ratings[i])
+        wrestler.rd = float(new_rds[i])
+        wrestler.vol = float(new_vols[i])
 
     rankings = {}
     for weight_class in set(w.weight_class for w in db.wrestlers.values()):
         wrestlers = db.get_wrestlers_by_weight_class(weight_class)
         rankings[weight_class] = sorted(wrestlers, key=lambda w: w.rating, reverse=True)
 
-    return rankings
\ No newline at end of file
+    return rankings